@@ -2,8 +2,15 @@
 KBO 스카우팅 리포트 데모 - Streamlit 앱
 """
 
+import time
+
 import streamlit as st
 
+from utils.snapshot import pin_snapshot
+from utils.startup import IMPORT, RENDER, get_startup_report, record_timing, timed
+
+_script_start = time.perf_counter()
+
 st.set_page_config(
     page_title="KBO 스카우팅 리포트",
     page_icon="⚾",
@@ -11,11 +18,35 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 메인 페이지
+# 메인 페이지 (제목은 데이터 모듈 import 전에 먼저 표시)
 st.title("⚾ KBO 스카우팅 리포트 데모")
 
-st.markdown("""
-### 2021-2025 KBO 정규시즌 선수 분석 시스템
+with timed(IMPORT, 'utils.data_loader'):
+    from utils.data_loader import get_dataset_summary, warm_up
+    from utils.registry import get_memory_report
+
+# 테이블 로드와 데이터 파일 감시는 백그라운드에서 (프로세스당 1회)
+warm_up()
+snapshot = pin_snapshot()
+
+# 행 수/시즌 범위는 parquet 메타데이터만으로
+try:
+    summary = get_dataset_summary()
+    seasons = [
+        table[key] for table in (summary['batter_kpi'], summary['pitcher_kpi'])
+        for key in ('season_min', 'season_max') if table[key] is not None
+    ]
+    season_min, season_max = (min(seasons), max(seasons)) if seasons else (None, None)
+except Exception as e:
+    summary = None
+    season_min = season_max = None
+    st.error(f"데이터 로드 실패: {e}")
+
+season_range = f"{season_min}-{season_max}" if season_min is not None else "-"
+season_period = f"{season_min}년 ~ {season_max}년 정규시즌 데이터" if season_min is not None else "데이터 없음"
+
+st.markdown(f"""
+### {season_range} KBO 정규시즌 선수 분석 시스템
 
 이 앱은 KBO 리그 선수들의 상세한 스카우팅 리포트를 제공합니다.
 
@@ -23,9 +54,10 @@ st.markdown("""
 
 - **타자 스카우팅 리포트**: 컨택, 파워, 선구안, 일관성, 클러치 등 7개 카테고리 분석
 - **투수 스카우팅 리포트**: 제구력, 공격성, 효율성, 구위, 클러치 등 5개 카테고리 분석
+- **선수 비교**: 최대 8명의 카테고리 레이더 차트와 주요 지표를 나란히 비교
 
 #### 데이터 기간
-- 2021년 ~ 2025년 정규시즌 데이터
+- {season_period}
 
 #### 사용 방법
 1. 왼쪽 사이드바에서 원하는 리포트 유형을 선택하세요
@@ -36,20 +68,28 @@ st.markdown("""
 *이 앱은 데모 목적으로 제작되었습니다.*
 """)
 
-# 데이터 로드 상태 확인
-from utils.data_loader import load_batter_kpi, load_pitcher_kpi
-
-try:
-    batter_df = load_batter_kpi()
-    pitcher_df = load_pitcher_kpi()
-
+# 데이터 상태
+if summary is not None:
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("타자 데이터", f"{len(batter_df):,} rows")
+        st.metric("타자 데이터", f"{summary['batter_kpi']['rows']:,} rows")
     with col2:
-        st.metric("투수 데이터", f"{len(pitcher_df):,} rows")
+        st.metric("투수 데이터", f"{summary['pitcher_kpi']['rows']:,} rows")
     with col3:
-        st.metric("시즌 범위", "2021-2025")
+        st.metric("시즌 범위", season_range)
+    st.caption(
+        f"데이터 버전 {snapshot.version} · {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(snapshot.loaded_at))} 로드"
+        " · data/*.parquet가 바뀌면 자동으로 다시 로드"
+    )
 
-except Exception as e:
-    st.error(f"데이터 로드 실패: {e}")
+record_timing(RENDER, 'app.py', time.perf_counter() - _script_start)
+
+# 시작 리포트 (import / 캐시 예열 / 첫 렌더링 소요 시간)
+with st.expander("⏱️ 시작 리포트"):
+    st.dataframe(get_startup_report(), hide_index=True, width="stretch")
+    st.caption("처음 한 번만 기록 · 예열이 끝나지 않은 테이블은 표시되지 않음")
+
+# 메모리 리포트 (로드 시 정규화로 줄어든 메모리, 현재 데이터 버전 기준)
+with st.expander("🧮 메모리 리포트"):
+    st.dataframe(get_memory_report(), hide_index=True, width="stretch")
+    st.caption(f"데이터 버전 {snapshot.version} · 지금까지 로드된 컬럼 그룹만 표시")
@@ -6,18 +6,36 @@ Parquet 데이터를 모바일 앱용 JSON 단일 파일로 변환
 Usage:
     python export_all_data_to_json.py
     python export_all_data_to_json.py --compress  # gzip 압축
+    python export_all_data_to_json.py --incremental  # 변경된 시즌만 재빌드
+    python export_all_data_to_json.py --sharded  # manifest + 샤드 (lazy loading용)
+    python export_all_data_to_json.py --compact  # 스키마 기반 압축 포맷 (utils/compact_format.py로 복원)
+    python export_all_data_to_json.py --workers 8  # 시즌/섹션 단위 병렬 빌드
+    python export_all_data_to_json.py --profile --profile-json export/profile.json  # 단계별 시간/메모리
 """
 
+import numpy as np
 import pandas as pd
 import json
 import gzip
 from pathlib import Path
 from datetime import datetime
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import repeat
+
+from utils.compact_format import encode_compact
+from utils.export_cache import FragmentCache
+from utils.export_profile import StageProfiler
+from utils.export_shards import write_sharded
+from utils.export_stream import DEFAULT, MINIFIED, PRETTY, JSONStreamWriter
+from utils.schema import format_report, normalize_kpi
 
 # 경로 설정
 DATA_DIR = Path(__file__).parent / "data"
 OUTPUT_DIR = Path(__file__).parent / "export"
+SHARD_DIR_NAME = "shards"
+COMPACT_FILE_NAME = "kbo_scouting_data.compact.json"
 
 # 팀 정보
 TEAMS = {
@@ -34,6 +52,89 @@ TEAMS = {
 }
 
 
+# 타자 메트릭 정의 (key, 이름, 가중치)
+BATTER_METRIC_DEFINITIONS = {
+    'contact': [
+        ('batting_average', '타율', 0.45),
+        ('strikeout_rate', '삼진율', 0.25),
+        ('overall_contact_rate', '전체 컨택률', 0.08),
+        ('in_zone_contact_rate', '존 내 컨택률', 0.07),
+        ('chase_contact_rate', '체이스 컨택률', 0.05),
+        ('two_strike_contact_rate', '2S 컨택률', 0.05),
+        ('swing_miss_rate', '스윙 앤 미스율', 0.05),
+    ],
+    'game_power': [
+        ('home_run_rate', '홈런율', 0.35),
+        ('home_run_to_xbh_ratio', '홈런/장타 비율', 0.25),
+        ('isolated_power_hr', '홈런 ISO', 0.20),
+        ('home_run_per_hit_rate', '홈런/안타 비율', 0.20),
+    ],
+    'gap_power': [
+        ('double_rate', '2루타율', 0.30),
+        ('triple_rate', '3루타율', 0.15),
+        ('isolated_power_gap', '갭 ISO', 0.25),
+        ('gap_hit_rate', '갭 히트율', 0.15),
+        ('double_to_single_ratio', '2루타/단타 비율', 0.15),
+    ],
+    'discipline': [
+        ('walk_rate', '볼넷율', 0.35),
+        ('chase_rate', '체이스율', 0.25),
+        ('first_pitch_selectivity', '초구 선택력', 0.15),
+        ('two_strike_approach', '2S 접근', 0.15),
+        ('called_strike_rate', '루킹 스트라이크율', 0.10),
+    ],
+    'consistency': [
+        ('monthly_variance', '월별 편차', 0.35),
+        ('platoon_split_stability', '좌우 안정성', 0.25),
+        ('count_balance', '카운트 균형', 0.20),
+        ('inning_evenness', '이닝별 균일성', 0.20),
+    ],
+    'clutch': [
+        ('high_leverage_performance', '높은 중요도 성과', 0.35),
+        ('risp_woba', '득점권 wOBA', 0.30),
+        ('close_game_performance', '접전 성적', 0.20),
+        ('two_out_performance', '2아웃 성적', 0.15),
+    ],
+}
+
+# 투수 메트릭 정의 (key, 이름, 가중치)
+PITCHER_METRIC_DEFINITIONS = {
+    'control': [
+        ('first_pitch_strike_rate', '초구 스트라이크율', 0.25),
+        ('three_ball_recovery_rate', '3볼 회복률', 0.20),
+        ('walk_avoidance_rate', '볼넷 회피율', 0.20),
+        ('main_pitch_control_rate', '주구종 제구율', 0.20),
+        ('favorable_count_entry_rate', '유리한 카운트 진입률', 0.15),
+    ],
+    'aggression': [
+        ('early_strike_rate', '조기 스트라이크 유도율', 0.30),
+        ('finishing_ability_rate', '마무리 능력', 0.30),
+        ('two_strike_strikeout_rate', '2스트라이크 삼진율', 0.25),
+        ('high_velocity_decision_rate', '고속구 결정력', 0.15),
+    ],
+    'efficiency': [
+        ('avg_pitches_per_batter', '타자당 평균 투구수', 0.25),
+        ('quick_resolution_rate', '빠른 해결율', 0.25),
+        ('first_batter_out_rate', '첫 타자 아웃률', 0.20),
+        ('five_pitch_out_rate', '5구 이내 아웃률', 0.15),
+        ('efficient_inning_rate', '효율적 이닝 비율', 0.15),
+    ],
+    'stuff': [
+        ('whiff_rate', '헛스윙 유도율', 0.30),
+        ('chase_rate', '체이스율', 0.20),
+        ('in_zone_whiff_rate', '존내 헛스윙률', 0.20),
+        ('unhittable_pitch_rate', '언히터블 피치율', 0.15),
+        ('avg_fastball_velocity', '평균 구속', 0.15),
+    ],
+    'clutch': [
+        ('risp_out_rate', '득점권 아웃률', 0.30),
+        ('two_out_inning_end_rate', '2아웃 이닝 종료율', 0.25),
+        ('bases_loaded_escape_rate', '만루 탈출률', 0.25),
+        ('three_up_three_down_rate', '삼자범퇴 비율', 0.20),
+    ],
+}
+
+
 def load_parquet_data():
     """Parquet 데이터 로드"""
     print("Loading Parquet files...")
@@ -47,363 +148,409 @@ def load_parquet_data():
     print(f"  Pitchers: {len(pitcher_kpi)} records")
     print(f"  Players: {len(players)} records")
 
+    # 타입 정규화 (실수 정밀도는 JSON 출력과 맞추기 위해 float64 유지)
+    batter_kpi, batter_report = normalize_kpi(batter_kpi, float_dtype='float64')
+    pitcher_kpi, pitcher_report = normalize_kpi(pitcher_kpi, float_dtype='float64')
+    print(f"  {format_report('batter_kpi', batter_report)}")
+    print(f"  {format_report('pitcher_kpi', pitcher_report)}")
+
     return batter_kpi, pitcher_kpi, players, teams
 
 
+def build_latest_index_frame(kpi: pd.DataFrame, players: pd.DataFrame, pcode_col: str) -> pd.DataFrame:
+    """선수별 최신 시즌 행 + 출전 시즌 목록 + 투타 정보 (pcode 순 정렬)"""
+    # 최신 시즌 행 (같은 시즌이 여러 행이면 원래 순서상 첫 행)
+    latest = kpi.sort_values('season', ascending=False, kind='stable').drop_duplicates(pcode_col)
+    latest = latest.set_index(pcode_col).sort_index()
+
+    # 선수별 시즌 목록 (오름차순)
+    latest['seasons'] = kpi.sort_values('season').groupby(pcode_col)['season'].agg(list)
+
+    # 선수 정보(투타) 조인
+    hands = players.drop_duplicates('pcode').set_index('pcode').reindex(latest.index)
+    phand = hands['phand'].astype(object)
+    stand = hands['stand'].astype(object)
+    latest['hand'] = (phand + "투" + stand + "타").where(phand.notna() & stand.notna(), "")
+
+    return latest
+
+
+def column_or_default(df: pd.DataFrame, col_name: str, default) -> list:
+    """컬럼 값 목록 (컬럼이 없으면 기본값으로 채움, 결측은 None)"""
+    if col_name not in df.columns:
+        return [default] * len(df)
+    values = df[col_name].astype(object)
+    # pandas 3 문자열 dtype의 결측은 NaN으로 나오므로 JSON null로
+    return values.where(values.notna(), None).tolist()
+
+
 def build_batter_index(batter_kpi: pd.DataFrame, players: pd.DataFrame) -> dict:
     """타자 인덱스 생성"""
-    index = {}
-
-    # 선수별 시즌 그룹화
-    batter_seasons = batter_kpi.groupby('batter_pcode')['season'].apply(list).to_dict()
-
-    for pcode, seasons in batter_seasons.items():
-        # 최신 시즌 데이터 가져오기
-        latest = batter_kpi[
-            (batter_kpi['batter_pcode'] == pcode) &
-            (batter_kpi['season'] == max(seasons))
-        ].iloc[0]
-
-        # 선수 정보 조회
-        player_info = players[players['pcode'] == pcode]
-        hand_info = ""
-        if not player_info.empty:
-            p = player_info.iloc[0]
-            phand = p.get('phand', '')
-            stand = p.get('stand', '')
-            if pd.notna(phand) and pd.notna(stand):
-                hand_info = f"{phand}투{stand}타"
-
-        index[pcode] = {
-            "name": latest.get('player_name', 'Unknown'),
-            "team": latest.get('team_name', 'Unknown'),
-            "position": latest.get('primary_position_name', 'Unknown'),
-            "hand": hand_info,
-            "seasons": sorted(seasons)
+    latest = build_latest_index_frame(batter_kpi, players, 'batter_pcode')
+
+    return {
+        pcode: {
+            "name": name,
+            "team": team,
+            "position": position,
+            "hand": hand,
+            "seasons": seasons
         }
-
-    return index
+        for pcode, name, team, position, hand, seasons in zip(
+            latest.index,
+            column_or_default(latest, 'player_name', 'Unknown'),
+            column_or_default(latest, 'team_name', 'Unknown'),
+            column_or_default(latest, 'primary_position_name', 'Unknown'),
+            latest['hand'].tolist(),
+            latest['seasons'].tolist(),
+        )
+    }
 
 
 def build_pitcher_index(pitcher_kpi: pd.DataFrame, players: pd.DataFrame) -> dict:
     """투수 인덱스 생성"""
-    index = {}
-
-    # 선수별 시즌 그룹화
-    pitcher_seasons = pitcher_kpi.groupby('pitcher_pcode')['season'].apply(list).to_dict()
-
-    for pcode, seasons in pitcher_seasons.items():
-        # 최신 시즌 데이터 가져오기
-        latest = pitcher_kpi[
-            (pitcher_kpi['pitcher_pcode'] == pcode) &
-            (pitcher_kpi['season'] == max(seasons))
-        ].iloc[0]
-
-        # 선수 정보 조회
-        player_info = players[players['pcode'] == pcode]
-        hand_info = ""
-        if not player_info.empty:
-            p = player_info.iloc[0]
-            phand = p.get('phand', '')
-            stand = p.get('stand', '')
-            if pd.notna(phand) and pd.notna(stand):
-                hand_info = f"{phand}투{stand}타"
-
-        index[pcode] = {
-            "name": latest.get('player_name', 'Unknown'),
-            "team": latest.get('team_name', 'Unknown'),
+    latest = build_latest_index_frame(pitcher_kpi, players, 'pitcher_pcode')
+
+    return {
+        pcode: {
+            "name": name,
+            "team": team,
             "position": "투수",
-            "hand": hand_info,
-            "role": latest.get('pitcher_role', 'Unknown'),
-            "seasons": sorted(seasons)
+            "hand": hand,
+            "role": role,
+            "seasons": seasons
         }
+        for pcode, name, team, hand, role, seasons in zip(
+            latest.index,
+            column_or_default(latest, 'player_name', 'Unknown'),
+            column_or_default(latest, 'team_name', 'Unknown'),
+            latest['hand'].tolist(),
+            column_or_default(latest, 'pitcher_role', 'Unknown'),
+            latest['seasons'].tolist(),
+        )
+    }
 
-    return index
 
+def int_column(df: pd.DataFrame, col_name: str) -> list:
+    """컬럼 전체를 safe_int 규칙으로 변환 (없는 컬럼/결측은 None)"""
+    if col_name not in df.columns:
+        return [None] * len(df)
+    values = pd.to_numeric(df[col_name], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    missing = np.isnan(values)
+    result = np.trunc(np.where(missing, 0, values)).astype(np.int64).astype(object)
+    result[missing] = None
+    return result.tolist()
 
-def build_batter_kpi_data(batter_kpi: pd.DataFrame) -> dict:
-    """타자 KPI 데이터 구성"""
-    kpi_data = {}
-
-    # 타자 메트릭 정의
-    metric_definitions = {
-        'contact': [
-            ('batting_average', '타율', 0.45),
-            ('strikeout_rate', '삼진율', 0.25),
-            ('overall_contact_rate', '전체 컨택률', 0.08),
-            ('in_zone_contact_rate', '존 내 컨택률', 0.07),
-            ('chase_contact_rate', '체이스 컨택률', 0.05),
-            ('two_strike_contact_rate', '2S 컨택률', 0.05),
-            ('swing_miss_rate', '스윙 앤 미스율', 0.05),
-        ],
-        'game_power': [
-            ('home_run_rate', '홈런율', 0.35),
-            ('home_run_to_xbh_ratio', '홈런/장타 비율', 0.25),
-            ('isolated_power_hr', '홈런 ISO', 0.20),
-            ('home_run_per_hit_rate', '홈런/안타 비율', 0.20),
-        ],
-        'gap_power': [
-            ('double_rate', '2루타율', 0.30),
-            ('triple_rate', '3루타율', 0.15),
-            ('isolated_power_gap', '갭 ISO', 0.25),
-            ('gap_hit_rate', '갭 히트율', 0.15),
-            ('double_to_single_ratio', '2루타/단타 비율', 0.15),
-        ],
-        'discipline': [
-            ('walk_rate', '볼넷율', 0.35),
-            ('chase_rate', '체이스율', 0.25),
-            ('first_pitch_selectivity', '초구 선택력', 0.15),
-            ('two_strike_approach', '2S 접근', 0.15),
-            ('called_strike_rate', '루킹 스트라이크율', 0.10),
-        ],
-        'consistency': [
-            ('monthly_variance', '월별 편차', 0.35),
-            ('platoon_split_stability', '좌우 안정성', 0.25),
-            ('count_balance', '카운트 균형', 0.20),
-            ('inning_evenness', '이닝별 균일성', 0.20),
-        ],
-        'clutch': [
-            ('high_leverage_performance', '높은 중요도 성과', 0.35),
-            ('risp_woba', '득점권 wOBA', 0.30),
-            ('close_game_performance', '접전 성적', 0.20),
-            ('two_out_performance', '2아웃 성적', 0.15),
-        ],
-    }
 
-    for season in batter_kpi['season'].unique():
-        season_str = str(int(season))
-        kpi_data[season_str] = {}
-
-        season_df = batter_kpi[batter_kpi['season'] == season]
-
-        for _, row in season_df.iterrows():
-            pcode = row['batter_pcode']
-
-            # 기본 정보
-            player_data = {
-                "overall_grade": safe_int(row.get('overall_grade')),
-                "overall_grade_weighted": safe_int(row.get('overall_grade_weighted')),
-                "category_scores": {
-                    "contact": safe_int(row.get('contact_grade_weighted', row.get('contact_grade'))),
-                    "game_power": safe_int(row.get('game_power_grade_weighted', row.get('game_power_grade'))),
-                    "gap_power": safe_int(row.get('gap_power_grade_weighted', row.get('gap_power_grade'))),
-                    "discipline": safe_int(row.get('discipline_grade_weighted', row.get('discipline_grade'))),
-                    "consistency": safe_int(row.get('consistency_grade_weighted', row.get('consistency_grade'))),
-                    "clutch": safe_int(row.get('clutch_grade_weighted', row.get('clutch_grade'))),
-                },
-                "traditional_stats": {
-                    "batting_average": safe_float(row.get('batting_average'), 3),
-                    "on_base_percentage": safe_float(row.get('on_base_percentage'), 3),
-                    "slugging_percentage": safe_float(row.get('slugging_percentage'), 3),
-                    "ops": safe_float(row.get('ops'), 3),
-                    "home_runs": safe_int(row.get('home_runs')),
-                    "rbis": safe_int(row.get('rbi')),
-                    "plate_appearances": safe_int(row.get('plate_appearances')),
-                },
-                "metrics": {}
+def float_column(df: pd.DataFrame, col_name: str, decimals: int = 3) -> list:
+    """컬럼 전체를 safe_float 규칙으로 변환 (없는 컬럼/결측은 None)"""
+    if col_name not in df.columns:
+        return [None] * len(df)
+    values = pd.to_numeric(df[col_name], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    # 파이썬 round와 결과가 같아야 JSON 출력이 동일하므로 np.round 대신 사용
+    result = np.array(list(map(round, values.tolist(), repeat(decimals))), dtype=object)
+    result[np.isnan(values)] = None
+    return result.tolist()
+
+
+def weighted_or_base(df: pd.DataFrame, weighted_col: str, base_col: str) -> str:
+    """가중 등급 컬럼이 있으면 가중 등급, 없으면 기본 등급 컬럼"""
+    return weighted_col if weighted_col in df.columns else base_col
+
+
+def build_metric_columns(df: pd.DataFrame, metric_definitions: dict) -> dict:
+    """카테고리별 메트릭 (key, name, weight, 값 목록, 등급 목록, 존재 여부) 미리 계산"""
+    columns = {}
+    for category, metrics in metric_definitions.items():
+        columns[category] = []
+        for key, name, weight in metrics:
+            if key not in df.columns:
+                continue
+            columns[category].append((
+                key, name, weight,
+                float_column(df, key, 3),
+                int_column(df, f'{key}_grade'),
+                df[key].notna().to_numpy(),
+            ))
+    return columns
+
+
+def build_player_metrics(metric_columns: dict, i: int) -> dict:
+    """한 선수의 카테고리별 메트릭 목록 조립"""
+    return {
+        category: [
+            {
+                "key": key,
+                "name": name,
+                "value": values[i],
+                "grade": grades[i],
+                "weight": weight
             }
+            for key, name, weight, values, grades, present in metrics
+            if present[i]
+        ]
+        for category, metrics in metric_columns.items()
+    }
 
-            # 카테고리별 메트릭
-            for category, metrics in metric_definitions.items():
-                player_data["metrics"][category] = []
-                for key, name, weight in metrics:
-                    value = row.get(key)
-                    grade = row.get(f'{key}_grade')
 
-                    if pd.notna(value):
-                        player_data["metrics"][category].append({
-                            "key": key,
-                            "name": name,
-                            "value": safe_float(value, 3),
-                            "grade": safe_int(grade),
-                            "weight": weight
-                        })
+def build_player_section(df: pd.DataFrame, pcode_col: str, build_player) -> dict:
+    """{pcode: 선수 데이터} 구성 (build_player(i)는 i번째 행의 dict 반환)"""
+    return {pcode: build_player(i) for i, pcode in enumerate(df[pcode_col].tolist())}
 
-            kpi_data[season_str][pcode] = player_data
 
-    return kpi_data
+def iter_cached_units(section: str, units, build, cache: FragmentCache = None, extra: str = "", executor=None):
+    """
+    (season, frames) 단위 조각을 season 순서대로 생성
 
+    executor(ProcessPoolExecutor)가 있으면 캐시에 없는 단위를 호출 즉시 모두 제출하고,
+    결과는 입력 순서대로 모으므로 직렬 실행과 출력이 동일
+    """
+    cache = cache or FragmentCache()
+    # 입력 해시는 단위마다 한 번만 계산 (선별과 조회에 같은 키 사용)
+    keyed = [(season_str, frames, cache.key(section, season_str, frames, extra)) for season_str, frames in units]
+    pending = {}
+    if executor is not None:
+        for season_str, frames, key in keyed:
+            if not cache.has(key):
+                pending[season_str] = executor.submit(build, *frames)
 
-def build_pitcher_kpi_data(pitcher_kpi: pd.DataFrame) -> dict:
-    """투수 KPI 데이터 구성"""
-    kpi_data = {}
-
-    # 투수 메트릭 정의
-    metric_definitions = {
-        'control': [
-            ('first_pitch_strike_rate', '초구 스트라이크율', 0.25),
-            ('three_ball_recovery_rate', '3볼 회복률', 0.20),
-            ('walk_avoidance_rate', '볼넷 회피율', 0.20),
-            ('main_pitch_control_rate', '주구종 제구율', 0.20),
-            ('favorable_count_entry_rate', '유리한 카운트 진입률', 0.15),
-        ],
-        'aggression': [
-            ('early_strike_rate', '조기 스트라이크 유도율', 0.30),
-            ('finishing_ability_rate', '마무리 능력', 0.30),
-            ('two_strike_strikeout_rate', '2스트라이크 삼진율', 0.25),
-            ('high_velocity_decision_rate', '고속구 결정력', 0.15),
-        ],
-        'efficiency': [
-            ('avg_pitches_per_batter', '타자당 평균 투구수', 0.25),
-            ('quick_resolution_rate', '빠른 해결율', 0.25),
-            ('first_batter_out_rate', '첫 타자 아웃률', 0.20),
-            ('five_pitch_out_rate', '5구 이내 아웃률', 0.15),
-            ('efficient_inning_rate', '효율적 이닝 비율', 0.15),
-        ],
-        'stuff': [
-            ('whiff_rate', '헛스윙 유도율', 0.30),
-            ('chase_rate', '체이스율', 0.20),
-            ('in_zone_whiff_rate', '존내 헛스윙률', 0.20),
-            ('unhittable_pitch_rate', '언히터블 피치율', 0.15),
-            ('avg_fastball_velocity', '평균 구속', 0.15),
-        ],
-        'clutch': [
-            ('risp_out_rate', '득점권 아웃률', 0.30),
-            ('two_out_inning_end_rate', '2아웃 이닝 종료율', 0.25),
-            ('bases_loaded_escape_rate', '만루 탈출률', 0.25),
-            ('three_up_three_down_rate', '삼자범퇴 비율', 0.20),
-        ],
+    def collect():
+        for season_str, frames, key in keyed:
+            future = pending.pop(season_str, None)
+            make = future.result if future is not None else (lambda: build(*frames))
+            yield season_str, cache.fetch(key, make)
+
+    return collect()
+
+
+def iter_season_sections(kpi: pd.DataFrame, section: str, build_season, cache: FragmentCache = None, extra: str = "",
+                         executor=None):
+    """시즌별 조각을 (season, 조각) 순서로 생성 (캐시 사용 시 입력 행이 바뀐 시즌만 새로 빌드)"""
+    units = [
+        (str(int(season)), [kpi[kpi['season'] == season]])
+        for season in kpi['season'].unique()
+    ]
+    return iter_cached_units(section, units, build_season, cache, extra, executor)
+
+
+def build_season_sections(kpi: pd.DataFrame, section: str, build_season, cache: FragmentCache = None, extra: str = "") -> dict:
+    """시즌별 조각 구성"""
+    return dict(iter_season_sections(kpi, section, build_season, cache, extra))
+
+
+def build_batter_kpi_season(season_df: pd.DataFrame) -> dict:
+    """한 시즌의 타자 KPI 데이터 구성"""
+    df = season_df.reset_index(drop=True)
+
+    # 컬럼 단위로 반올림/결측 처리
+    overall = int_column(df, 'overall_grade')
+    overall_weighted = int_column(df, 'overall_grade_weighted')
+    category_scores = {
+        category: int_column(df, weighted_or_base(df, f'{category}_grade_weighted', f'{category}_grade'))
+        for category in ['contact', 'game_power', 'gap_power', 'discipline', 'consistency', 'clutch']
+    }
+    traditional_stats = {
+        "batting_average": float_column(df, 'batting_average', 3),
+        "on_base_percentage": float_column(df, 'on_base_percentage', 3),
+        "slugging_percentage": float_column(df, 'slugging_percentage', 3),
+        "ops": float_column(df, 'ops', 3),
+        "home_runs": int_column(df, 'home_runs'),
+        "rbis": int_column(df, 'rbi'),
+        "plate_appearances": int_column(df, 'plate_appearances'),
     }
+    metric_columns = build_metric_columns(df, BATTER_METRIC_DEFINITIONS)
+
+    def build_player(i):
+        return {
+            "overall_grade": overall[i],
+            "overall_grade_weighted": overall_weighted[i],
+            "category_scores": {name: values[i] for name, values in category_scores.items()},
+            "traditional_stats": {name: values[i] for name, values in traditional_stats.items()},
+            "metrics": build_player_metrics(metric_columns, i)
+        }
+
+    return build_player_section(df, 'batter_pcode', build_player)
+
+
+def iter_batter_kpi_data(batter_kpi: pd.DataFrame, cache: FragmentCache = None, executor=None):
+    """타자 KPI 시즌 조각 생성"""
+    return iter_season_sections(
+        batter_kpi, 'batters.kpi', build_batter_kpi_season, cache,
+        extra=repr(BATTER_METRIC_DEFINITIONS), executor=executor
+    )
 
-    for season in pitcher_kpi['season'].unique():
-        season_str = str(int(season))
-        kpi_data[season_str] = {}
-
-        season_df = pitcher_kpi[pitcher_kpi['season'] == season]
-
-        for _, row in season_df.iterrows():
-            pcode = row['pitcher_pcode']
-
-            # 기본 정보
-            player_data = {
-                "overall_grade": safe_int(row.get('overall_grade')),
-                "pitcher_role": row.get('pitcher_role', 'Unknown'),
-                "category_scores": {
-                    "control": safe_int(row.get('control_grade')),
-                    "aggression": safe_int(row.get('aggression_grade')),
-                    "efficiency": safe_int(row.get('efficiency_grade')),
-                    "stuff": safe_int(row.get('stuff_grade')),
-                    "clutch": safe_int(row.get('clutch_grade')),
-                },
-                "traditional_stats": {
-                    "total_games": safe_int(row.get('total_games')),
-                    "total_pitches": safe_int(row.get('total_pitches')),
-                    "total_innings_pitched": safe_float(row.get('total_innings_pitched'), 1),
-                },
-                "metrics": {}
-            }
 
-            # 카테고리별 메트릭
-            for category, metrics in metric_definitions.items():
-                player_data["metrics"][category] = []
-                for key, name, weight in metrics:
-                    value = row.get(key)
-                    grade = row.get(f'{key}_grade')
+def build_batter_kpi_data(batter_kpi: pd.DataFrame, cache: FragmentCache = None) -> dict:
+    """타자 KPI 데이터 구성"""
+    return dict(iter_batter_kpi_data(batter_kpi, cache))
+
+
+def build_pitcher_kpi_season(season_df: pd.DataFrame) -> dict:
+    """한 시즌의 투수 KPI 데이터 구성"""
+    df = season_df.reset_index(drop=True)
+
+    # 컬럼 단위로 반올림/결측 처리
+    overall = int_column(df, 'overall_grade')
+    roles = column_or_default(df, 'pitcher_role', 'Unknown')
+    category_scores = {
+        category: int_column(df, f'{category}_grade')
+        for category in ['control', 'aggression', 'efficiency', 'stuff', 'clutch']
+    }
+    traditional_stats = {
+        "total_games": int_column(df, 'total_games'),
+        "total_pitches": int_column(df, 'total_pitches'),
+        "total_innings_pitched": float_column(df, 'total_innings_pitched', 1),
+    }
+    metric_columns = build_metric_columns(df, PITCHER_METRIC_DEFINITIONS)
+
+    def build_player(i):
+        return {
+            "overall_grade": overall[i],
+            "pitcher_role": roles[i],
+            "category_scores": {name: values[i] for name, values in category_scores.items()},
+            "traditional_stats": {name: values[i] for name, values in traditional_stats.items()},
+            "metrics": build_player_metrics(metric_columns, i)
+        }
 
-                    if pd.notna(value):
-                        player_data["metrics"][category].append({
-                            "key": key,
-                            "name": name,
-                            "value": safe_float(value, 3),
-                            "grade": safe_int(grade),
-                            "weight": weight
-                        })
+    return build_player_section(df, 'pitcher_pcode', build_player)
 
-            kpi_data[season_str][pcode] = player_data
 
-    return kpi_data
+def iter_pitcher_kpi_data(pitcher_kpi: pd.DataFrame, cache: FragmentCache = None, executor=None):
+    """투수 KPI 시즌 조각 생성"""
+    return iter_season_sections(
+        pitcher_kpi, 'pitchers.kpi', build_pitcher_kpi_season, cache,
+        extra=repr(PITCHER_METRIC_DEFINITIONS), executor=executor
+    )
+
+
+def build_pitcher_kpi_data(pitcher_kpi: pd.DataFrame, cache: FragmentCache = None) -> dict:
+    """투수 KPI 데이터 구성"""
+    return dict(iter_pitcher_kpi_data(pitcher_kpi, cache))
+
+
+def _numeric_col(df, col_name):
+    """숫자 컬럼 (정규화에서 숫자로 바뀌지 않은 컬럼이면 숫자가 아닌 값을 NaN으로)"""
+    values = df[col_name]
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    return pd.to_numeric(values, errors='coerce')
 
 
 def safe_col_mean(df, col_name):
-    """안전하게 컬럼 평균 계산 (문자열 타입 처리)"""
+    """안전하게 컬럼 평균 계산 (숫자가 아닌 값은 제외)"""
     if col_name not in df.columns:
         return None
     try:
-        return pd.to_numeric(df[col_name], errors='coerce').mean()
-    except:
+        return _numeric_col(df, col_name).mean()
+    except (TypeError, ValueError):
         return None
 
 
-def build_team_comparison(batter_kpi: pd.DataFrame, pitcher_kpi: pd.DataFrame) -> dict:
-    """팀 비교 데이터 구성"""
-    comparison = {}
-
-    for season in batter_kpi['season'].unique():
-        season_str = str(int(season))
-        comparison[season_str] = {"batters": {}, "pitchers": {}}
-
-        # 타자 팀 비교
-        batter_season = batter_kpi[batter_kpi['season'] == season]
-        for team in batter_season['team_name'].dropna().unique():
-            team_data = batter_season[batter_season['team_name'] == team]
-
-            comparison[season_str]["batters"][team] = {
-                "avg_overall": safe_float(safe_col_mean(team_data, 'overall_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'overall_grade'), 1),
-                "avg_contact": safe_float(safe_col_mean(team_data, 'contact_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'contact_grade'), 1),
-                "avg_game_power": safe_float(safe_col_mean(team_data, 'game_power_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'game_power_grade'), 1),
-                "avg_gap_power": safe_float(safe_col_mean(team_data, 'gap_power_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'gap_power_grade'), 1),
-                "avg_discipline": safe_float(safe_col_mean(team_data, 'discipline_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'discipline_grade'), 1),
-                "avg_clutch": safe_float(safe_col_mean(team_data, 'clutch_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'clutch_grade'), 1),
-                "player_count": len(team_data)
-            }
+def build_team_comparison_season(batter_season: pd.DataFrame, pitcher_season: pd.DataFrame) -> dict:
+    """한 시즌의 팀 비교 데이터 구성"""
+    comparison = {"batters": {}, "pitchers": {}}
 
-        # 투수 팀 비교
-        pitcher_season = pitcher_kpi[pitcher_kpi['season'] == season]
-        for team in pitcher_season['team_name'].dropna().unique():
-            team_data = pitcher_season[pitcher_season['team_name'] == team]
-
-            comparison[season_str]["pitchers"][team] = {
-                "avg_overall": safe_float(safe_col_mean(team_data, 'overall_grade'), 1),
-                "avg_control": safe_float(safe_col_mean(team_data, 'control_grade'), 1),
-                "avg_aggression": safe_float(safe_col_mean(team_data, 'aggression_grade'), 1),
-                "avg_efficiency": safe_float(safe_col_mean(team_data, 'efficiency_grade'), 1),
-                "avg_stuff": safe_float(safe_col_mean(team_data, 'stuff_grade'), 1),
-                "avg_clutch": safe_float(safe_col_mean(team_data, 'clutch_grade'), 1),
-                "player_count": len(team_data)
-            }
+    # 타자 팀 비교
+    for team in batter_season['team_name'].dropna().unique():
+        team_data = batter_season[batter_season['team_name'] == team]
+
+        comparison["batters"][team] = {
+            "avg_overall": safe_float(safe_col_mean(team_data, 'overall_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'overall_grade'), 1),
+            "avg_contact": safe_float(safe_col_mean(team_data, 'contact_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'contact_grade'), 1),
+            "avg_game_power": safe_float(safe_col_mean(team_data, 'game_power_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'game_power_grade'), 1),
+            "avg_gap_power": safe_float(safe_col_mean(team_data, 'gap_power_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'gap_power_grade'), 1),
+            "avg_discipline": safe_float(safe_col_mean(team_data, 'discipline_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'discipline_grade'), 1),
+            "avg_clutch": safe_float(safe_col_mean(team_data, 'clutch_grade_weighted'), 1) or safe_float(safe_col_mean(team_data, 'clutch_grade'), 1),
+            "player_count": len(team_data)
+        }
+
+    # 투수 팀 비교
+    for team in pitcher_season['team_name'].dropna().unique():
+        team_data = pitcher_season[pitcher_season['team_name'] == team]
+
+        comparison["pitchers"][team] = {
+            "avg_overall": safe_float(safe_col_mean(team_data, 'overall_grade'), 1),
+            "avg_control": safe_float(safe_col_mean(team_data, 'control_grade'), 1),
+            "avg_aggression": safe_float(safe_col_mean(team_data, 'aggression_grade'), 1),
+            "avg_efficiency": safe_float(safe_col_mean(team_data, 'efficiency_grade'), 1),
+            "avg_stuff": safe_float(safe_col_mean(team_data, 'stuff_grade'), 1),
+            "avg_clutch": safe_float(safe_col_mean(team_data, 'clutch_grade'), 1),
+            "player_count": len(team_data)
+        }
 
     return comparison
 
 
+def iter_team_comparison(batter_kpi: pd.DataFrame, pitcher_kpi: pd.DataFrame, cache: FragmentCache = None,
+                         executor=None):
+    """팀 비교 시즌 조각 생성"""
+    units = [
+        (str(int(season)), [batter_kpi[batter_kpi['season'] == season], pitcher_kpi[pitcher_kpi['season'] == season]])
+        for season in batter_kpi['season'].unique()
+    ]
+    return iter_cached_units('team_comparison', units, build_team_comparison_season, cache, executor=executor)
+
+
+def build_team_comparison(batter_kpi: pd.DataFrame, pitcher_kpi: pd.DataFrame, cache: FragmentCache = None) -> dict:
+    """팀 비교 데이터 구성"""
+    return dict(iter_team_comparison(batter_kpi, pitcher_kpi, cache))
+
+
 def safe_nlargest(df, n, col_name, id_col):
-    """안전하게 상위 n개 추출 (문자열 타입 처리)"""
+    """안전하게 상위 n개 추출 (숫자가 아닌 값은 제외)"""
     if col_name not in df.columns:
         return []
     try:
-        df_copy = df.copy()
-        df_copy[col_name] = pd.to_numeric(df_copy[col_name], errors='coerce')
-        return df_copy.nlargest(n, col_name)[id_col].tolist()
-    except:
+        values = _numeric_col(df, col_name).reset_index(drop=True)
+        return df[id_col].iloc[values.nlargest(n).index].tolist()
+    except (TypeError, ValueError):
         return []
 
 
-def build_leaderboards(batter_kpi: pd.DataFrame, pitcher_kpi: pd.DataFrame) -> dict:
-    """리더보드 데이터 구성"""
-    leaderboards = {"batters": {}, "pitchers": {}}
+def build_batter_leaderboard(batter_season: pd.DataFrame) -> dict:
+    """한 시즌의 타자 리더보드"""
+    return {
+        "by_overall": safe_nlargest(batter_season, 100, 'overall_grade', 'batter_pcode'),
+        "by_contact": safe_nlargest(batter_season, 100, 'contact_grade', 'batter_pcode'),
+        "by_discipline": safe_nlargest(batter_season, 100, 'discipline_grade', 'batter_pcode'),
+    }
 
-    for season in batter_kpi['season'].unique():
-        season_str = str(int(season))
-        batter_season = batter_kpi[batter_kpi['season'] == season].copy()
 
-        # 타자 리더보드
-        leaderboards["batters"][season_str] = {
-            "by_overall": safe_nlargest(batter_season, 100, 'overall_grade', 'batter_pcode'),
-            "by_contact": safe_nlargest(batter_season, 100, 'contact_grade', 'batter_pcode'),
-            "by_discipline": safe_nlargest(batter_season, 100, 'discipline_grade', 'batter_pcode'),
-        }
+def build_pitcher_leaderboard(pitcher_season: pd.DataFrame) -> dict:
+    """한 시즌의 투수 리더보드"""
+    return {
+        "by_overall": safe_nlargest(pitcher_season, 100, 'overall_grade', 'pitcher_pcode'),
+        "by_control": safe_nlargest(pitcher_season, 100, 'control_grade', 'pitcher_pcode'),
+        "by_stuff": safe_nlargest(pitcher_season, 100, 'stuff_grade', 'pitcher_pcode'),
+    }
 
-    for season in pitcher_kpi['season'].unique():
-        season_str = str(int(season))
-        pitcher_season = pitcher_kpi[pitcher_kpi['season'] == season].copy()
 
-        # 투수 리더보드
-        leaderboards["pitchers"][season_str] = {
-            "by_overall": safe_nlargest(pitcher_season, 100, 'overall_grade', 'pitcher_pcode'),
-            "by_control": safe_nlargest(pitcher_season, 100, 'control_grade', 'pitcher_pcode'),
-            "by_stuff": safe_nlargest(pitcher_season, 100, 'stuff_grade', 'pitcher_pcode'),
-        }
+def build_leaderboards(batter_kpi: pd.DataFrame, pitcher_kpi: pd.DataFrame, cache: FragmentCache = None) -> dict:
+    """리더보드 데이터 구성"""
+    return {
+        "batters": build_season_sections(batter_kpi, 'leaderboards.batters', build_batter_leaderboard, cache),
+        "pitchers": build_season_sections(pitcher_kpi, 'leaderboards.pitchers', build_pitcher_leaderboard, cache),
+    }
 
-    return leaderboards
+
+def iter_sections(batter_kpi: pd.DataFrame, pitcher_kpi: pd.DataFrame, cache: FragmentCache = None, executor=None) -> dict:
+    """
+    시즌별 섹션 조각 iterator 구성
+
+    executor가 있으면 이 시점에 모든 (섹션, 시즌) 단위를 프로세스 풀에 제출하므로
+    섹션을 순서대로 소비해도 전체 단위가 병렬로 빌드됨
+    """
+    return {
+        "batters.kpi": iter_batter_kpi_data(batter_kpi, cache, executor),
+        "pitchers.kpi": iter_pitcher_kpi_data(pitcher_kpi, cache, executor),
+        "team_comparison": iter_team_comparison(batter_kpi, pitcher_kpi, cache, executor),
+        "leaderboards.batters": iter_season_sections(
+            batter_kpi, 'leaderboards.batters', build_batter_leaderboard, cache, executor=executor
+        ),
+        "leaderboards.pitchers": iter_season_sections(
+            pitcher_kpi, 'leaderboards.pitchers', build_pitcher_leaderboard, cache, executor=executor
+        ),
+    }
 
 
 def safe_float(value, decimals=3):
@@ -426,11 +573,30 @@ def safe_int(value):
         return None
 
 
-def export_to_json(compress: bool = False):
-    """JSON 파일로 내보내기"""
+def export_to_json(compress: bool = False, incremental: bool = False, cache_dir=None, sharded: bool = False,
+                   compact: bool = False, workers: int = 1, profile: bool = False, profile_json=None):
+    """JSON 파일로 내보내기
+
+    incremental=True면 시즌별 조각을 cache_dir(기본: export/.cache)에 저장해 두고
+    입력 행이 바뀐 시즌만 다시 빌드
+    sharded=True면 단일 JSON 대신 export/shards/ 아래에 manifest와 샤드로 저장
+    compact=True면 메트릭 정의를 schema 블록에 한 번만 쓰는 압축 포맷으로 저장
+    workers > 1이면 (섹션, 시즌) 단위를 프로세스 풀에서 병렬 빌드 (출력은 직렬 실행과 동일)
+    profile=True면 단계별 wall/CPU 시간과 최대 메모리를 표로 출력 (profile_json 경로가 있으면 JSON 리포트도 저장)
+    compress는 sharded와 함께 쓸 수 없음 (샤드는 서빙 시 HTTP 압축)
+    """
+    if sharded and compress:
+        raise ValueError("compress는 sharded와 함께 쓸 수 없습니다 (샤드는 서빙 시 HTTP 압축)")
+
+    profiler = StageProfiler(enabled=profile or profile_json is not None)
+    profiler.start()
 
     # 데이터 로드
-    batter_kpi, pitcher_kpi, players, teams = load_parquet_data()
+    with profiler.stage("load"):
+        batter_kpi, pitcher_kpi, players, teams = load_parquet_data()
+
+    # 시즌 조각 캐시
+    cache = FragmentCache(cache_dir or OUTPUT_DIR / ".cache") if incremental else FragmentCache()
 
     # 시즌 목록
     all_seasons = sorted(set(
@@ -438,49 +604,141 @@ def export_to_json(compress: bool = False):
         list(pitcher_kpi['season'].unique())
     ))
 
-    print("\nBuilding JSON structure...")
-
-    # JSON 구조 생성
-    data = {
-        "metadata": {
-            "version": "1.0.0",
-            "generated_at": datetime.now().isoformat(),
-            "seasons": [int(s) for s in all_seasons],
-            "data_period": "2021-04-03 ~ 2025-10-04"
-        },
-        "teams": TEAMS,
-        "batters": {
-            "index": build_batter_index(batter_kpi, players),
-            "kpi": build_batter_kpi_data(batter_kpi)
-        },
-        "pitchers": {
-            "index": build_pitcher_index(pitcher_kpi, players),
-            "kpi": build_pitcher_kpi_data(pitcher_kpi)
-        },
-        "team_comparison": build_team_comparison(batter_kpi, pitcher_kpi),
-        "leaderboards": build_leaderboards(batter_kpi, pitcher_kpi)
+    metadata = {
+        "version": "1.0.0",
+        "generated_at": datetime.now().isoformat(),
+        "seasons": [int(s) for s in all_seasons],
+        "data_period": "2021-04-03 ~ 2025-10-04"
     }
 
     # 출력 디렉토리 생성
     OUTPUT_DIR.mkdir(exist_ok=True)
 
-    # JSON 저장
+    print("\nBuilding JSON structure...")
+
+    with profiler.stage("index.batters"):
+        batter_index = build_batter_index(batter_kpi, players)
+    with profiler.stage("index.pitchers"):
+        pitcher_index = build_pitcher_index(pitcher_kpi, players)
+
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as executor:
+        if workers > 1:
+            print(f"Building season sections with {workers} worker processes...")
+        sections = {
+            key: profiler.iterate(f"build.{key}", items)
+            for key, items in iter_sections(batter_kpi, pitcher_kpi, cache, executor).items()
+        }
+
+        if not (sharded or compact):
+            with profiler.stage("serialize"):
+                output_path = write_streaming(batter_index, pitcher_index, metadata, sections, compress)
+            data = {
+                "metadata": metadata,
+                "teams": TEAMS,
+                "batters": {"index": batter_index},
+                "pitchers": {"index": pitcher_index},
+            }
+        else:
+            # JSON 구조 생성
+            data = {
+                "metadata": metadata,
+                "teams": TEAMS,
+                "batters": {
+                    "index": batter_index,
+                    "kpi": dict(sections["batters.kpi"])
+                },
+                "pitchers": {
+                    "index": pitcher_index,
+                    "kpi": dict(sections["pitchers.kpi"])
+                },
+                "team_comparison": dict(sections["team_comparison"]),
+                "leaderboards": {
+                    "batters": dict(sections["leaderboards.batters"]),
+                    "pitchers": dict(sections["leaderboards.pitchers"]),
+                }
+            }
+
+    if sharded:
+        print(f"\nSaving sharded JSON to {OUTPUT_DIR / SHARD_DIR_NAME}...")
+        with profiler.stage("serialize"):
+            output_path = write_sharded(data, OUTPUT_DIR / SHARD_DIR_NAME)
+    elif compact:
+        with profiler.stage("serialize"):
+            output_path = write_compact(data, compress)
+
+    profiler.stop()
+    print_export_statistics(data, cache)
+
+    if profiler.enabled:
+        print(f"\n=== Export Profile ===")
+        if workers > 1:
+            print("(build.* stages include time spent waiting for worker processes)")
+        print(profiler.table())
+        if profile_json is not None:
+            report_path = profiler.write_report(profile_json, extra={
+                "generated_at": metadata["generated_at"],
+                "options": {
+                    "compress": compress, "incremental": incremental, "sharded": sharded,
+                    "compact": compact, "workers": workers,
+                },
+            })
+            print(f"Profile report saved to {report_path}")
+
+    return output_path
+
+
+def write_streaming(batter_index: dict, pitcher_index: dict, metadata: dict, sections: dict,
+                    compress: bool = False) -> Path:
+    """시즌 조각을 만드는 대로 전체/축소 JSON에 동시에 기록 (전체 dict를 메모리에 두지 않음)"""
     if compress:
         output_path = OUTPUT_DIR / "kbo_scouting_data.json.gz"
-        print(f"\nSaving compressed JSON to {output_path}...")
-        with gzip.open(output_path, 'wt', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False)
+        output_file = gzip.open(output_path, 'wt', encoding='utf-8')
+        layout = DEFAULT
+        print(f"\nStreaming compressed JSON to {output_path}...")
     else:
         output_path = OUTPUT_DIR / "kbo_scouting_data.json"
-        print(f"\nSaving JSON to {output_path}...")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        output_file = open(output_path, 'w', encoding='utf-8')
+        layout = PRETTY
+        print(f"\nStreaming JSON to {output_path}...")
 
-    # 축소 버전도 생성
+    # 축소 버전도 같은 조각으로 함께 기록
     output_min_path = OUTPUT_DIR / "kbo_scouting_data.min.json"
-    print(f"Saving minified JSON to {output_min_path}...")
-    with open(output_min_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"Streaming minified JSON to {output_min_path}...")
+
+    with output_file, open(output_min_path, 'w', encoding='utf-8') as min_file:
+        writer = JSONStreamWriter([(output_file, layout), (min_file, MINIFIED)])
+        writer.begin_object()
+        writer.write_member("metadata", metadata)
+        writer.write_member("teams", TEAMS)
+
+        writer.begin_object("batters")
+        writer.write_member("index", batter_index)
+        writer.begin_object("kpi")
+        writer.write_members(sections["batters.kpi"])
+        writer.end_object()
+        writer.end_object()
+
+        writer.begin_object("pitchers")
+        writer.write_member("index", pitcher_index)
+        writer.begin_object("kpi")
+        writer.write_members(sections["pitchers.kpi"])
+        writer.end_object()
+        writer.end_object()
+
+        writer.begin_object("team_comparison")
+        writer.write_members(sections["team_comparison"])
+        writer.end_object()
+
+        writer.begin_object("leaderboards")
+        writer.begin_object("batters")
+        writer.write_members(sections["leaderboards.batters"])
+        writer.end_object()
+        writer.begin_object("pitchers")
+        writer.write_members(sections["leaderboards.pitchers"])
+        writer.end_object()
+        writer.end_object()
+
+        writer.end_object()
 
     # 파일 크기 출력
     if compress:
@@ -493,20 +751,67 @@ def export_to_json(compress: bool = False):
     min_size = output_min_path.stat().st_size / 1024 / 1024
     print(f"Minified JSON size: {min_size:.2f} MB")
 
-    # 통계 출력
+    return output_path
+
+
+def write_compact(data: dict, compress: bool = False) -> Path:
+    """스키마 기반 압축 포맷으로 저장 (compress=True면 gzip)"""
+    compact = encode_compact(data, BATTER_METRIC_DEFINITIONS, PITCHER_METRIC_DEFINITIONS)
+
+    output_path = OUTPUT_DIR / COMPACT_FILE_NAME
+    if compress:
+        output_path = output_path.with_name(output_path.name + ".gz")
+        print(f"\nSaving compressed compact JSON to {output_path}...")
+        with gzip.open(output_path, 'wt', encoding='utf-8') as f:
+            json.dump(compact, f, ensure_ascii=False, separators=(',', ':'))
+    else:
+        print(f"\nSaving compact JSON to {output_path}...")
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(compact, f, ensure_ascii=False, separators=(',', ':'))
+
+    size = output_path.stat().st_size / 1024 / 1024
+    print(f"Compact JSON size: {size:.2f} MB")
+
+    return output_path
+
+
+def print_export_statistics(data: dict, cache: FragmentCache):
+    """내보내기 통계 출력"""
     print(f"\n=== Export Statistics ===")
     print(f"Batters: {len(data['batters']['index'])} players")
     print(f"Pitchers: {len(data['pitchers']['index'])} players")
     print(f"Seasons: {data['metadata']['seasons']}")
     print(f"Teams: {len(data['teams'])}")
+    if cache.enabled:
+        print(cache.summary())
 
     print(f"\nExport completed successfully!")
-    return output_path
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Export KBO scouting data to JSON")
     parser.add_argument("--compress", action="store_true", help="Compress output with gzip")
+    parser.add_argument("--incremental", action="store_true", help="Rebuild only seasons whose input rows changed")
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Season fragment cache directory (default: export/.cache)")
+    parser.add_argument("--workers", type=int, default=1, help="Build (section, season) units in N worker processes (default: 1, serial)")
+    parser.add_argument("--profile", action="store_true", help="Print wall/CPU time and peak traced memory per stage")
+    parser.add_argument("--profile-json", type=Path, default=None, help="Also write the profile report as JSON to this path")
+    output_mode = parser.add_mutually_exclusive_group()
+    output_mode.add_argument("--sharded", action="store_true", help="Write manifest + content-hashed shards to export/shards instead of one JSON")
+    output_mode.add_argument("--compact", action="store_true", help="Write schema-based compact JSON (metric definitions once, positional arrays)")
     args = parser.parse_args()
-
-    export_to_json(compress=args.compress)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.sharded and args.compress:
+        parser.error("--compress cannot be combined with --sharded (serve shards with HTTP compression)")
+
+    export_to_json(
+        compress=args.compress,
+        incremental=args.incremental,
+        cache_dir=args.cache_dir,
+        sharded=args.sharded,
+        compact=args.compact,
+        workers=args.workers,
+        profile=args.profile,
+        profile_json=args.profile_json
+    )
@@ -4,16 +4,24 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 import sys
 from pathlib import Path
 
 # 상위 디렉토리 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
+from utils.column_groups import GRADES, SUMMARY_GROUPS
 from utils.data_loader import (
-    get_pitcher_list, get_pitcher_data, get_team_color, load_pitcher_kpi, search_pitchers
+    get_pitcher_list, get_pitcher_data, get_pitcher_history, get_pitcher_percentile_engine,
+    get_pitcher_regrade_engine, get_pitcher_seasons, get_similar_pitchers, get_team_color, search_pitchers, warm_up
 )
+from utils.figure_cache import cached_figure
+from utils.metric_card import build_category_cards, get_grade_color, get_grade_label
+from utils.percentile import PITCHER_COHORTS
+from utils.similarity import SIMILARITY_FEATURES
+from utils.snapshot import data_version, pin_snapshot
+from utils.startup import lazy_import
+from utils.weight_editor import render_weight_editor
 
 st.set_page_config(
     page_title="투수 스카우팅 리포트",
@@ -21,40 +29,11 @@ st.set_page_config(
     layout="wide"
 )
 
-# 등급 관련 함수
-def get_grade_color(grade):
-    if pd.isna(grade):
-        return "#6B7280"
-    grade = float(grade)
-    if grade >= 80:
-        return "#9333EA"  # purple
-    elif grade >= 70:
-        return "#2563EB"  # blue
-    elif grade >= 60:
-        return "#16A34A"  # green
-    elif grade >= 50:
-        return "#CA8A04"  # yellow
-    elif grade >= 40:
-        return "#EA580C"  # orange
-    else:
-        return "#DC2626"  # red
-
-def get_grade_label(grade):
-    if pd.isna(grade):
-        return "N/A"
-    grade = float(grade)
-    if grade >= 80:
-        return "엘리트"
-    elif grade >= 70:
-        return "플러스"
-    elif grade >= 60:
-        return "평균 이상"
-    elif grade >= 50:
-        return "평균"
-    elif grade >= 40:
-        return "평균 이하"
-    else:
-        return "부족"
+# 테이블 캐시 예열 (프로세스당 1회, 백그라운드)
+warm_up()
+
+# 이번 실행의 데이터 스냅샷 고정 (실행 중 데이터가 교체돼도 끝까지 같은 스냅샷 사용)
+pin_snapshot()
 
 def safe_float(val, default=0):
     try:
@@ -78,10 +57,10 @@ st.title("⚾ 투수 스카우팅 리포트")
 with st.sidebar:
     st.header("선수 선택")
 
-    season = st.selectbox("시즌", [2025, 2024, 2023, 2022, 2021], index=0)
+    season = st.selectbox("시즌", get_pitcher_seasons(), index=0)
 
     # 선수 이름 검색
-    search_query = st.text_input("선수 이름 검색 (2글자 이상)", placeholder="예: 류현진")
+    search_query = st.text_input("선수 이름 검색 (2글자 이상)", placeholder="예: 류현진 또는 ㄹㅎㅈ")
 
     pitcher_pcode = None
 
@@ -106,12 +85,25 @@ with st.sidebar:
     else:
         st.info("선수 이름을 2글자 이상 입력하세요.")
 
+# 사용자 가중치 (리더보드와 공유, 기본 가중치면 None)
+regrade_engine = get_pitcher_regrade_engine()
+custom_weights = render_weight_editor(regrade_engine, "pitcher_weights")
+
+def apply_custom_grades(row, pcode, season, custom_weights):
+    """사용자 가중치가 있으면 카테고리/OVR 등급을 재등급 값으로 교체"""
+    if custom_weights is None or row is None:
+        return row
+    row = row.copy()
+    regraded = regrade_engine.player(pcode, season, *custom_weights)
+    row[regraded.index] = regraded.to_numpy()
+    return row
+
 if pitcher_pcode is None:
     st.info("사이드바에서 선수를 검색하세요.")
     st.stop()
 
 # 데이터 로드
-data = get_pitcher_data(pitcher_pcode, season)
+data = apply_custom_grades(get_pitcher_data(pitcher_pcode, season, groups=SUMMARY_GROUPS), pitcher_pcode, season, custom_weights)
 
 if data is None:
     st.error("선수 데이터를 찾을 수 없습니다.")
@@ -126,6 +118,8 @@ with col1:
     if pd.isna(team_name):
         team_name = 'N/A'
     st.markdown(f"**{team_name}** | {season} 시즌")
+    if custom_weights is not None:
+        st.caption("⚖️ 사용자 가중치로 재계산한 등급")
 
 with col2:
     overall = safe_float(data.get('overall_grade', 50))
@@ -139,13 +133,12 @@ with col3:
 
 st.divider()
 
-# 탭 구성 (역할별 분석 제외)
-tab1, tab2, tab3 = st.tabs(["개요", "전체 지표", "리그 비교"])
-
 # ============================================================================
 # 개요 탭
 # ============================================================================
-with tab1:
+@st.fragment
+def render_overview_tab():
+    """개요 탭 (fragment)"""
     # 카테고리별 점수
     st.subheader("카테고리별 평가")
 
@@ -158,33 +151,38 @@ with tab1:
         '클러치': safe_float(data.get('clutch_grade', 50)),
     }
 
-    # 레이더 차트
-    fig = go.Figure()
-
-    categories_list = list(categories.keys())
-    values = list(categories.values())
-    values.append(values[0])  # 닫기 위해 첫 값 추가
-    categories_list_closed = categories_list + [categories_list[0]]
-
-    fig.add_trace(go.Scatterpolar(
-        r=values,
-        theta=categories_list_closed,
-        fill='toself',
-        name=data['player_name'],
-        fillcolor='rgba(239, 68, 68, 0.3)',
-        line=dict(color='rgb(239, 68, 68)', width=2)
-    ))
-
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[20, 80]
-            )
-        ),
-        showlegend=False,
-        height=400
-    )
+    # 레이더 차트 (선수-시즌/가중치별 figure 캐시)
+    def build_radar():
+        go = lazy_import("plotly.graph_objects")
+        fig = go.Figure()
+
+        categories_list = list(categories.keys())
+        values = list(categories.values())
+        values.append(values[0])  # 닫기 위해 첫 값 추가
+        categories_list_closed = categories_list + [categories_list[0]]
+
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=categories_list_closed,
+            fill='toself',
+            name=data['player_name'],
+            fillcolor='rgba(239, 68, 68, 0.3)',
+            line=dict(color='rgb(239, 68, 68)', width=2)
+        ))
+
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[20, 80]
+                )
+            ),
+            showlegend=False,
+            height=400
+        )
+        return fig
+
+    fig = cached_figure("pitcher_radar", (pitcher_pcode, season, custom_weights, data_version()), build_radar)
 
     col1, col2 = st.columns([1, 1])
 
@@ -274,165 +272,45 @@ with tab1:
 # ============================================================================
 # 전체 지표 탭
 # ============================================================================
-with tab2:
+@st.fragment
+def render_detail_tab():
+    """전체 지표 탭 (fragment, 카테고리 카드당 요소 1개)"""
     st.subheader("카테고리별 상세 지표")
 
-    # 가중치 정보 (투수)
-    PITCHER_METRIC_WEIGHTS = {
-        'control': {
-            'first_pitch_strike_rate': ('초구 스트라이크율', 0.25, '%'),
-            'walk_avoidance_rate': ('볼넷 회피율', 0.25, '%'),
-            'three_ball_recovery_rate': ('3볼 회복률', 0.20, '%'),
-            'favorable_count_entry_rate': ('유리한 카운트 진입률', 0.15, '%'),
-            'main_pitch_control_rate': ('주구종 제구율', 0.15, '%'),
-        },
-        'aggression': {
-            'two_strike_strikeout_rate': ('2스트라이크 삼진율', 0.35, '%'),
-            'early_strike_rate': ('초반 스트라이크율', 0.25, '%'),
-            'finishing_ability_rate': ('마무리 능력', 0.25, '%'),
-            'high_velocity_decision_rate': ('고속구 결정률', 0.15, '%'),
-        },
-        'efficiency': {
-            'avg_pitches_per_batter': ('타자당 평균 투구수', 0.40, '', True),  # 역방향
-            'count_efficiency_index': ('카운트 효율 지수', 0.30, ''),
-            'full_count_avoidance_rate': ('풀카운트 회피율', 0.30, '%'),
-        },
-        'stuff': {
-            'whiff_rate': ('헛스윙 유도율', 0.30, '%'),
-            'chase_rate': ('체이스율', 0.25, '%'),
-            'in_zone_whiff_rate': ('존내 헛스윙률', 0.20, '%'),
-            'unhittable_pitch_rate': ('언히터블 피치율', 0.15, '%'),
-            'avg_fastball_velocity': ('평균 패스트볼 구속', 0.10, 'km/h'),
-        },
-        'clutch': {
-            'risp_out_rate': ('득점권 아웃률', 0.25, '%'),
-            'bases_loaded_escape_rate': ('만루 탈출률', 0.20, '%'),
-            'two_out_inning_end_rate': ('2아웃 이닝 종료율', 0.20, '%'),
-            'first_batter_out_rate': ('첫 타자 아웃률', 0.20, '%'),
-            'close_game_prevention_rate': ('접전 실점 방지율', 0.10, '%'),
-            'momentum_protection_rate': ('모멘텀 보호율', 0.05, '%'),
-        }
-    }
-
-    def get_weight_color(weight):
-        """가중치에 따른 색상"""
-        if weight >= 0.35:
-            return "#DC2626"  # 빨강 (매우 중요)
-        elif weight >= 0.25:
-            return "#EA580C"  # 주황 (중요)
-        elif weight >= 0.15:
-            return "#2563EB"  # 파랑 (보통)
-        elif weight >= 0.10:
-            return "#6B7280"  # 회색 (낮음)
-        else:
-            return "#9CA3AF"  # 연회색 (매우 낮음)
-
-    def render_pitcher_category_card(category_name, category_key, grade_key):
-        """투수 카테고리 카드 렌더링"""
-        grade = safe_float(data.get(grade_key, 50))
-
-        # 카테고리 헤더
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%);
-                    border-radius: 12px; padding: 16px; margin-bottom: 8px;
-                    border: 1px solid #fecaca;">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <h4 style="margin: 0; font-size: 1.1rem; font-weight: 600;">{category_name}</h4>
-                <div style="display: flex; align-items: center; gap: 8px;">
-                    <span style="background: {get_grade_color(grade)}; color: white;
-                                 padding: 4px 12px; border-radius: 20px; font-weight: bold;
-                                 font-size: 0.9rem;">{grade:.0f}</span>
-                    <span style="color: {get_grade_color(grade)}; font-size: 0.8rem;">
-                        {get_grade_label(grade)}
-                    </span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # 세부 지표
-        metrics = PITCHER_METRIC_WEIGHTS.get(category_key, {})
-
-        for key, info in metrics.items():
-            name = info[0]
-            weight = info[1]
-            unit = info[2] if len(info) > 2 else ''
-
-            # 값 포맷팅
-            val = safe_float(data.get(key, 0))
-            if unit == '%':
-                formatted_val = f"{val*100:.1f}%"
-            elif unit == 'km/h':
-                formatted_val = f"{val:.1f} km/h" if val else "N/A"
-            elif unit == '':
-                if 'index' in key:
-                    formatted_val = f"{val:.2f}"
-                elif 'avg_pitches' in key:
-                    formatted_val = f"{val:.1f}"
-                else:
-                    formatted_val = f"{val:.3f}"
-            else:
-                formatted_val = f"{val:.2f}"
-
-            # 등급 (있으면)
-            grade_col = f"{key}_grade"
-            metric_grade = safe_float(data.get(grade_col, 0))
-
-            col1, col2, col3, col4 = st.columns([4, 2, 2, 2])
-
-            with col1:
-                st.markdown(f"""
-                <div style="display: flex; align-items: center; gap: 6px;">
-                    <span style="font-size: 0.9rem;">{name}</span>
-                    <span style="color: {get_weight_color(weight)}; font-size: 0.75rem; font-weight: 600;">
-                        W-{int(weight*100)}%
-                    </span>
-                </div>
-                """, unsafe_allow_html=True)
-
-            with col2:
-                st.markdown(f"<span style='font-family: monospace; font-weight: 500;'>{formatted_val}</span>",
-                           unsafe_allow_html=True)
-
-            with col3:
-                if metric_grade > 0:
-                    st.markdown(f"""
-                    <span style="background: {get_grade_color(metric_grade)}; color: white;
-                                 padding: 2px 8px; border-radius: 4px; font-size: 0.75rem;">
-                        {metric_grade:.0f}
-                    </span>
-                    """, unsafe_allow_html=True)
-
-            with col4:
-                percentile_col = f"{key}_percentile"
-                percentile = safe_float(data.get(percentile_col, 0))
-                if percentile > 0:
-                    st.markdown(f"<span style='font-size: 0.75rem; color: #6b7280;'>상위 {100-percentile:.0f}%</span>",
-                               unsafe_allow_html=True)
-
-        st.markdown("---")
-
-    # 각 카테고리 렌더링
-    render_pitcher_category_card("제구력 (Control)", "control", "control_grade")
-    render_pitcher_category_card("공격성 (Aggression)", "aggression", "aggression_grade")
-    render_pitcher_category_card("효율성 (Efficiency)", "efficiency", "efficiency_grade")
-    render_pitcher_category_card("구위 (Stuff)", "stuff", "stuff_grade")
-    render_pitcher_category_card("클러치 (Clutch)", "clutch", "clutch_grade")
+    for card in build_category_cards('pitcher', pitcher_pcode, season, custom_weights, data_version()):
+        st.markdown(card, unsafe_allow_html=True)
 
 # ============================================================================
 # 리그 비교 탭
 # ============================================================================
-with tab3:
+@st.fragment
+def render_league_tab():
+    """리그 비교 탭 (fragment)"""
     st.subheader("리그 내 백분위 순위")
 
+    # 비교 집단 선택 (시즌/집단별 정렬 배열 기준으로 매번 계산)
+    percentile_engine = get_pitcher_percentile_engine()
+    cohort = st.selectbox(
+        "비교 집단",
+        list(PITCHER_COHORTS.keys()),
+        format_func=percentile_engine.cohort_label,
+        key="pitcher_percentile_cohort"
+    )
+    cohort_note = f"{percentile_engine.cohort_label(cohort)} {percentile_engine.cohort_size(season, cohort)}명 기준"
+    if not percentile_engine.in_cohort(pitcher_pcode, season, cohort):
+        cohort_note += " (이 선수는 집단 조건 밖 - 집단 분포 대비 위치)"
+    st.caption(cohort_note)
+
+    league = percentile_engine.rank_player(pitcher_pcode, season, cohort)
+
     # 주요 지표 백분위
     percentile_metrics = {
-        '초구 스트라이크율': safe_float(data.get('first_pitch_strike_rate_percentile', 50)),
-        '헛스윙 유도율': safe_float(data.get('whiff_rate_percentile', 50)),
-        '체이스율': safe_float(data.get('chase_rate_percentile', 50)),
-        '타자당 투구수': safe_float(data.get('avg_pitches_per_batter_percentile', 50)),
-        '득점권 아웃률': safe_float(data.get('risp_out_rate_percentile', 50)),
-        '평균 구속': safe_float(data.get('avg_fastball_velocity_percentile', 50)),
+        '초구 스트라이크율': safe_float(league.get('first_pitch_strike_rate'), 50),
+        '헛스윙 유도율': safe_float(league.get('whiff_rate'), 50),
+        '체이스율': safe_float(league.get('chase_rate'), 50),
+        '타자당 투구수': safe_float(league.get('avg_pitches_per_batter'), 50),
+        '득점권 아웃률': safe_float(league.get('risp_out_rate'), 50),
+        '평균 구속': safe_float(league.get('avg_fastball_velocity'), 50),
     }
 
     for metric, percentile in percentile_metrics.items():
@@ -449,29 +327,37 @@ with tab3:
     # 시즌별 추이
     st.subheader("시즌별 추이")
 
-    all_data = load_pitcher_kpi()
-    player_history = all_data[all_data['pitcher_pcode'] == pitcher_pcode].sort_values('season')
+    player_history = get_pitcher_history(pitcher_pcode, groups=[GRADES])
+    if custom_weights is not None:
+        regraded_history = regrade_engine.history(pitcher_pcode, *custom_weights)
+        player_history[regraded_history.columns] = regraded_history.to_numpy()
 
     if len(player_history) > 1:
-        fig = go.Figure()
-
-        # OVR 추이
-        ovr_values = player_history['overall_grade'].apply(lambda x: safe_float(x, 50))
-
-        fig.add_trace(go.Scatter(
-            x=player_history['season'],
-            y=ovr_values,
-            mode='lines+markers',
-            name='OVR',
-            line=dict(color='#EF4444', width=3)
-        ))
+        # OVR 추이 차트 (선수/가중치별 figure 캐시)
+        def build_trend():
+            go = lazy_import("plotly.graph_objects")
+            fig = go.Figure()
+
+            # OVR 추이
+            ovr_values = player_history['overall_grade'].apply(lambda x: safe_float(x, 50))
+
+            fig.add_trace(go.Scatter(
+                x=player_history['season'],
+                y=ovr_values,
+                mode='lines+markers',
+                name='OVR',
+                line=dict(color='#EF4444', width=3)
+            ))
+
+            fig.update_layout(
+                xaxis_title="시즌",
+                yaxis_title="등급",
+                yaxis=dict(range=[20, 80]),
+                height=300
+            )
+            return fig
 
-        fig.update_layout(
-            xaxis_title="시즌",
-            yaxis_title="등급",
-            yaxis=dict(range=[20, 80]),
-            height=300
-        )
+        fig = cached_figure("pitcher_trend", (pitcher_pcode, None, custom_weights, data_version()), build_trend)
 
         st.plotly_chart(fig, use_container_width=True)
 
@@ -490,3 +376,50 @@ with tab3:
         st.dataframe(season_stats, hide_index=True, use_container_width=True)
     else:
         st.info("다른 시즌 데이터가 없습니다.")
+
+    st.divider()
+
+    # 유사 선수 (등급 벡터 k-NN, 전체 시즌 대상)
+    st.subheader("유사 선수 TOP 10")
+
+    similarity_features = st.radio(
+        "유사도 기준",
+        list(SIMILARITY_FEATURES.keys()),
+        format_func=SIMILARITY_FEATURES.get,
+        horizontal=True,
+        key="pitcher_similarity_features"
+    )
+    similar = get_similar_pitchers(pitcher_pcode, season, k=10, features=similarity_features)
+
+    if similar is None or len(similar) == 0:
+        st.info("유사 선수를 찾을 수 없습니다.")
+    else:
+        similar_table = pd.DataFrame({
+            '선수': similar['player_name'],
+            '팀': similar['team_name'].astype(object).fillna('-'),
+            '시즌': similar['season'],
+            'OVR': similar['overall_grade'].apply(lambda x: f"{safe_int(x)}"),
+            '유사도': similar['similarity'],
+        })
+        st.dataframe(
+            similar_table, hide_index=True, width="stretch",
+            column_config={'유사도': st.column_config.ProgressColumn('유사도', min_value=0, max_value=100, format="%.1f")}
+        )
+        st.caption(f"{SIMILARITY_FEATURES[similarity_features]} 벡터 기준 (같은 선수의 다른 시즌 제외)")
+
+
+# 탭 구성 (역할별 분석 제외)
+# 선택된 탭만 실행하고, 탭 안의 위젯 조작은 해당 탭 fragment만 재실행
+tab1, tab2, tab3 = st.tabs(["개요", "전체 지표", "리그 비교"], key="pitcher_report_tab", on_change="rerun")
+
+with tab1:
+    if tab1.open:
+        render_overview_tab()
+
+with tab2:
+    if tab2.open:
+        render_detail_tab()
+
+with tab3:
+    if tab3.open:
+        render_league_tab()
@@ -5,29 +5,54 @@ KBO Batter Leaderboard - 타자 리더보드
 
 import streamlit as st
 import pandas as pd
+import sys
 from pathlib import Path
 
-# 경로 설정
-DATA_DIR = Path(__file__).parent.parent / "data"
-
-
-def get_grade_color(grade):
-    """등급에 따른 색상 반환"""
-    if pd.isna(grade):
-        return "#9CA3AF"
-    grade = int(grade)
-    if grade >= 80:
-        return "#DC2626"  # Elite - Red
-    elif grade >= 70:
-        return "#7C3AED"  # Great - Purple
-    elif grade >= 60:
-        return "#2563EB"  # Above Average - Blue
-    elif grade >= 50:
-        return "#10B981"  # Average - Green
-    elif grade >= 40:
-        return "#F59E0B"  # Below Average - Yellow
-    else:
-        return "#9CA3AF"  # Poor - Gray
+# 상위 디렉토리 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.data_loader import get_batter_regrade_engine, load_batter_kpi, warm_up
+from utils.leaderboard import FLOAT, GRADE, INT, TEXT, get_grade_color
+from utils.leaderboard_index import LeaderboardIndex
+from utils.leaderboard_view import render_paginated_leaderboard
+from utils.snapshot import data_version, pin_snapshot
+from utils.weight_editor import render_weight_editor
+
+# 리더보드 표시 컬럼 (표시 이름, source 컬럼 또는 fallback 튜플, 종류)
+LEADERBOARD_COLUMNS = [
+    ('순위', 'rank', INT),
+    ('선수', 'player_name', TEXT),
+    ('팀', 'team_name', TEXT),
+    # 능력치 등급 (가중 등급이 없으면 기본 등급)
+    ('OVR', ('overall_grade_weighted', 'overall_grade'), GRADE),
+    ('컨택', ('contact_grade_weighted', 'contact_grade'), GRADE),
+    ('홈런', ('game_power_grade_weighted', 'game_power_grade'), GRADE),
+    ('갭', ('gap_power_grade_weighted', 'gap_power_grade'), GRADE),
+    ('선구안', ('discipline_grade_weighted', 'discipline_grade'), GRADE),
+    ('일관성', ('consistency_grade_weighted', 'consistency_grade'), GRADE),
+    ('클러치', ('clutch_grade_weighted', 'clutch_grade'), GRADE),
+    # 전통 지표
+    ('타율', 'batting_average', FLOAT),
+    ('OPS', 'ops', FLOAT),
+    ('HR', 'home_runs', INT),
+    ('PA', 'plate_appearances', INT),
+]
+GRADE_COLUMNS = [label for label, _, kind in LEADERBOARD_COLUMNS if kind == GRADE]
+STAT_FORMATS = {'타율': '{:.3f}', 'OPS': '{:.3f}'}
+
+# 정렬 기준 (표시 이름 → 컬럼)
+SORT_OPTIONS = {
+    '종합 (OVR)': 'overall_grade_weighted',
+    '컨택': 'contact_grade_weighted',
+    '홈런 파워': 'game_power_grade_weighted',
+    '갭 파워': 'gap_power_grade_weighted',
+    '선구안': 'discipline_grade_weighted',
+    '일관성': 'consistency_grade_weighted',
+    '클러치': 'clutch_grade_weighted',
+    'OPS': 'ops',
+    '타율': 'batting_average',
+    '홈런': 'home_runs'
+}
 
 
 def format_grade(grade):
@@ -39,12 +64,9 @@ def format_grade(grade):
     return f'<span style="color: {color}; font-weight: bold;">{grade}</span>'
 
 
-@st.cache_data
 def load_data():
-    """데이터 로드"""
-    batter_kpi = pd.read_parquet(DATA_DIR / "batter_kpi.parquet")
-
-    # 숫자형으로 변환
+    """리더보드 데이터 (공유 데이터셋의 읽기 전용 뷰, 필요한 컬럼만)"""
+    # 리더보드 숫자 컬럼
     numeric_cols = [
         'overall_grade', 'overall_grade_weighted',
         'contact_grade', 'contact_grade_weighted',
@@ -57,11 +79,24 @@ def load_data():
         'home_runs', 'rbi', 'plate_appearances'
     ]
 
-    for col in numeric_cols:
-        if col in batter_kpi.columns:
-            batter_kpi[col] = pd.to_numeric(batter_kpi[col], errors='coerce')
+    # 리포트 페이지와 같은 캐시 원본을 공유 (다시 읽거나 정규화하지 않음)
+    return load_batter_kpi(['batter_pcode', 'season', 'player_name', 'team_name'] + numeric_cols)
+
 
-    return batter_kpi
+@st.cache_resource(max_entries=32)
+def get_season_index(season, custom_weights=None, version=None) -> LeaderboardIndex:
+    """시즌별 리더보드 쿼리 인덱스 (정렬 순열, 팀 bitmap, 타석 임계값, 데이터 버전별 캐시)"""
+    batter_kpi = load_data()
+    season_data = batter_kpi[batter_kpi['season'] == season]
+    if custom_weights is not None:
+        # 사용자 가중치로 카테고리/OVR 등급 교체
+        season_data = get_batter_regrade_engine().apply(season_data, *custom_weights)
+    return LeaderboardIndex(
+        season_data,
+        sort_columns=SORT_OPTIONS.values(),
+        bitmap_columns=['team_name'],
+        threshold_columns=['plate_appearances']
+    )
 
 
 def get_batter_type_display(batter_type):
@@ -98,6 +133,12 @@ def main():
         layout="wide"
     )
 
+    # 테이블 캐시 예열 (프로세스당 1회, 백그라운드)
+    warm_up()
+
+    # 이번 실행의 데이터 스냅샷 고정 (실행 중 데이터가 교체돼도 끝까지 같은 스냅샷 사용)
+    pin_snapshot()
+
     st.title("📊 타자 리더보드")
     st.markdown("KBO 타자들의 종합 능력치 순위입니다.")
 
@@ -124,54 +165,28 @@ def main():
         step=10
     )
 
+    # 사용자 가중치 (스카우팅 리포트와 공유)
+    custom_weights = render_weight_editor(get_batter_regrade_engine(), "batter_weights")
+
     # 팀 필터
-    season_data = batter_kpi[batter_kpi['season'] == selected_season]
-    teams = ['전체'] + sorted(season_data['team_name'].dropna().unique().tolist())
+    season_index = get_season_index(selected_season, custom_weights, data_version())
+    teams = ['전체'] + season_index.values('team_name')
     selected_team = st.sidebar.selectbox("팀", teams)
 
     # 정렬 기준
-    sort_options = {
-        '종합 (OVR)': 'overall_grade_weighted',
-        '컨택': 'contact_grade_weighted',
-        '홈런 파워': 'game_power_grade_weighted',
-        '갭 파워': 'gap_power_grade_weighted',
-        '선구안': 'discipline_grade_weighted',
-        '일관성': 'consistency_grade_weighted',
-        '클러치': 'clutch_grade_weighted',
-        'OPS': 'ops',
-        '타율': 'batting_average',
-        '홈런': 'home_runs'
-    }
-    selected_sort = st.sidebar.selectbox("정렬 기준", list(sort_options.keys()))
-    sort_column = sort_options[selected_sort]
+    selected_sort = st.sidebar.selectbox("정렬 기준", list(SORT_OPTIONS.keys()))
+    sort_column = SORT_OPTIONS[selected_sort]
 
     # 검색
     search_term = st.sidebar.text_input("선수 검색", placeholder="이름 입력...")
 
-    # 데이터 필터링
-    filtered_data = season_data.copy()
-
-    # 최소 타석 필터
-    if 'plate_appearances' in filtered_data.columns:
-        filtered_data = filtered_data[filtered_data['plate_appearances'] >= min_pa]
-
-    # 팀 필터
-    if selected_team != '전체':
-        filtered_data = filtered_data[filtered_data['team_name'] == selected_team]
-
-    # 검색 필터
-    if search_term:
-        filtered_data = filtered_data[
-            filtered_data['player_name'].str.contains(search_term, case=False, na=False)
-        ]
-
-    # 정렬
-    if sort_column in filtered_data.columns:
-        filtered_data = filtered_data.sort_values(sort_column, ascending=False, na_position='last')
-
-    # 순위 추가
-    filtered_data = filtered_data.reset_index(drop=True)
-    filtered_data['rank'] = range(1, len(filtered_data) + 1)
+    # 필터링 + 정렬 (최소 타석, 팀, 검색) - 시즌 인덱스 조회
+    filtered_data = season_index.query(
+        sort_column,
+        minimums={'plate_appearances': min_pa},
+        equals={'team_name': selected_team} if selected_team != '전체' else None,
+        name_query=search_term
+    )
 
     # 통계 표시
     col1, col2, col3, col4 = st.columns(4)
@@ -197,79 +212,11 @@ def main():
     if len(filtered_data) == 0:
         st.warning("조건에 맞는 선수가 없습니다.")
     else:
-        # 표시할 컬럼 선택
-        display_cols = ['rank', 'player_name', 'team_name']
-
-        # 능력치 등급 컬럼
-        grade_cols = [
-            ('overall_grade_weighted', 'overall_grade', 'OVR'),
-            ('contact_grade_weighted', 'contact_grade', '컨택'),
-            ('game_power_grade_weighted', 'game_power_grade', '홈런'),
-            ('gap_power_grade_weighted', 'gap_power_grade', '갭'),
-            ('discipline_grade_weighted', 'discipline_grade', '선구안'),
-            ('consistency_grade_weighted', 'consistency_grade', '일관성'),
-            ('clutch_grade_weighted', 'clutch_grade', '클러치'),
-        ]
-
-        # 전통 지표 컬럼
-        stat_cols = [
-            ('batting_average', '타율'),
-            ('ops', 'OPS'),
-            ('home_runs', 'HR'),
-            ('plate_appearances', 'PA'),
-        ]
-
-        # 데이터 준비
-        display_data = []
-        for _, row in filtered_data.iterrows():
-            player_row = {
-                '순위': int(row['rank']),
-                '선수': row['player_name'],
-                '팀': row['team_name'],
-            }
-
-            # 등급 추가
-            for weighted_col, base_col, display_name in grade_cols:
-                value = row.get(weighted_col)
-                if pd.isna(value):
-                    value = row.get(base_col)
-                player_row[display_name] = int(value) if pd.notna(value) else None
-
-            # 전통 지표 추가
-            player_row['타율'] = f"{row['batting_average']:.3f}" if pd.notna(row.get('batting_average')) else "-"
-            player_row['OPS'] = f"{row['ops']:.3f}" if pd.notna(row.get('ops')) else "-"
-            player_row['HR'] = int(row['home_runs']) if pd.notna(row.get('home_runs')) else "-"
-            player_row['PA'] = int(row['plate_appearances']) if pd.notna(row.get('plate_appearances')) else "-"
-
-            display_data.append(player_row)
-
-        df_display = pd.DataFrame(display_data)
-
-        # 스타일링 함수
-        def style_grade(val):
-            if pd.isna(val) or val is None:
-                return ''
-            try:
-                grade = int(val)
-                color = get_grade_color(grade)
-                return f'color: {color}; font-weight: bold'
-            except:
-                return ''
-
-        # 등급 컬럼에 스타일 적용
-        grade_columns = ['OVR', '컨택', '홈런', '갭', '선구안', '일관성', '클러치']
-
-        styled_df = df_display.style.applymap(
-            style_grade,
-            subset=grade_columns
-        )
-
-        # 테이블 표시
-        st.dataframe(
-            styled_df,
-            use_container_width=True,
-            height=600,
-            hide_index=True
+        # 현재 페이지만 표시 테이블 생성/표시
+        render_paginated_leaderboard(
+            filtered_data, LEADERBOARD_COLUMNS, "batter_leaderboard", GRADE_COLUMNS,
+            formats=STAT_FORMATS,
+            filter_state=(selected_season, min_pa, selected_team, sort_column, search_term, custom_weights)
         )
 
         # 등급 범례
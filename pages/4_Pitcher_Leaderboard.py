@@ -5,63 +5,96 @@ KBO Pitcher Leaderboard - 투수 리더보드
 
 import streamlit as st
 import pandas as pd
+import sys
 from pathlib import Path
 
-# 경로 설정
-DATA_DIR = Path(__file__).parent.parent / "data"
-
-
-def get_grade_color(grade):
-    """등급에 따른 색상 반환"""
-    if pd.isna(grade):
-        return "#9CA3AF"
-    grade = int(grade)
-    if grade >= 80:
-        return "#DC2626"  # Elite - Red
-    elif grade >= 70:
-        return "#7C3AED"  # Great - Purple
-    elif grade >= 60:
-        return "#2563EB"  # Above Average - Blue
-    elif grade >= 50:
-        return "#10B981"  # Average - Green
-    elif grade >= 40:
-        return "#F59E0B"  # Below Average - Yellow
-    else:
-        return "#9CA3AF"  # Poor - Gray
-
-
-def get_role_display(role):
-    """투수 역할 한글 표시"""
-    role_map = {
-        'Starter': '선발',
-        'Closer': '마무리',
-        'Setup': '셋업',
-        'Middle': '중계',
-        'Long': '롱릴리프',
-        'Unknown': '미정',
-        None: '미정'
-    }
-    return role_map.get(role, role or '미정')
-
-
-def get_role_color(role):
-    """투수 역할에 따른 색상"""
-    role_colors = {
-        'Starter': '#2563EB',    # Blue
-        'Closer': '#DC2626',     # Red
-        'Setup': '#7C3AED',      # Purple
-        'Middle': '#10B981',     # Green
-        'Long': '#F59E0B',       # Yellow
-    }
-    return role_colors.get(role, '#9CA3AF')
+# 상위 디렉토리 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.data_loader import get_pitcher_regrade_engine, load_pitcher_kpi, warm_up
+from utils.leaderboard import FLOAT, GRADE, INT, TEXT
+from utils.leaderboard_index import LeaderboardIndex
+from utils.leaderboard_view import render_paginated_leaderboard
+from utils.snapshot import data_version, pin_snapshot
+from utils.weight_editor import render_weight_editor
+
+# 투수 역할 한글 표시
+ROLE_DISPLAY = {
+    'Starter': '선발',
+    'Closer': '마무리',
+    'Setup': '셋업',
+    'Middle': '중계',
+    'Long': '롱릴리프',
+    'Unknown': '미정',
+}
+
+# 투수 역할 색상
+ROLE_COLORS = {
+    'Starter': '#2563EB',    # Blue
+    'Closer': '#DC2626',     # Red
+    'Setup': '#7C3AED',      # Purple
+    'Middle': '#10B981',     # Green
+    'Long': '#F59E0B',       # Yellow
+}
+
+# 리더보드 표시 컬럼 (표시 이름, source 컬럼, 종류)
+LEADERBOARD_COLUMNS = [
+    ('순위', 'rank', INT),
+    ('선수', 'player_name', TEXT),
+    ('팀', 'team_name', TEXT),
+    ('역할', 'role_display', TEXT),
+    ('OVR', 'overall_grade', GRADE),
+    ('제구', 'control_grade', GRADE),
+    ('공격성', 'aggression_grade', GRADE),
+    ('효율성', 'efficiency_grade', GRADE),
+    ('구위', 'stuff_grade', GRADE),
+    ('클러치', 'clutch_grade', GRADE),
+    ('경기', 'total_games', INT),
+    ('투구수', 'total_pitches', INT),
+    ('헛스윙%', 'whiff_pct', FLOAT),
+]
+GRADE_COLUMNS = [label for label, _, kind in LEADERBOARD_COLUMNS if kind == GRADE]
+STAT_FORMATS = {'헛스윙%': '{:.1f}'}
+ROLE_DISPLAY_COLORS = {ROLE_DISPLAY[role]: color for role, color in ROLE_COLORS.items()}
+
+# 정렬 기준 (표시 이름 → 컬럼)
+SORT_OPTIONS = {
+    '종합 (OVR)': 'overall_grade',
+    '제구력': 'control_grade',
+    '공격성': 'aggression_grade',
+    '효율성': 'efficiency_grade',
+    '구위': 'stuff_grade',
+    '클러치': 'clutch_grade',
+    '헛스윙 유도율': 'whiff_rate',
+    '체이스율': 'chase_rate',
+    '등판 수': 'total_games',
+    '투구 수': 'total_pitches'
+}
+
+
+def role_display_column(roles: pd.Series) -> pd.Series:
+    """역할 컬럼 전체를 한글 표시로 변환 (매핑 없는 값은 그대로, 결측은 '미정')"""
+    roles = roles.astype(object)
+    return roles.map(ROLE_DISPLAY).fillna(roles).fillna('미정')
+
+
+def whiff_pct_column(whiff: pd.Series) -> pd.Series:
+    """헛스윙 유도율을 % 단위로 (비율(<1)이면 100배)"""
+    whiff = pd.to_numeric(whiff, errors='coerce').astype('float64')
+    return whiff.where(whiff >= 1, whiff * 100)
+
+
+def add_display_columns(page_data: pd.DataFrame) -> pd.DataFrame:
+    """표시용 파생 컬럼 (역할 한글, 헛스윙%) 추가"""
+    return page_data.assign(
+        role_display=role_display_column(page_data['pitcher_role']) if 'pitcher_role' in page_data.columns else '미정',
+        whiff_pct=whiff_pct_column(page_data['whiff_rate']) if 'whiff_rate' in page_data.columns else float('nan')
+    )
 
 
-@st.cache_data
 def load_data():
-    """데이터 로드"""
-    pitcher_kpi = pd.read_parquet(DATA_DIR / "pitcher_kpi.parquet")
-
-    # 숫자형으로 변환
+    """리더보드 데이터 (공유 데이터셋의 읽기 전용 뷰, 필요한 컬럼만)"""
+    # 리더보드 숫자 컬럼
     numeric_cols = [
         'overall_grade', 'overall_percentile',
         'control_grade', 'aggression_grade', 'efficiency_grade',
@@ -71,11 +104,24 @@ def load_data():
         'avg_pitches_per_batter', 'k_per_9'
     ]
 
-    for col in numeric_cols:
-        if col in pitcher_kpi.columns:
-            pitcher_kpi[col] = pd.to_numeric(pitcher_kpi[col], errors='coerce')
+    # 리포트 페이지와 같은 캐시 원본을 공유 (다시 읽거나 정규화하지 않음)
+    return load_pitcher_kpi(['pitcher_pcode', 'season', 'player_name', 'team_name', 'pitcher_role'] + numeric_cols)
 
-    return pitcher_kpi
+
+@st.cache_resource(max_entries=32)
+def get_season_index(season, custom_weights=None, version=None) -> LeaderboardIndex:
+    """시즌별 리더보드 쿼리 인덱스 (정렬 순열, 팀/역할 bitmap, 투구수 임계값, 데이터 버전별 캐시)"""
+    pitcher_kpi = load_data()
+    season_data = pitcher_kpi[pitcher_kpi['season'] == season]
+    if custom_weights is not None:
+        # 사용자 가중치로 카테고리/OVR 등급 교체
+        season_data = get_pitcher_regrade_engine().apply(season_data, *custom_weights)
+    return LeaderboardIndex(
+        season_data,
+        sort_columns=SORT_OPTIONS.values(),
+        bitmap_columns=['team_name', 'pitcher_role'],
+        threshold_columns=['total_pitches']
+    )
 
 
 def main():
@@ -85,6 +131,12 @@ def main():
         layout="wide"
     )
 
+    # 테이블 캐시 예열 (프로세스당 1회, 백그라운드)
+    warm_up()
+
+    # 이번 실행의 데이터 스냅샷 고정 (실행 중 데이터가 교체돼도 끝까지 같은 스냅샷 사용)
+    pin_snapshot()
+
     st.title("📊 투수 리더보드")
     st.markdown("KBO 투수들의 종합 능력치 순위입니다.")
 
@@ -111,9 +163,12 @@ def main():
         step=50
     )
 
+    # 사용자 가중치 (스카우팅 리포트와 공유)
+    custom_weights = render_weight_editor(get_pitcher_regrade_engine(), "pitcher_weights")
+
     # 팀 필터
-    season_data = pitcher_kpi[pitcher_kpi['season'] == selected_season]
-    teams = ['전체'] + sorted(season_data['team_name'].dropna().unique().tolist())
+    season_index = get_season_index(selected_season, custom_weights, data_version())
+    teams = ['전체'] + season_index.values('team_name')
     selected_team = st.sidebar.selectbox("팀", teams)
 
     # 역할 필터
@@ -129,54 +184,25 @@ def main():
     selected_role = st.sidebar.selectbox("역할", roles)
 
     # 정렬 기준
-    sort_options = {
-        '종합 (OVR)': 'overall_grade',
-        '제구력': 'control_grade',
-        '공격성': 'aggression_grade',
-        '효율성': 'efficiency_grade',
-        '구위': 'stuff_grade',
-        '클러치': 'clutch_grade',
-        '헛스윙 유도율': 'whiff_rate',
-        '체이스율': 'chase_rate',
-        '등판 수': 'total_games',
-        '투구 수': 'total_pitches'
-    }
-    selected_sort = st.sidebar.selectbox("정렬 기준", list(sort_options.keys()))
-    sort_column = sort_options[selected_sort]
+    selected_sort = st.sidebar.selectbox("정렬 기준", list(SORT_OPTIONS.keys()))
+    sort_column = SORT_OPTIONS[selected_sort]
 
     # 검색
     search_term = st.sidebar.text_input("선수 검색", placeholder="이름 입력...")
 
-    # 데이터 필터링
-    filtered_data = season_data.copy()
-
-    # 최소 투구수 필터
-    if 'total_pitches' in filtered_data.columns:
-        filtered_data = filtered_data[filtered_data['total_pitches'] >= min_pitches]
-
-    # 팀 필터
+    # 필터링 + 정렬 (최소 투구수, 팀, 역할, 검색) - 시즌 인덱스 조회
+    equals = {}
     if selected_team != '전체':
-        filtered_data = filtered_data[filtered_data['team_name'] == selected_team]
-
-    # 역할 필터
+        equals['team_name'] = selected_team
     if selected_role != '전체':
-        role_value = role_map_reverse[selected_role]
-        if 'pitcher_role' in filtered_data.columns:
-            filtered_data = filtered_data[filtered_data['pitcher_role'] == role_value]
-
-    # 검색 필터
-    if search_term:
-        filtered_data = filtered_data[
-            filtered_data['player_name'].str.contains(search_term, case=False, na=False)
-        ]
-
-    # 정렬
-    if sort_column in filtered_data.columns:
-        filtered_data = filtered_data.sort_values(sort_column, ascending=False, na_position='last')
+        equals['pitcher_role'] = role_map_reverse[selected_role]
 
-    # 순위 추가
-    filtered_data = filtered_data.reset_index(drop=True)
-    filtered_data['rank'] = range(1, len(filtered_data) + 1)
+    filtered_data = season_index.query(
+        sort_column,
+        minimums={'total_pitches': min_pitches},
+        equals=equals,
+        name_query=search_term
+    )
 
     # 통계 표시
     col1, col2, col3, col4 = st.columns(4)
@@ -200,76 +226,14 @@ def main():
     if len(filtered_data) == 0:
         st.warning("조건에 맞는 투수가 없습니다.")
     else:
-        # 데이터 준비
-        display_data = []
-        for _, row in filtered_data.iterrows():
-            pitcher_row = {
-                '순위': int(row['rank']),
-                '선수': row['player_name'],
-                '팀': row['team_name'],
-                '역할': get_role_display(row.get('pitcher_role')),
-                'OVR': int(row['overall_grade']) if pd.notna(row.get('overall_grade')) else None,
-                '제구': int(row['control_grade']) if pd.notna(row.get('control_grade')) else None,
-                '공격성': int(row['aggression_grade']) if pd.notna(row.get('aggression_grade')) else None,
-                '효율성': int(row['efficiency_grade']) if pd.notna(row.get('efficiency_grade')) else None,
-                '구위': int(row['stuff_grade']) if pd.notna(row.get('stuff_grade')) else None,
-                '클러치': int(row['clutch_grade']) if pd.notna(row.get('clutch_grade')) else None,
-                '경기': int(row['total_games']) if pd.notna(row.get('total_games')) else "-",
-                '투구수': int(row['total_pitches']) if pd.notna(row.get('total_pitches')) else "-",
-            }
-
-            # 선택적 지표
-            if pd.notna(row.get('whiff_rate')):
-                pitcher_row['헛스윙%'] = f"{row['whiff_rate']*100:.1f}" if row['whiff_rate'] < 1 else f"{row['whiff_rate']:.1f}"
-            else:
-                pitcher_row['헛스윙%'] = "-"
-
-            display_data.append(pitcher_row)
-
-        df_display = pd.DataFrame(display_data)
-
-        # 스타일링 함수
-        def style_grade(val):
-            if pd.isna(val) or val is None:
-                return ''
-            try:
-                grade = int(val)
-                color = get_grade_color(grade)
-                return f'color: {color}; font-weight: bold'
-            except:
-                return ''
-
-        def style_role(val):
-            role_reverse = {
-                '선발': 'Starter',
-                '마무리': 'Closer',
-                '셋업': 'Setup',
-                '중계': 'Middle',
-                '롱릴리프': 'Long'
-            }
-            role_eng = role_reverse.get(val)
-            if role_eng:
-                color = get_role_color(role_eng)
-                return f'color: {color}; font-weight: bold'
-            return ''
-
-        # 등급 컬럼에 스타일 적용
-        grade_columns = ['OVR', '제구', '공격성', '효율성', '구위', '클러치']
-
-        styled_df = df_display.style.applymap(
-            style_grade,
-            subset=grade_columns
-        ).applymap(
-            style_role,
-            subset=['역할']
-        )
-
-        # 테이블 표시
-        st.dataframe(
-            styled_df,
-            use_container_width=True,
-            height=600,
-            hide_index=True
+        # 현재 페이지만 표시 테이블 생성/표시
+        render_paginated_leaderboard(
+            filtered_data, LEADERBOARD_COLUMNS, "pitcher_leaderboard", GRADE_COLUMNS,
+            formats=STAT_FORMATS,
+            color_columns={'역할': ROLE_DISPLAY_COLORS},
+            filter_state=(selected_season, min_pitches, selected_team, selected_role, sort_column, search_term,
+                          custom_weights),
+            prepare=add_display_columns
         )
 
         # 등급 범례
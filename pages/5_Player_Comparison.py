@@ -0,0 +1,238 @@
+"""
+선수 비교 페이지 - 최대 8명 레이더 차트 겹쳐 보기와 지표 나란히 비교
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# 상위 디렉토리 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.column_groups import GRADES, IDENTITY, METRICS, TRADITIONAL
+from utils.data_loader import (
+    get_batter_regrade_engine, get_batters_data, get_pitcher_regrade_engine, get_pitchers_data,
+    load_batter_group, load_pitcher_group, warm_up
+)
+from utils.figure_cache import cached_figure
+from utils.percentile import BATTER_LOWER_IS_BETTER, PITCHER_LOWER_IS_BETTER
+from utils.regrade import BATTER_CATEGORY_NAMES, BATTER_GRADE_COLUMN, PITCHER_CATEGORY_NAMES, PITCHER_GRADE_COLUMN
+from utils.snapshot import data_version, pin_snapshot
+from utils.startup import lazy_import
+from utils.weight_editor import get_custom_weights
+
+st.set_page_config(
+    page_title="선수 비교",
+    page_icon="⚖️",
+    layout="wide"
+)
+
+# 테이블 캐시 예열 (프로세스당 1회, 백그라운드)
+warm_up()
+
+# 이번 실행의 데이터 스냅샷 고정 (실행 중 데이터가 교체돼도 끝까지 같은 스냅샷 사용)
+pin_snapshot()
+
+MAX_PLAYERS = 8
+
+# 선수별 색상 (선택 순서)
+COMPARISON_COLORS = [
+    '#3B82F6', '#EF4444', '#10B981', '#F59E0B',
+    '#8B5CF6', '#EC4899', '#14B8A6', '#6B7280',
+]
+
+# 선수 유형별 설정
+PLAYER_KINDS = {
+    'batter': {
+        'label': '타자',
+        'pcode_col': 'batter_pcode',
+        'load_identity': lambda: load_batter_group(IDENTITY),
+        'fetch': get_batters_data,
+        'regrade_engine': get_batter_regrade_engine,
+        'weights_key': 'batter_weights',
+        'categories': BATTER_CATEGORY_NAMES,
+        'grade_column': BATTER_GRADE_COLUMN,
+        'lower_is_better': BATTER_LOWER_IS_BETTER,
+        # (표시 이름, 컬럼, 포맷)
+        'stats': [
+            ('타석', 'plate_appearances', '{:.0f}'),
+            ('타율', 'batting_average', '{:.3f}'),
+            ('출루율', 'on_base_percentage', '{:.3f}'),
+            ('장타율', 'slugging_percentage', '{:.3f}'),
+            ('OPS', 'ops', '{:.3f}'),
+            ('홈런', 'home_runs', '{:.0f}'),
+            ('볼넷율', 'walk_rate', '{:.1f}'),
+            ('삼진율', 'strikeout_rate', '{:.1f}'),
+            ('체이스율', 'chase_rate', '{:.1f}'),
+            ('득점권 타율', 'risp_average', '{:.3f}'),
+        ],
+    },
+    'pitcher': {
+        'label': '투수',
+        'pcode_col': 'pitcher_pcode',
+        'load_identity': lambda: load_pitcher_group(IDENTITY),
+        'fetch': get_pitchers_data,
+        'regrade_engine': get_pitcher_regrade_engine,
+        'weights_key': 'pitcher_weights',
+        'categories': PITCHER_CATEGORY_NAMES,
+        'grade_column': PITCHER_GRADE_COLUMN,
+        'lower_is_better': PITCHER_LOWER_IS_BETTER,
+        'stats': [
+            ('경기', 'total_games', '{:.0f}'),
+            ('이닝', 'total_innings_pitched', '{:.1f}'),
+            ('투구수', 'total_pitches', '{:.0f}'),
+            ('K/9', 'k_per_9', '{:.2f}'),
+            ('초구 스트라이크율', 'first_pitch_strike_rate', '{:.1%}'),
+            ('헛스윙 유도율', 'whiff_rate', '{:.1%}'),
+            ('체이스율', 'chase_rate', '{:.1%}'),
+            ('타자당 투구수', 'avg_pitches_per_batter', '{:.2f}'),
+            ('평균 구속', 'avg_fastball_velocity', '{:.1f}'),
+        ],
+    },
+}
+
+
+def fetch_players(kind: str, keys: tuple, custom_weights=None) -> pd.DataFrame:
+    """선택 선수-시즌 데이터 (한 번의 take, 사용자 가중치가 있으면 등급 재계산)"""
+    config = PLAYER_KINDS[kind]
+    players = config['fetch'](keys, groups=[GRADES, TRADITIONAL, METRICS])
+    if custom_weights is not None:
+        players = config['regrade_engine']().apply(players, *custom_weights)
+    return players
+
+
+@st.cache_data(max_entries=8)
+def get_player_options(kind: str, version=None):
+    """
+    선수-시즌 선택지 'pcode:season' (최신 시즌, 이름순)와 표시 이름 (데이터 버전별 캐시)
+
+    표시 이름 '이름 (팀, 시즌)'이 겹치는 선수(동명이인)는 pcode를 붙여 구분
+    """
+    config = PLAYER_KINDS[kind]
+    identity = config['load_identity']()
+    ordered = identity.iloc[np.lexsort((identity['player_name'].astype(str).to_numpy(), -identity['season'].to_numpy()))]
+
+    pcodes = ordered[config['pcode_col']].astype(str)
+    seasons = ordered['season'].astype(str)
+    options = (pcodes + ':' + seasons).tolist()
+    teams = ordered['team_name'].astype(object).fillna('-').astype(str)
+    names = ordered['player_name'].astype(str) + ' (' + teams + ', ' + seasons
+    names = names.where(~names.duplicated(keep=False), names + ', #' + pcodes) + ')'
+    return options, dict(zip(options, names.tolist()))
+
+
+def build_comparison_radar(kind: str, players: pd.DataFrame, labels: list):
+    """선택한 선수들의 레이더 차트 (선택 순서대로 색상, labels는 선수별 표시 이름)"""
+    go = lazy_import("plotly.graph_objects")
+    config = PLAYER_KINDS[kind]
+    categories = config['categories']
+    theta = list(categories.values()) + [next(iter(categories.values()))]
+
+    fig = go.Figure()
+    for i, ((_, row), label) in enumerate(zip(players.iterrows(), labels)):
+        values = []
+        for category in categories:
+            value = row.get(config['grade_column'].format(category))
+            if pd.isna(value):
+                value = row.get(f'{category}_grade', 50)
+            values.append(50 if pd.isna(value) else float(value))
+        values.append(values[0])
+
+        color = COMPARISON_COLORS[i % len(COMPARISON_COLORS)]
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=theta,
+            fill='toself',
+            name=label,
+            opacity=0.6,
+            line=dict(color=color, width=2)
+        ))
+
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[20, 80])),
+        showlegend=True,
+        legend=dict(orientation='h', yanchor='top', y=-0.1),
+        height=520
+    )
+    return fig
+
+
+def build_comparison_table(kind: str, players: pd.DataFrame, labels: list):
+    """지표 × 선수 비교 표 (행별 최고값 강조, 낮을수록 좋은 지표는 최저값, labels는 겹치지 않는 선수별 표시 이름)"""
+    config = PLAYER_KINDS[kind]
+    rows = [(name, config['grade_column'].format(category), '{:.0f}') for category, name in config['categories'].items()]
+    rows.append(('OVR', config['grade_column'].format('overall'), '{:.0f}'))
+    rows += config['stats']
+    rows = [(name, col, fmt) for name, col, fmt in rows if col in players.columns]
+
+    values = np.array([
+        pd.to_numeric(players[col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        for _, col, _ in rows
+    ])
+    table = pd.DataFrame(values, index=[name for name, _, _ in rows], columns=labels)
+
+    # 행별 최고값 (낮을수록 좋은 지표는 부호를 뒤집어 비교)
+    sign = np.array([-1.0 if col in config['lower_is_better'] else 1.0 for _, col, _ in rows])[:, None]
+    scored = values * sign
+    with np.errstate(invalid='ignore'):
+        best = np.isfinite(scored) & (scored == np.nanmax(np.where(np.isnan(scored), -np.inf, scored), axis=1, keepdims=True))
+    styles = pd.DataFrame(np.where(best, 'font-weight: bold; color: #2563EB', ''), index=table.index, columns=labels)
+
+    display = pd.DataFrame([
+        ['-' if np.isnan(value) else fmt.format(value) for value in row]
+        for (_, _, fmt), row in zip(rows, values)
+    ], index=table.index, columns=labels)
+    return display.style.apply(lambda _: styles, axis=None)
+
+
+st.title("⚖️ 선수 비교")
+
+# 사이드바 - 선수 유형 및 선수 선택
+with st.sidebar:
+    st.header("비교 선수 선택")
+
+    kind = st.radio(
+        "선수 유형",
+        list(PLAYER_KINDS.keys()),
+        format_func=lambda k: PLAYER_KINDS[k]['label'],
+        horizontal=True
+    )
+    config = PLAYER_KINDS[kind]
+
+    options, labels = get_player_options(kind, data_version())
+
+    selected = st.multiselect(
+        f"선수-시즌 (최대 {MAX_PLAYERS}명)",
+        options,
+        format_func=labels.get,
+        max_selections=MAX_PLAYERS,
+        placeholder="이름으로 검색",
+        key=f"comparison_{kind}_players"
+    )
+
+if not selected:
+    st.info(f"사이드바에서 비교할 {config['label']}를 선택하세요. (최대 {MAX_PLAYERS}명)")
+    st.stop()
+
+# 선택 순서 그대로 (pcode, season) 키
+keys = tuple((option.rsplit(':', 1)[0], int(option.rsplit(':', 1)[1])) for option in selected)
+custom_weights = get_custom_weights(config['weights_key'])
+if custom_weights is not None:
+    st.caption("⚖️ 사용자 가중치로 재계산한 등급")
+
+players = fetch_players(kind, keys, custom_weights)
+player_names = [labels[option] for option in selected]
+
+# 레이더 차트 (선택 선수 조합/가중치별 figure 캐시)
+st.subheader("카테고리별 평가")
+radar = cached_figure(f"{kind}_comparison_radar", (keys, None, custom_weights, data_version()), lambda: build_comparison_radar(kind, players, player_names))
+st.plotly_chart(radar, width="stretch")
+
+st.divider()
+
+# 지표 나란히 비교
+st.subheader("지표 비교")
+st.dataframe(build_comparison_table(kind, players, player_names), width="stretch")
+st.caption("파란색 굵은 글씨: 선택한 선수 중 가장 좋은 값")
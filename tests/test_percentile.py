@@ -0,0 +1,59 @@
+"""
+기본 집단('all') 백분위가 저장된 *_percentile 컬럼과 같은지, 집단 크기가 데이터와 맞는지 확인
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.column_groups import IDENTITY, PERCENTILES
+from utils.data_loader import (
+    get_batter_percentile_engine, get_pitcher_percentile_engine, load_batter_group, load_pitcher_group
+)
+from utils.percentile import RELIEVER_ROLES, STARTER_ROLES, STORED_COHORT
+from utils.registry import PITCHER_KPI_PATH
+
+KINDS = [
+    ('batter_pcode', get_batter_percentile_engine, load_batter_group),
+    ('pitcher_pcode', get_pitcher_percentile_engine, load_pitcher_group),
+]
+
+
+@pytest.mark.parametrize('pcode_col, get_engine, load_group', KINDS)
+def test_default_cohort_matches_stored_percentiles(pcode_col, get_engine, load_group):
+    engine = get_engine()
+    identity = load_group(IDENTITY)
+    stored = load_group(PERCENTILES)
+    metrics = [col for col in engine.metrics if f'{col}_percentile' in stored.columns]
+    assert metrics
+
+    expected = stored[[f'{col}_percentile' for col in metrics]].apply(pd.to_numeric, errors='coerce')
+    expected = expected.to_numpy(dtype='float64', na_value=np.nan)
+    actual = np.array([
+        engine.rank_player(pcode, season, STORED_COHORT, metrics).to_numpy(dtype='float64')
+        for pcode, season in zip(identity[pcode_col], identity['season'])
+    ])
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('pcode_col, get_engine, load_group', KINDS)
+def test_default_cohort_excludes_rows_without_stored_percentile(pcode_col, get_engine, load_group):
+    engine = get_engine()
+    identity = load_group(IDENTITY)
+    has_stored = load_group(PERCENTILES).notna().any(axis=1).to_numpy()
+    for season in identity['season'].unique():
+        rows = (identity['season'] == season).to_numpy()
+        assert engine.cohort_size(season, STORED_COHORT) == int((rows & has_stored).sum())
+
+
+@pytest.mark.parametrize('cohort, roles', [('starters', STARTER_ROLES), ('relievers', RELIEVER_ROLES)])
+def test_pitcher_role_cohort_sizes_match_data(cohort, roles):
+    engine = get_pitcher_percentile_engine()
+    raw = pd.read_parquet(PITCHER_KPI_PATH, columns=['season', 'pitcher_role', 'role_type'])
+    # role_type이 있으면 role_type, 없으면 pitcher_role
+    role = raw['role_type'].where(raw['role_type'].notna(), raw['pitcher_role'])
+    in_cohort = role.isin(roles)
+    assert in_cohort.sum() > raw['pitcher_role'].isin(roles).sum()
+    for season in raw['season'].unique():
+        expected = int((in_cohort & (raw['season'] == season)).sum())
+        assert engine.cohort_size(season, cohort) == expected
@@ -0,0 +1,87 @@
+"""
+KPI 테이블 컬럼 그룹 정의
+
+타자 242개, 투수 172개 컬럼을 용도별 그룹으로 나눠
+필요한 그룹만 pyarrow 컬럼 프로젝션으로 읽을 수 있도록 함
+"""
+
+import pyarrow.parquet as pq
+
+# 그룹 이름 (로드 순서)
+IDENTITY = 'identity'
+GRADES = 'grades'
+TRADITIONAL = 'traditional'
+METRICS = 'metrics'
+PERCENTILES = 'percentiles'
+
+GROUP_NAMES = [IDENTITY, GRADES, TRADITIONAL, METRICS, PERCENTILES]
+
+# 리포트 요약(헤더, 레이더 차트, 시즌 성적)에 필요한 그룹
+SUMMARY_GROUPS = [IDENTITY, GRADES, TRADITIONAL]
+
+# 상세 지표 탭에 필요한 그룹 (타율 등 일부 세부 지표는 전통 기록 그룹에 있음)
+DETAIL_GROUPS = [IDENTITY, GRADES, TRADITIONAL, METRICS, PERCENTILES]
+
+BATTER_IDENTITY = [
+    'batter_pcode', 'season', 'player_name', 'team_name', 'team_code',
+    'batter_type', 'batter_type_desc',
+]
+
+BATTER_CATEGORIES = [
+    'overall', 'contact', 'power', 'game_power', 'gap_power',
+    'discipline', 'consistency', 'clutch', 'baserunning',
+]
+
+BATTER_TRADITIONAL = [
+    'plate_appearances', 'at_bats', 'hits', 'doubles', 'triples', 'home_runs',
+    'rbi', 'walks', 'strikeouts', 'batting_average', 'on_base_percentage',
+    'slugging_percentage', 'ops', 'woba',
+]
+
+PITCHER_IDENTITY = [
+    'pitcher_pcode', 'season', 'player_name', 'team_name', 'team_code',
+    'pitcher_role', 'role_type',
+]
+
+PITCHER_CATEGORIES = [
+    'overall', 'control', 'aggression', 'efficiency', 'stuff', 'clutch',
+]
+
+PITCHER_TRADITIONAL = [
+    'total_games', 'total_pa', 'total_pitches', 'total_innings_pitched',
+    'innings_pitched', 'strikeouts', 'walks', 'k_per_9',
+]
+
+COLUMN_SPECS = {
+    'batter': (BATTER_IDENTITY, BATTER_CATEGORIES, BATTER_TRADITIONAL),
+    'pitcher': (PITCHER_IDENTITY, PITCHER_CATEGORIES, PITCHER_TRADITIONAL),
+}
+
+
+def classify_columns(columns: list, kind: str) -> dict:
+    """컬럼 목록을 그룹별로 분류 (모든 컬럼은 정확히 한 그룹에 속함)"""
+    identity, categories, traditional = COLUMN_SPECS[kind]
+    category_grades = set()
+    for category in categories:
+        category_grades.add(f'{category}_grade')
+        category_grades.add(f'{category}_grade_weighted')
+
+    groups = {name: [] for name in GROUP_NAMES}
+    for col in columns:
+        if col in identity:
+            groups[IDENTITY].append(col)
+        elif col in category_grades:
+            groups[GRADES].append(col)
+        elif col in traditional:
+            groups[TRADITIONAL].append(col)
+        elif col.endswith('_percentile'):
+            groups[PERCENTILES].append(col)
+        else:
+            groups[METRICS].append(col)
+
+    return groups
+
+
+def read_column_groups(path, kind: str) -> dict:
+    """parquet 스키마(메타데이터)만 읽어 컬럼 그룹 구성"""
+    return classify_columns(pq.read_schema(path).names, kind)
@@ -0,0 +1,195 @@
+"""
+스키마 기반 압축 JSON 포맷
+
+기본 내보내기 JSON은 선수-시즌마다 메트릭 "key"/"name"/"weight" 문자열을 반복하므로,
+메트릭 정의와 필드 이름은 schema 블록에 한 번만 쓰고 선수 데이터는 위치 기반 배열로 저장
+- 등급은 정수, 메트릭 값은 ×1000 정수로 양자화 (소수점 3자리 값과 동일하게 복원됨)
+- decode_compact()로 기존 내보내기 구조를 그대로 복원
+
+사용 예:
+    from utils.compact_format import read_compact
+    data = read_compact("export/kbo_scouting_data.compact.json")
+"""
+
+import gzip
+import json
+
+FORMAT_NAME = "kbo-scouting-compact"
+FORMAT_VERSION = 1
+
+# 메트릭 값 양자화 배율 (내보내기 값은 소수점 3자리)
+VALUE_SCALE = 1000
+
+BATTER_INDEX_FIELDS = ["name", "team", "position", "hand", "seasons"]
+PITCHER_INDEX_FIELDS = ["name", "team", "position", "hand", "role", "seasons"]
+
+
+def _flatten_fields(record: dict, prefix: str = "") -> list:
+    """metrics를 제외한 중첩 dict를 점 경로 필드 목록으로 (순서 유지)"""
+    fields = []
+    for key, value in record.items():
+        if key == "metrics":
+            continue
+        if isinstance(value, dict):
+            fields.extend(_flatten_fields(value, f"{prefix}{key}."))
+        else:
+            fields.append(f"{prefix}{key}")
+    return fields
+
+
+def _get_path(record: dict, path: str):
+    for part in path.split("."):
+        record = record[part]
+    return record
+
+
+def _quantize(value):
+    return None if value is None else int(round(value * VALUE_SCALE))
+
+
+def _dequantize(value):
+    return None if value is None else value / VALUE_SCALE
+
+
+def _first_player(kpi: dict):
+    for players in kpi.values():
+        for player in players.values():
+            return player
+    return None
+
+
+def build_player_schema(kpi: dict, metric_definitions: dict) -> dict:
+    """선수 KPI 스키마 (스칼라 필드 경로 + 메트릭 정의)"""
+    sample = _first_player(kpi)
+    return {
+        "fields": _flatten_fields(sample) if sample else [],
+        "metrics": {
+            category: [[key, name, weight] for key, name, weight in metrics]
+            for category, metrics in metric_definitions.items()
+        },
+    }
+
+
+def encode_player(player: dict, schema: dict) -> list:
+    """선수 KPI dict → [스칼라 필드..., 메트릭 값(×1000)..., 메트릭 등급...]"""
+    row = [_get_path(player, path) for path in schema["fields"]]
+
+    values = []
+    grades = []
+    for category, metrics in schema["metrics"].items():
+        present = {entry["key"]: entry for entry in player["metrics"].get(category, [])}
+        for key, _, _ in metrics:
+            entry = present.get(key)
+            values.append(_quantize(entry["value"]) if entry else None)
+            grades.append(entry["grade"] if entry else None)
+
+    return row + values + grades
+
+
+def decode_player(row: list, schema: dict) -> dict:
+    """encode_player의 역변환"""
+    fields = schema["fields"]
+    player = {}
+    for path, value in zip(fields, row):
+        target = player
+        parts = path.split(".")
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+
+    metric_count = sum(len(metrics) for metrics in schema["metrics"].values())
+    values = row[len(fields):len(fields) + metric_count]
+    grades = row[len(fields) + metric_count:]
+
+    player["metrics"] = {}
+    pos = 0
+    for category, metrics in schema["metrics"].items():
+        entries = []
+        for key, name, weight in metrics:
+            if values[pos] is not None:
+                entries.append({
+                    "key": key,
+                    "name": name,
+                    "value": _dequantize(values[pos]),
+                    "grade": grades[pos],
+                    "weight": weight
+                })
+            pos += 1
+        player["metrics"][category] = entries
+
+    return player
+
+
+def encode_compact(data: dict, batter_definitions: dict, pitcher_definitions: dict) -> dict:
+    """내보내기 데이터 → 압축 포맷"""
+    schema = {
+        "batters": {
+            "index_fields": BATTER_INDEX_FIELDS,
+            **build_player_schema(data["batters"]["kpi"], batter_definitions),
+        },
+        "pitchers": {
+            "index_fields": PITCHER_INDEX_FIELDS,
+            **build_player_schema(data["pitchers"]["kpi"], pitcher_definitions),
+        },
+    }
+
+    compact = {
+        "format": FORMAT_NAME,
+        "format_version": FORMAT_VERSION,
+        "value_scale": VALUE_SCALE,
+        "metadata": data["metadata"],
+        "teams": data["teams"],
+        "schema": schema,
+    }
+    for kind in ["batters", "pitchers"]:
+        kind_schema = schema[kind]
+        compact[kind] = {
+            "index": {
+                pcode: [info.get(field) for field in kind_schema["index_fields"]]
+                for pcode, info in data[kind]["index"].items()
+            },
+            "kpi": {
+                season: {pcode: encode_player(player, kind_schema) for pcode, player in players.items()}
+                for season, players in data[kind]["kpi"].items()
+            },
+        }
+    compact["team_comparison"] = data["team_comparison"]
+    compact["leaderboards"] = data["leaderboards"]
+
+    return compact
+
+
+def decode_compact(compact: dict) -> dict:
+    """압축 포맷 → 기존 내보내기 구조"""
+    if compact.get("format") != FORMAT_NAME:
+        raise ValueError(f"Not a {FORMAT_NAME} document")
+    if compact.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format_version: {compact.get('format_version')}")
+
+    data = {
+        "metadata": compact["metadata"],
+        "teams": compact["teams"],
+    }
+    for kind in ["batters", "pitchers"]:
+        kind_schema = compact["schema"][kind]
+        data[kind] = {
+            "index": {
+                pcode: dict(zip(kind_schema["index_fields"], row))
+                for pcode, row in compact[kind]["index"].items()
+            },
+            "kpi": {
+                season: {pcode: decode_player(row, kind_schema) for pcode, row in players.items()}
+                for season, players in compact[kind]["kpi"].items()
+            },
+        }
+    data["team_comparison"] = compact["team_comparison"]
+    data["leaderboards"] = compact["leaderboards"]
+
+    return data
+
+
+def read_compact(path) -> dict:
+    """압축 포맷 파일(.json 또는 .json.gz)을 읽어 기존 구조로 복원"""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return decode_compact(json.load(f))
@@ -1,134 +1,303 @@
 """
 데이터 로딩 유틸리티
+
+테이블과 인덱스는 데이터 스냅샷별로 캐시 (data/*.parquet가 바뀌면 백그라운드에서
+새 스냅샷을 만든 뒤 교체, utils/snapshot.py)
 """
 
+import functools
+
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
-from pathlib import Path
 
-DATA_DIR = Path(__file__).parent.parent / "data"
+from utils.column_groups import GRADES, GROUP_NAMES, IDENTITY, METRICS, PERCENTILES, TRADITIONAL
+from utils.percentile import (
+    BATTER_COHORTS, BATTER_LOWER_IS_BETTER, PITCHER_COHORTS, PITCHER_LOWER_IS_BETTER, PercentileEngine
+)
+from utils.player_index import PlayerIndex
+from utils.registry import (
+    BATTER_KPI_PATH, PITCHER_KPI_PATH, PLAYERS_PATH, TEAMS_PATH,
+    get_column_groups, load_frame, view
+)
+from utils.regrade import (
+    BATTER_CATEGORY_NAMES, BATTER_GRADE_COLUMN, BATTER_METRIC_WEIGHTS,
+    PITCHER_CATEGORY_NAMES, PITCHER_GRADE_COLUMN, PITCHER_METRIC_WEIGHTS, RegradeEngine
+)
+from utils.search_index import build_search_indexes, search
+from utils.similarity import CATEGORY, SIMILARITY_FEATURES, SimilarityIndex, similarity_score
+from utils.snapshot import current_snapshot, snapshot_resource, start_watcher
+from utils.startup import RELOAD, read_parquet_summary, run_concurrently, start_warmup
 
-@st.cache_data
-def load_batter_kpi():
-    """타자 KPI 데이터 로드"""
-    return pd.read_parquet(DATA_DIR / "batter_kpi.parquet")
+def load_batter_kpi(columns=None):
+    """타자 KPI 데이터 (공유 레지스트리의 읽기 전용 뷰, columns 지정 시 해당 컬럼만)"""
+    return view('batter_kpi', columns)
 
-@st.cache_data
-def load_pitcher_kpi():
-    """투수 KPI 데이터 로드"""
-    return pd.read_parquet(DATA_DIR / "pitcher_kpi.parquet")
+def load_pitcher_kpi(columns=None):
+    """투수 KPI 데이터 (공유 레지스트리의 읽기 전용 뷰, columns 지정 시 해당 컬럼만)"""
+    return view('pitcher_kpi', columns)
 
-@st.cache_data
 def load_players():
-    """선수 정보 로드"""
-    return pd.read_parquet(DATA_DIR / "players.parquet")
+    """선수 정보 (읽기 전용 뷰)"""
+    return view('players')
 
-@st.cache_data
 def load_teams():
-    """팀 정보 로드"""
-    return pd.read_parquet(DATA_DIR / "teams.parquet")
+    """팀 정보 (읽기 전용 뷰)"""
+    return view('teams')
 
-def get_batter_list(season: int):
-    """특정 시즌의 타자 목록"""
-    df = load_batter_kpi()
-    batters = df[df['season'] == season][['batter_pcode', 'player_name', 'team_name']].drop_duplicates()
-    return batters.sort_values('player_name')
+@snapshot_resource
+def get_dataset_summary():
+    """테이블별 행 수와 시즌 범위 (parquet 메타데이터만 읽음)"""
+    return {
+        'batter_kpi': read_parquet_summary(BATTER_KPI_PATH),
+        'pitcher_kpi': read_parquet_summary(PITCHER_KPI_PATH),
+        'players': read_parquet_summary(PLAYERS_PATH),
+        'teams': read_parquet_summary(TEAMS_PATH),
+    }
 
-def get_pitcher_list(season: int):
-    """특정 시즌의 투수 목록"""
-    df = load_pitcher_kpi()
-    pitchers = df[df['season'] == season][['pitcher_pcode', 'player_name', 'team_name']].drop_duplicates()
-    return pitchers.sort_values('player_name')
+def _read_seasons(path):
+    """season 컬럼만 읽어 시즌 목록 (최신순)"""
+    seasons = pq.read_table(path, columns=['season']).column('season').unique().to_pylist()
+    return sorted((int(season) for season in seasons if season is not None), reverse=True)
 
-def search_batters(season: int, query: str):
-    """타자 검색 (2글자 이상)"""
-    if len(query) < 2:
-        return pd.DataFrame()
+@snapshot_resource
+def get_batter_seasons():
+    """타자 데이터의 시즌 목록 (최신순)"""
+    return _read_seasons(BATTER_KPI_PATH)
 
-    df = load_batter_kpi()
-    players = load_players()
+@snapshot_resource
+def get_pitcher_seasons():
+    """투수 데이터의 시즌 목록 (최신순)"""
+    return _read_seasons(PITCHER_KPI_PATH)
 
-    # 시즌 필터링
-    batters = df[df['season'] == season][['batter_pcode', 'player_name', 'team_name']].drop_duplicates()
+def get_batter_column_groups():
+    """타자 KPI 컬럼 그룹 (parquet 스키마 기반)"""
+    return get_column_groups('batter_kpi')
 
-    # 이름 검색
-    results = batters[batters['player_name'].str.contains(query, na=False)]
+def get_pitcher_column_groups():
+    """투수 KPI 컬럼 그룹 (parquet 스키마 기반)"""
+    return get_column_groups('pitcher_kpi')
 
-    # 선수 정보(투타) 조인
-    results = results.merge(
-        players[['pcode', 'phand', 'stand']],
-        left_on='batter_pcode',
-        right_on='pcode',
-        how='left'
-    )
+def load_batter_group(group: str):
+    """타자 KPI 컬럼 그룹 (공유 캐시 원본, 읽기 전용으로 사용)"""
+    return load_frame('batter_kpi', group)
 
-    # 투타 정보로 표시 이름 생성 (동명이인 구분)
-    def make_display_name(row):
-        name = row['player_name']
-        phand = row.get('phand', '')
-        stand = row.get('stand', '')
+def load_pitcher_group(group: str):
+    """투수 KPI 컬럼 그룹 (공유 캐시 원본, 읽기 전용으로 사용)"""
+    return load_frame('pitcher_kpi', group)
 
-        if pd.notna(phand) and pd.notna(stand):
-            hand_info = f"{phand}투{stand}타"
-            return f"{name} ({hand_info})"
-        return name
+def _take_groups(load_group, groups, positions):
+    """컬럼 그룹들에서 같은 행 위치를 가져와 합침 (정수 → Series, 배열 → DataFrame)"""
+    if groups is None:
+        groups = GROUP_NAMES
+    elif IDENTITY not in groups:
+        groups = [IDENTITY] + list(groups)
+    parts = [load_group(group).iloc[positions] for group in groups]
+    if len(parts) == 1:
+        return parts[0]
+    return pd.concat(parts, axis=1 if parts[0].ndim == 2 else 0)
 
-    results['display_name'] = results.apply(make_display_name, axis=1)
+@snapshot_resource
+def get_batter_index():
+    """타자 (pcode, season) 인덱스 (스냅샷당 1회 생성)"""
+    return PlayerIndex(load_batter_group(IDENTITY), 'batter_pcode')
 
-    return results.sort_values('player_name')
+@snapshot_resource
+def get_pitcher_index():
+    """투수 (pcode, season) 인덱스 (스냅샷당 1회 생성)"""
+    return PlayerIndex(load_pitcher_group(IDENTITY), 'pitcher_pcode')
 
-def search_pitchers(season: int, query: str):
-    """투수 검색 (2글자 이상)"""
-    if len(query) < 2:
-        return pd.DataFrame()
+@snapshot_resource
+def get_batter_search_index():
+    """시즌별 타자 이름 검색 인덱스"""
+    return build_search_indexes(load_batter_group(IDENTITY), load_players(), 'batter_pcode')
 
-    df = load_pitcher_kpi()
-    players = load_players()
+@snapshot_resource
+def get_pitcher_search_index():
+    """시즌별 투수 이름 검색 인덱스"""
+    return build_search_indexes(load_pitcher_group(IDENTITY), load_players(), 'pitcher_pcode')
 
-    # 시즌 필터링
-    pitchers = df[df['season'] == season][['pitcher_pcode', 'player_name', 'team_name']].drop_duplicates()
+@snapshot_resource
+def get_batter_percentile_engine():
+    """타자 집단별 백분위 엔진 (전통 지표 + 세부 지표, 기본 집단은 저장 백분위)"""
+    df = _take_groups(load_batter_group, [TRADITIONAL, METRICS], slice(None))
+    metrics = get_batter_column_groups()[TRADITIONAL] + get_batter_column_groups()[METRICS]
+    return PercentileEngine(
+        df, 'batter_pcode', metrics, BATTER_COHORTS, BATTER_LOWER_IS_BETTER, stored=load_batter_group(PERCENTILES)
+    )
+
+@snapshot_resource
+def get_pitcher_percentile_engine():
+    """투수 집단별 백분위 엔진 (전통 지표 + 세부 지표, 기본 집단은 저장 백분위)"""
+    df = _take_groups(load_pitcher_group, [TRADITIONAL, METRICS], slice(None))
+    metrics = get_pitcher_column_groups()[TRADITIONAL] + get_pitcher_column_groups()[METRICS]
+    return PercentileEngine(
+        df, 'pitcher_pcode', metrics, PITCHER_COHORTS, PITCHER_LOWER_IS_BETTER, stored=load_pitcher_group(PERCENTILES)
+    )
+
+@snapshot_resource
+def get_batter_regrade_engine():
+    """타자 사용자 가중치 재등급 엔진 (세부 지표 등급 행렬)"""
+    df = _take_groups(load_batter_group, [METRICS], slice(None))
+    return RegradeEngine(df, 'batter_pcode', BATTER_METRIC_WEIGHTS, BATTER_CATEGORY_NAMES, BATTER_GRADE_COLUMN)
 
-    # 이름 검색
-    results = pitchers[pitchers['player_name'].str.contains(query, na=False)]
+@snapshot_resource
+def get_pitcher_regrade_engine():
+    """투수 사용자 가중치 재등급 엔진 (세부 지표 등급 행렬)"""
+    df = _take_groups(load_pitcher_group, [METRICS], slice(None))
+    return RegradeEngine(df, 'pitcher_pcode', PITCHER_METRIC_WEIGHTS, PITCHER_CATEGORY_NAMES, PITCHER_GRADE_COLUMN)
 
-    # 선수 정보(투타) 조인
-    results = results.merge(
-        players[['pcode', 'phand', 'stand']],
-        left_on='pitcher_pcode',
-        right_on='pcode',
-        how='left'
+def _similarity_features(df, features, category_names, column_format, metric_columns):
+    """유사도 계산 컬럼 (카테고리 등급: 가중 등급이 없으면 기본 등급, 세부 지표 등급: 지표 그룹의 *_grade)"""
+    if features == CATEGORY:
+        return pd.DataFrame({
+            category: df[column_format.format(category)].fillna(df[f'{category}_grade'])
+            for category in category_names
+        })
+    return df[[col for col in metric_columns if col.endswith('_grade')]]
+
+@snapshot_resource
+def get_batter_similarity_index(features: str = CATEGORY):
+    """타자 유사 선수 인덱스 (features: CATEGORY 또는 METRIC)"""
+    df = _take_groups(load_batter_group, [GRADES, METRICS], slice(None))
+    features_df = _similarity_features(
+        df, features, BATTER_CATEGORY_NAMES, BATTER_GRADE_COLUMN, get_batter_column_groups()[METRICS]
     )
+    return SimilarityIndex(df, features_df, 'batter_pcode')
 
-    # 투타 정보로 표시 이름 생성 (동명이인 구분)
-    def make_display_name(row):
-        name = row['player_name']
-        phand = row.get('phand', '')
-        stand = row.get('stand', '')
+@snapshot_resource
+def get_pitcher_similarity_index(features: str = CATEGORY):
+    """투수 유사 선수 인덱스 (features: CATEGORY 또는 METRIC)"""
+    df = _take_groups(load_pitcher_group, [GRADES, METRICS], slice(None))
+    features_df = _similarity_features(
+        df, features, PITCHER_CATEGORY_NAMES, PITCHER_GRADE_COLUMN, get_pitcher_column_groups()[METRICS]
+    )
+    return SimilarityIndex(df, features_df, 'pitcher_pcode')
 
-        if pd.notna(phand) and pd.notna(stand):
-            hand_info = f"{phand}투{stand}타"
-            return f"{name} ({hand_info})"
-        return name
+def get_similar_batters(batter_pcode: str, season: int, k: int = 10, features: str = CATEGORY):
+    """가장 비슷한 타자-시즌 k개 (identity + 등급 + 'similarity', 선수가 없으면 None)"""
+    found = get_batter_similarity_index(features).neighbor_positions(batter_pcode, season, k)
+    if found is None:
+        return None
+    positions, distances = found
+    result = _take_groups(load_batter_group, [GRADES], positions).reset_index(drop=True)
+    result['similarity'] = similarity_score(distances)
+    return result
+
+def get_similar_pitchers(pitcher_pcode: str, season: int, k: int = 10, features: str = CATEGORY):
+    """가장 비슷한 투수-시즌 k개 (identity + 등급 + 'similarity', 선수가 없으면 None)"""
+    found = get_pitcher_similarity_index(features).neighbor_positions(pitcher_pcode, season, k)
+    if found is None:
+        return None
+    positions, distances = found
+    result = _take_groups(load_pitcher_group, [GRADES], positions).reset_index(drop=True)
+    result['similarity'] = similarity_score(distances)
+    return result
 
-    results['display_name'] = results.apply(make_display_name, axis=1)
+def _prepare_batter():
+    """타자 테이블(모든 컬럼 그룹)과 인덱스 생성"""
+    for group in GROUP_NAMES:
+        load_batter_group(group)
+    get_batter_seasons()
+    get_batter_index()
+    get_batter_search_index()
+    get_batter_percentile_engine()
+    get_batter_regrade_engine()
+    for features in SIMILARITY_FEATURES:
+        get_batter_similarity_index(features)
 
-    return results.sort_values('player_name')
+def _prepare_pitcher():
+    """투수 테이블(모든 컬럼 그룹)과 인덱스 생성"""
+    for group in GROUP_NAMES:
+        load_pitcher_group(group)
+    get_pitcher_seasons()
+    get_pitcher_index()
+    get_pitcher_search_index()
+    get_pitcher_percentile_engine()
+    get_pitcher_regrade_engine()
+    for features in SIMILARITY_FEATURES:
+        get_pitcher_similarity_index(features)
 
-def get_batter_data(batter_pcode: str, season: int):
-    """특정 타자의 KPI 데이터"""
-    df = load_batter_kpi()
-    data = df[(df['batter_pcode'] == batter_pcode) & (df['season'] == season)]
-    if len(data) == 0:
+# 스냅샷 준비 작업 (테이블별로 동시에 실행)
+SNAPSHOT_TASKS = {
+    'batter_kpi': _prepare_batter,
+    'pitcher_kpi': _prepare_pitcher,
+    'players': load_players,
+    'teams': load_teams,
+    'summary': get_dataset_summary,
+}
+
+def _snapshot_tasks(snapshot):
+    """snapshot을 활성화한 채로 실행할 준비 작업"""
+    return {name: functools.partial(snapshot.run, task) for name, task in SNAPSHOT_TASKS.items()}
+
+def _prepare_snapshot(snapshot):
+    """새 스냅샷의 테이블/인덱스를 모두 생성 (실패 시 예외, 교체하지 않음)"""
+    run_concurrently(_snapshot_tasks(snapshot), stage=RELOAD)
+
+@st.cache_resource
+def warm_up():
+    """현재 스냅샷 예열(백그라운드, 테이블별 동시)과 데이터 파일 감시 시작 (프로세스당 1회)"""
+    start_watcher(_prepare_snapshot)
+    return start_warmup(_snapshot_tasks(current_snapshot()))
+
+def get_batter_list(season: int):
+    """특정 시즌의 타자 목록"""
+    df = load_batter_group(IDENTITY)
+    batters = df[df['season'] == season][['batter_pcode', 'player_name', 'team_name']].drop_duplicates()
+    return batters.sort_values('player_name')
+
+def get_pitcher_list(season: int):
+    """특정 시즌의 투수 목록"""
+    df = load_pitcher_group(IDENTITY)
+    pitchers = df[df['season'] == season][['pitcher_pcode', 'player_name', 'team_name']].drop_duplicates()
+    return pitchers.sort_values('player_name')
+
+def search_batters(season: int, query: str):
+    """타자 검색 (2글자 이상, 초성 검색 지원)"""
+    if len(query) < 2:
+        return pd.DataFrame()
+    return search(get_batter_search_index(), season, query)
+
+def search_pitchers(season: int, query: str):
+    """투수 검색 (2글자 이상, 초성 검색 지원)"""
+    if len(query) < 2:
+        return pd.DataFrame()
+    return search(get_pitcher_search_index(), season, query)
+
+def get_batter_data(batter_pcode: str, season: int, groups=None):
+    """특정 타자의 KPI 데이터 (groups 지정 시 해당 컬럼 그룹만)"""
+    pos = get_batter_index().position(batter_pcode, season)
+    if pos is None:
         return None
-    return data.iloc[0]
+    return _take_groups(load_batter_group, groups, pos)
 
-def get_pitcher_data(pitcher_pcode: str, season: int):
-    """특정 투수의 KPI 데이터"""
-    df = load_pitcher_kpi()
-    data = df[(df['pitcher_pcode'] == pitcher_pcode) & (df['season'] == season)]
-    if len(data) == 0:
+def get_pitcher_data(pitcher_pcode: str, season: int, groups=None):
+    """특정 투수의 KPI 데이터 (groups 지정 시 해당 컬럼 그룹만)"""
+    pos = get_pitcher_index().position(pitcher_pcode, season)
+    if pos is None:
         return None
-    return data.iloc[0]
+    return _take_groups(load_pitcher_group, groups, pos)
+
+def get_batters_data(keys, groups=None):
+    """여러 타자-시즌 KPI 데이터를 한 번의 take로 조회 (keys: [(pcode, season)], 없는 키는 제외, 요청 순서 유지)"""
+    positions = get_batter_index().positions(keys)
+    return _take_groups(load_batter_group, groups, positions).reset_index(drop=True)
+
+def get_pitchers_data(keys, groups=None):
+    """여러 투수-시즌 KPI 데이터를 한 번의 take로 조회 (keys: [(pcode, season)], 없는 키는 제외, 요청 순서 유지)"""
+    positions = get_pitcher_index().positions(keys)
+    return _take_groups(load_pitcher_group, groups, positions).reset_index(drop=True)
+
+def get_batter_history(batter_pcode: str, groups=None):
+    """특정 타자의 시즌별 KPI 데이터 (시즌 오름차순)"""
+    positions = get_batter_index().history_positions(batter_pcode)
+    return _take_groups(load_batter_group, groups, positions)
+
+def get_pitcher_history(pitcher_pcode: str, groups=None):
+    """특정 투수의 시즌별 KPI 데이터 (시즌 오름차순)"""
+    positions = get_pitcher_index().history_positions(pitcher_pcode)
+    return _take_groups(load_pitcher_group, groups, positions)
 
 # 팀 색상 매핑
 TEAM_COLORS = {
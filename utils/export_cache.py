@@ -0,0 +1,82 @@
+"""
+JSON 내보내기 시즌 조각 캐시
+
+시즌별 입력 행의 내용 해시를 키로 빌드 결과(JSON 조각)를 디스크에 저장해 두고,
+해시가 바뀐 시즌만 다시 계산
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+
+# 빌드 로직이나 출력 형식이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = "1"
+
+
+def content_hash(frames, extra: str = "") -> str:
+    """DataFrame 목록의 내용 해시 (컬럼, 타입, 행 값 기준)"""
+    digest = hashlib.sha256()
+    digest.update(CACHE_VERSION.encode())
+    digest.update(extra.encode())
+    for frame in frames:
+        digest.update(",".join(map(str, frame.columns)).encode())
+        digest.update(",".join(map(str, frame.dtypes)).encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class FragmentCache:
+    """시즌 조각 디스크 캐시 (cache_dir가 None이면 항상 새로 빌드)"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.hits = 0
+        self.misses = 0
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_dir is not None
+
+    def key(self, section: str, season: str, frames, extra: str = ""):
+        """조각 캐시 키 (캐시 파일 경로, 캐시를 쓰지 않으면 None) - 입력 해시는 여기서 한 번만 계산"""
+        if not self.enabled:
+            return None
+        digest = content_hash(frames, extra)[:16]
+        return self.cache_dir / f"{section}.{season}.{digest}.json"
+
+    def has(self, path) -> bool:
+        """입력이 같은 조각이 캐시에 있는지 여부 (병렬 빌드 전에 재빌드 대상 선별용, path는 key()의 반환값)"""
+        return path is not None and path.exists()
+
+    def fetch(self, path, build):
+        """캐시된 조각 반환, 없거나 입력이 바뀌었으면 build()로 새로 만들어 저장 (path는 key()의 반환값)"""
+        if path is None:
+            self.misses += 1
+            return build()
+
+        if path.exists():
+            self.hits += 1
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        value = build()
+        self.misses += 1
+
+        # 같은 시즌의 이전 조각 정리 후 원자적으로 저장
+        prefix = path.name.rsplit('.', 2)[0]  # "<section>.<season>"
+        for stale in self.cache_dir.glob(f"{prefix}.*.json"):
+            stale.unlink()
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False, separators=(',', ':'))
+        tmp_path.replace(path)
+
+        return value
+
+    def summary(self) -> str:
+        """재사용/재빌드 조각 수 요약"""
+        return f"Season fragments: {self.hits} reused, {self.misses} rebuilt"
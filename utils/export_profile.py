@@ -0,0 +1,148 @@
+"""
+JSON 내보내기 단계별 프로파일링
+
+단계(stage)마다 wall time, CPU time, tracemalloc 최대 메모리를 기록
+- 단계는 중첩 가능하며 시간은 자식 단계를 뺀 자기 시간(self time)으로 집계
+- 같은 이름의 단계는 호출 횟수와 함께 누적 (시즌 조각 빌드 등)
+- 최대 메모리는 단계 실행 중 추적된 메모리의 최대값 (자식 단계 포함)
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class _Frame:
+    def __init__(self, name: str):
+        self.name = name
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.peak = 0
+
+
+class StageProfiler:
+    """단계별 시간/메모리 기록기 (enabled=False면 아무것도 측정하지 않음)"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.stats = {}
+        self._stack = []
+        self._started_tracing = False
+
+    def start(self):
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _current_peak(self) -> int:
+        return tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+
+    @contextmanager
+    def stage(self, name: str):
+        """with profiler.stage("load"): ... 형태로 단계 측정"""
+        if not self.enabled:
+            yield
+            return
+
+        if self._stack:
+            # 부모 단계의 현재까지 최대 메모리 보존 후 자식 측정을 위해 초기화
+            parent = self._stack[-1]
+            parent.peak = max(parent.peak, self._current_peak())
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+        frame = _Frame(name)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            wall = time.perf_counter() - frame.wall_start
+            cpu = time.process_time() - frame.cpu_start
+            peak = max(frame.peak, self._current_peak())
+
+            if self._stack:
+                parent = self._stack[-1]
+                parent.child_wall += wall
+                parent.child_cpu += cpu
+                parent.peak = max(parent.peak, peak)
+
+            stat = self.stats.setdefault(name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_mb": 0.0})
+            stat["calls"] += 1
+            stat["wall_s"] += wall - frame.child_wall
+            stat["cpu_s"] += cpu - frame.child_cpu
+            stat["peak_mb"] = max(stat["peak_mb"], peak / 1024 / 1024)
+
+    def iterate(self, name: str, items):
+        """iterator의 각 next() 호출을 name 단계로 측정 (조각 빌드 시간 분리용)"""
+        if not self.enabled:
+            return items
+
+        def measured():
+            iterator = iter(items)
+            while True:
+                with self.stage(name):
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        item = StopIteration
+                if item is StopIteration:
+                    # 종료 확인용 next()는 호출 횟수에서 제외
+                    self.stats[name]["calls"] -= 1
+                    return
+                yield item
+
+        return measured()
+
+    def table(self) -> str:
+        """단계별 결과 표"""
+        total_wall = sum(stat["wall_s"] for stat in self.stats.values()) or 1.0
+        lines = [
+            f"{'Stage':<28} {'Calls':>5} {'Wall (s)':>9} {'CPU (s)':>9} {'Wall %':>7} {'Peak (MB)':>10}",
+            "-" * 72,
+        ]
+        for name, stat in self.stats.items():
+            lines.append(
+                f"{name:<28} {stat['calls']:>5} {stat['wall_s']:>9.3f} {stat['cpu_s']:>9.3f} "
+                f"{stat['wall_s'] / total_wall * 100:>6.1f}% {stat['peak_mb']:>10.2f}"
+            )
+        lines.append("-" * 72)
+        lines.append(
+            f"{'Total':<28} {'':>5} {total_wall:>9.3f} "
+            f"{sum(stat['cpu_s'] for stat in self.stats.values()):>9.3f}"
+        )
+        return "\n".join(lines)
+
+    def report(self) -> dict:
+        """JSON 리포트용 dict"""
+        return {
+            "stages": {
+                name: {
+                    "calls": stat["calls"],
+                    "wall_s": round(stat["wall_s"], 6),
+                    "cpu_s": round(stat["cpu_s"], 6),
+                    "peak_mb": round(stat["peak_mb"], 3),
+                }
+                for name, stat in self.stats.items()
+            },
+            "total_wall_s": round(sum(stat["wall_s"] for stat in self.stats.values()), 6),
+            "total_cpu_s": round(sum(stat["cpu_s"] for stat in self.stats.values()), 6),
+        }
+
+    def write_report(self, path, extra: dict = None):
+        """JSON 리포트 저장"""
+        report = {**(extra or {}), **self.report()}
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return path
@@ -0,0 +1,185 @@
+"""
+샤드 단위 JSON 내보내기
+
+단일 JSON 대신 작은 manifest와 인덱스/검색/시즌별 선수 KPI 샤드로 나눠 저장
+각 샤드 파일명에 내용 해시를 붙여 CDN에서 장기 캐시할 수 있도록 함 (DATA_CATALOG §6.3)
+
+디렉토리 구조:
+    manifest.json                               # 유일하게 해시 없는 파일 (no-cache로 서빙)
+    batters/index.<hash>.json                   # 선수 인덱스
+    batters/search.<hash>.json                  # 이름/초성 검색용 목록
+    batters/kpi/<season>.<hash>.json            # 시즌별 {pcode: 선수 샤드 경로}
+    batters/kpi/<season>/<pcode>.<hash>.json    # 선수-시즌 KPI
+    team_comparison/<season>.<hash>.json
+    leaderboards/<batters|pitchers>/<season>.<hash>.json
+
+새 manifest로 교체한 뒤 새 manifest와 직전 manifest 어느 쪽도 참조하지 않는 샤드 파일과
+중단된 쓰기의 *.tmp 파일은 삭제 (직전 manifest를 받은 클라이언트/CDN이 한 세대 동안은 샤드를 받을 수 있도록)
+(샤드는 gzip 없이 저장하므로 압축은 서빙 시 HTTP 압축으로)
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from utils.search_index import to_choseong
+
+MANIFEST_NAME = "manifest.json"
+
+SEARCH_FIELDS = ["pcode", "name", "team", "hand", "choseong"]
+
+
+def dumps_min(obj) -> bytes:
+    """축소 JSON 직렬화"""
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class ShardWriter:
+    """내용 해시 파일명으로 샤드 저장 (같은 내용이면 기존 파일 재사용)"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.paths = set()
+        self.written = 0
+        self.reused = 0
+        self.bytes = 0
+
+    def write(self, relative_dir: str, name: str, obj) -> str:
+        """샤드 저장 후 root 기준 상대 경로 반환"""
+        payload = dumps_min(obj)
+        digest = hashlib.sha256(payload).hexdigest()[:12]
+        relative_path = f"{relative_dir}/{name}.{digest}.json" if relative_dir else f"{name}.{digest}.json"
+
+        path = self.root / relative_path
+        if path.exists():
+            self.reused += 1
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(payload)
+            tmp_path.replace(path)
+            self.written += 1
+        self.bytes += len(payload)
+        self.paths.add(relative_path)
+
+        return relative_path
+
+
+def build_search_rows(index: dict) -> dict:
+    """인덱스에서 검색용 행 목록 생성 (초성 포함)"""
+    rows = []
+    for pcode, info in index.items():
+        name = info.get("name")
+        name = name if isinstance(name, str) else ""
+        rows.append([pcode, name, info.get("team"), info.get("hand"), to_choseong(name)])
+    return {"fields": SEARCH_FIELDS, "rows": rows}
+
+
+def write_player_kind(writer: ShardWriter, kind: str, section: dict) -> dict:
+    """타자/투수 인덱스, 검색, 시즌별 선수 KPI 샤드 저장"""
+    kpi_listing = {}
+    for season, players in section["kpi"].items():
+        season_dir = f"{kind}/kpi/{season}"
+        listing = {pcode: writer.write(season_dir, pcode, player) for pcode, player in players.items()}
+        kpi_listing[season] = writer.write(f"{kind}/kpi", season, listing)
+
+    return {
+        "index": writer.write(kind, "index", section["index"]),
+        "search": writer.write(kind, "search", build_search_rows(section["index"])),
+        "kpi": kpi_listing,
+    }
+
+
+def referenced_shards(root, manifest: dict) -> set:
+    """manifest가 참조하는 샤드 경로 (시즌별 목록 샤드가 가리키는 선수 KPI 샤드 포함)"""
+    root = Path(root)
+    paths = set()
+    for kind in ("batters", "pitchers"):
+        section = manifest.get(kind, {})
+        paths.update(section[key] for key in ("index", "search") if key in section)
+        for listing_path in section.get("kpi", {}).values():
+            paths.add(listing_path)
+            listing_file = root / listing_path
+            if listing_file.exists():
+                paths.update(json.loads(listing_file.read_bytes()).values())
+    paths.update(manifest.get("team_comparison", {}).values())
+    for boards in manifest.get("leaderboards", {}).values():
+        paths.update(boards.values())
+    return paths
+
+
+def read_manifest(root):
+    """root의 manifest (없거나 읽을 수 없으면 None)"""
+    manifest_path = Path(root) / MANIFEST_NAME
+    try:
+        return json.loads(manifest_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def prune_shards(root, keep) -> int:
+    """
+    root 아래에서 keep(상대 경로 집합)과 manifest 외의 샤드 파일, 남은 *.tmp 파일 삭제 후
+    삭제한 파일 수 반환
+    """
+    root = Path(root)
+    removed = 0
+    for path in root.rglob("*.tmp"):
+        path.unlink()
+        removed += 1
+    for path in root.rglob("*.json"):
+        relative_path = path.relative_to(root).as_posix()
+        if relative_path == MANIFEST_NAME or relative_path in keep:
+            continue
+        path.unlink()
+        removed += 1
+
+    # 비게 된 디렉토리 정리 (깊은 디렉토리부터)
+    for directory in sorted((p for p in root.rglob("*") if p.is_dir()), key=lambda p: len(p.parts), reverse=True):
+        if not any(directory.iterdir()):
+            directory.rmdir()
+    return removed
+
+
+def write_sharded(data: dict, output_dir) -> Path:
+    """내보내기 데이터를 샤드로 저장하고 manifest 경로 반환"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    writer = ShardWriter(output_dir)
+
+    # 직전 manifest가 참조하는 샤드 (한 세대 더 유지)
+    previous = read_manifest(output_dir)
+    previous_paths = referenced_shards(output_dir, previous) if previous is not None else set()
+
+    manifest = {
+        "metadata": data["metadata"],
+        "teams": data["teams"],
+        "batters": write_player_kind(writer, "batters", data["batters"]),
+        "pitchers": write_player_kind(writer, "pitchers", data["pitchers"]),
+        "team_comparison": {
+            season: writer.write("team_comparison", season, comparison)
+            for season, comparison in data["team_comparison"].items()
+        },
+        "leaderboards": {
+            kind: {
+                season: writer.write(f"leaderboards/{kind}", season, board)
+                for season, board in boards.items()
+            }
+            for kind, boards in data["leaderboards"].items()
+        },
+    }
+
+    # manifest는 마지막에 원자적으로 교체 (클라이언트가 항상 완성된 샤드 집합을 보도록)
+    manifest_path = output_dir / MANIFEST_NAME
+    tmp_path = manifest_path.with_suffix(".tmp")
+    tmp_path.write_bytes(dumps_min(manifest))
+    tmp_path.replace(manifest_path)
+
+    # 새 manifest와 직전 manifest가 참조하지 않는 샤드 삭제 (manifest 교체 후에)
+    removed = prune_shards(output_dir, writer.paths | previous_paths)
+
+    print(f"  Shards: {writer.written} written, {writer.reused} unchanged, {removed} removed "
+          f"({writer.bytes / 1024 / 1024:.2f} MB total)")
+    print(f"  Manifest size: {manifest_path.stat().st_size / 1024:.1f} KB")
+
+    return manifest_path
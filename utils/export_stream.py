@@ -0,0 +1,100 @@
+"""
+스트리밍 JSON 내보내기
+
+전체 dict를 만든 뒤 형식마다 다시 직렬화하는 대신, 시즌 조각이 만들어지는 대로
+여러 출력 파일(sink)에 동시에 기록
+- 메모리에는 한 번에 시즌 조각 하나만 유지
+- 조각은 출력 형식(layout)별로 한 번만 인코딩하고 같은 형식의 sink끼리 공유
+- 인코딩 결과는 작은 단위로 바로 기록하므로 조각 전체 문자열도 만들지 않음
+- 출력은 json.dump(data, f, indent=..., separators=...)와 바이트 단위로 동일
+"""
+
+import json
+
+# json.dump 인자와 같은 의미의 출력 형식
+PRETTY = (2, (',', ': '))
+MINIFIED = (None, (',', ':'))
+DEFAULT = (None, (', ', ': '))
+
+
+class _Level:
+    def __init__(self):
+        self.count = 0
+
+
+class JSONStreamWriter:
+    """중첩 JSON object를 조각 단위로 여러 sink에 기록"""
+
+    def __init__(self, sinks):
+        """
+        Args:
+            sinks: [(텍스트 파일 객체, layout)] - layout은 PRETTY/MINIFIED/DEFAULT
+        """
+        self.sinks = list(sinks)
+        self.layouts = list(dict.fromkeys(layout for _, layout in self.sinks))
+        self.levels = []
+
+    def _write(self, parts: dict):
+        for f, layout in self.sinks:
+            f.write(parts[layout])
+
+    def _member_prefix(self, key) -> dict:
+        """현재 object에 멤버를 추가할 때 앞에 붙는 구분자/키"""
+        level = self.levels[-1]
+        depth = len(self.levels)
+        key_json = json.dumps(key, ensure_ascii=False)
+        first = level.count == 0
+        level.count += 1
+
+        parts = {}
+        for indent, (item_sep, key_sep) in self.layouts:
+            sep = "" if first else item_sep
+            if indent is not None:
+                sep = sep.rstrip() + "\n" + " " * (indent * depth)
+            parts[(indent, (item_sep, key_sep))] = sep + key_json + key_sep
+        return parts
+
+    def begin_object(self, key=None):
+        """object 시작 (루트가 아니면 현재 object의 key 멤버로)"""
+        parts = self._member_prefix(key) if self.levels else dict.fromkeys(self.layouts, "")
+        self._write({layout: text + "{" for layout, text in parts.items()})
+        self.levels.append(_Level())
+
+    def end_object(self):
+        """object 종료"""
+        level = self.levels.pop()
+        depth = len(self.levels)
+        parts = {}
+        for indent, separators in self.layouts:
+            if indent is not None and level.count:
+                parts[(indent, separators)] = "\n" + " " * (indent * depth) + "}"
+            else:
+                parts[(indent, separators)] = "}"
+        self._write(parts)
+
+    def write_member(self, key, value):
+        """현재 object에 key: value 조각 기록 (layout별로 한 번만 인코딩)"""
+        prefix = self._member_prefix(key)
+        depth = len(self.levels)
+        for layout in self.layouts:
+            indent, separators = layout
+            targets = [f for f, sink_layout in self.sinks if sink_layout == layout]
+            encoder = json.JSONEncoder(ensure_ascii=False, indent=indent, separators=separators)
+
+            for f in targets:
+                f.write(prefix[layout])
+            # 조각 전체 문자열을 만들지 않고 작은 단위로 바로 기록
+            pad = "\n" + " " * (indent * depth) if indent is not None else None
+            for piece in encoder.iterencode(value):
+                if pad is not None:
+                    piece = piece.replace("\n", pad)
+                for f in targets:
+                    f.write(piece)
+
+    def write_members(self, items):
+        """(key, value) iterable을 순서대로 기록 (조각은 기록 후 바로 해제)"""
+        count = 0
+        for key, value in items:
+            self.write_member(key, value)
+            count += 1
+        return count
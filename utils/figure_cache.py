@@ -0,0 +1,27 @@
+"""
+Plotly figure 캐시
+
+레이더/추이 차트는 선수-시즌이 같으면 매번 같은 figure인데, 다른 위젯 때문에 재실행될 때도
+go.Figure 생성과 trace 검증을 처음부터 다시 함
+- (차트 종류, pcode, 시즌, 변형, 데이터 버전)별로 검증이 끝난 figure를 프로세스 공유 캐시에 보관
+- 항목 수 제한 (오래된 항목부터 제거)
+- 캐시된 figure는 여러 세션이 공유하므로 꺼낸 뒤 수정하지 않음
+"""
+
+import streamlit as st
+
+# figure 캐시 최대 항목 수
+FIGURE_CACHE_SIZE = 256
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_SIZE, show_spinner=False)
+def cached_figure(chart: str, key: tuple, _build):
+    """
+    차트 figure 조회 (없으면 _build()로 생성해 캐시)
+
+    Args:
+        chart: 차트 종류 (예: 'batter_radar', 'pitcher_trend')
+        key: 캐시 키 (pcode, 시즌, 사용자 가중치, 데이터 버전 등 figure 내용을 결정하는 값)
+        _build: figure 생성 함수 (캐시 키에서 제외)
+    """
+    return _build()
@@ -0,0 +1,174 @@
+"""
+리더보드 표시 테이블 빌더
+
+타자/투수 리더보드가 공유하는 표시용 DataFrame 생성과 스타일링
+- 행 단위 iterrows/applymap 대신 컬럼 단위 연산으로 표시 테이블 구성
+- 등급 색상은 구간 경계 배열에 대한 searchsorted로 컬럼 전체를 한 번에 매핑
+- 숫자 포맷(소수점, 결측 '-')은 Styler.format으로 렌더링 시점에만 적용
+- 페이지 계산/선수 위치 찾기 (현재 페이지 구간만 표시 테이블로 만들고 스타일링)
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.search_index import is_choseong_query, to_choseong
+
+# 등급 구간 경계와 색상 (구간: <40, 40-49, 50-59, 60-69, 70-79, 80+)
+GRADE_THRESHOLDS = np.array([40, 50, 60, 70, 80])
+GRADE_COLORS = np.array([
+    "#9CA3AF",  # Poor - Gray
+    "#F59E0B",  # Below Average - Yellow
+    "#10B981",  # Average - Green
+    "#2563EB",  # Above Average - Blue
+    "#7C3AED",  # Great - Purple
+    "#DC2626",  # Elite - Red
+])
+MISSING_COLOR = "#9CA3AF"
+
+# 페이지 크기
+PAGE_SIZE_OPTIONS = [25, 50, 100, 200]
+DEFAULT_PAGE_SIZE = 50
+
+# 컬럼 종류
+TEXT = "text"
+INT = "int"
+GRADE = "grade"
+FLOAT = "float"
+
+
+def get_grade_color(grade):
+    """등급에 따른 색상 반환"""
+    if pd.isna(grade):
+        return MISSING_COLOR
+    return GRADE_COLORS[np.searchsorted(GRADE_THRESHOLDS, int(grade), side='right')]
+
+
+def grade_colors(values) -> np.ndarray:
+    """등급 배열 → 색상 배열 (결측은 회색)"""
+    numeric = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    buckets = np.searchsorted(GRADE_THRESHOLDS, np.trunc(numeric), side='right')
+    return np.where(np.isnan(numeric), MISSING_COLOR, GRADE_COLORS[buckets])
+
+
+def grade_styles(column: pd.Series) -> np.ndarray:
+    """Styler.apply용 등급 컬럼 CSS (결측은 스타일 없음)"""
+    css = np.char.add(np.char.add("color: ", grade_colors(column).astype(str)), "; font-weight: bold")
+    return np.where(column.isna().to_numpy(), "", css)
+
+
+def mapped_styles(column: pd.Series, colors: dict) -> np.ndarray:
+    """Styler.apply용 값 → 색상 매핑 CSS (매핑 없는 값은 스타일 없음)"""
+    mapped = column.astype(object).map(colors)
+    return np.where(mapped.isna(), "", "color: " + mapped.fillna("").astype(str) + "; font-weight: bold")
+
+
+def coalesce(df: pd.DataFrame, sources) -> pd.Series:
+    """source 컬럼(들)에서 값 선택 (튜플이면 앞 컬럼이 결측일 때 다음 컬럼 사용)"""
+    if isinstance(sources, str):
+        sources = (sources,)
+    present = [col for col in sources if col in df.columns]
+    if not present:
+        return pd.Series(np.nan, index=df.index, dtype='float64')
+
+    values = df[present[0]]
+    for col in present[1:]:
+        values = values.where(values.notna(), df[col])
+    return values
+
+
+def _to_int(values: pd.Series) -> pd.Series:
+    """int() 변환과 같은 버림 정수 (결측 유지)"""
+    numeric = pd.to_numeric(values, errors='coerce').astype('Float64')
+    return np.trunc(numeric).astype('Int64')
+
+
+def build_leaderboard_frame(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """
+    표시용 리더보드 DataFrame 생성
+
+    Args:
+        df: 정렬/필터가 끝난 리더보드 데이터
+        columns: [(표시 이름, source 컬럼 또는 fallback 튜플, 종류)] - 종류는 TEXT/INT/GRADE/FLOAT
+    """
+    frame = {}
+    for label, sources, kind in columns:
+        values = coalesce(df, sources)
+        if kind in (INT, GRADE):
+            values = _to_int(values)
+        elif kind == FLOAT:
+            values = pd.to_numeric(values, errors='coerce').astype('float64')
+        elif isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(object)
+        frame[label] = values.to_numpy() if kind == TEXT else values.array
+
+    return pd.DataFrame(frame)
+
+
+HIGHLIGHT_COLOR = "#FEF3C7"
+
+
+def style_leaderboard(frame: pd.DataFrame, grade_columns, formats: dict = None, color_columns: dict = None,
+                      highlight_row: int = None):
+    """
+    리더보드 Styler 생성 (컬럼 단위 스타일 적용)
+
+    Args:
+        grade_columns: 등급 색상을 적용할 표시 컬럼
+        formats: {표시 컬럼: 포맷 문자열} (예: {'타율': '{:.3f}'})
+        color_columns: {표시 컬럼: {값: 색상}} (예: 투수 역할)
+        highlight_row: 배경색으로 강조할 행 위치 (순위/선수 이동 대상)
+    """
+    styler = frame.style.format(formats or {}, na_rep="-")
+
+    if highlight_row is not None and 0 <= highlight_row < len(frame):
+        styler = styler.set_properties(
+            subset=pd.IndexSlice[frame.index[[highlight_row]], :],
+            **{'background-color': HIGHLIGHT_COLOR}
+        )
+
+    grade_columns = [col for col in grade_columns if col in frame.columns]
+    if grade_columns:
+        styler = styler.apply(grade_styles, subset=grade_columns)
+
+    for col, colors in (color_columns or {}).items():
+        if col in frame.columns:
+            styler = styler.apply(mapped_styles, colors=colors, subset=[col])
+
+    return styler
+
+
+def page_count(total: int, page_size: int) -> int:
+    """전체 페이지 수 (행이 없어도 1페이지)"""
+    return max(1, -(-total // page_size))
+
+
+def page_slice(page: int, page_size: int, total: int) -> slice:
+    """1부터 시작하는 페이지 번호의 행 구간 (범위를 벗어나면 양 끝 페이지로)"""
+    page = min(max(page, 1), page_count(total, page_size))
+    start = (page - 1) * page_size
+    return slice(start, min(start + page_size, total))
+
+
+def page_of_position(position: int, page_size: int) -> int:
+    """0부터 시작하는 행 위치가 속한 페이지 번호"""
+    return position // page_size + 1
+
+
+def find_player_position(names: pd.Series, query: str):
+    """
+    순위순 이름 목록에서 검색어와 맞는 첫 행 위치 (없으면 None)
+
+    초성만 입력하면 초성으로 비교 (예: ㄱㅎㅅ → 김현수)
+    """
+    query = query.strip()
+    if not query:
+        return None
+
+    names = names.fillna('').astype(str)
+    if is_choseong_query(query):
+        matches = names.map(to_choseong).str.contains(query, regex=False).to_numpy()
+    else:
+        matches = names.str.contains(query, case=False, regex=False).to_numpy()
+
+    positions = np.flatnonzero(matches)
+    return int(positions[0]) if len(positions) else None
@@ -0,0 +1,144 @@
+"""
+시즌별 리더보드 쿼리 인덱스
+
+필터/정렬 변경마다 시즌 데이터를 다시 자르고 sort_values 하는 대신,
+시즌마다 한 번만 아래 구조를 만들어 두고 조회는 마스크 교집합 + 순서대로 take로 처리
+- 정렬 컬럼별 내림차순 순열 (결측은 마지막, 동점은 원래 행 순서)
+- 팀/역할 등 값별 bitmap (bool 배열)
+- 최소 타석/투구수용 정렬된 임계값 배열 (searchsorted로 조건 행 선택)
+- 필터 상태별 결과 위치 memoize (여러 세션 스레드가 공유하므로 LRU 조회/추가/제거는 lock 안에서)
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def descending_order(values: pd.Series) -> np.ndarray:
+    """내림차순 순열 (결측은 마지막, 동점은 원래 행 순서 유지)"""
+    numeric = pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    key = np.where(np.isnan(numeric), np.inf, -numeric)
+    return np.argsort(key, kind='stable')
+
+
+class LeaderboardIndex:
+    """한 시즌의 리더보드 쿼리 인덱스"""
+
+    def __init__(self, df: pd.DataFrame, sort_columns, bitmap_columns=(), threshold_columns=(),
+                 name_column: str = 'player_name', cache_size: int = 256):
+        self.df = df.reset_index(drop=True)
+        self.size = len(self.df)
+        self.name_column = name_column
+        self.cache_size = cache_size
+
+        # 정렬 컬럼별 순열
+        self.orders = {
+            col: descending_order(self.df[col])
+            for col in sort_columns if col in self.df.columns
+        }
+
+        # 값별 bitmap
+        self.bitmaps = {}
+        for col in bitmap_columns:
+            if col not in self.df.columns:
+                continue
+            codes, uniques = pd.factorize(self.df[col].astype(object), use_na_sentinel=True)
+            self.bitmaps[col] = {value: codes == code for code, value in enumerate(uniques)}
+
+        # 임계값 컬럼: 결측을 뺀 오름차순 값과 해당 행 위치
+        self.thresholds = {}
+        for col in threshold_columns:
+            if col not in self.df.columns:
+                continue
+            numeric = pd.to_numeric(self.df[col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+            rows = np.flatnonzero(~np.isnan(numeric))
+            order = rows[np.argsort(numeric[rows], kind='stable')]
+            self.thresholds[col] = (numeric[order], order)
+
+        self._name_masks = OrderedDict()
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def values(self, col: str) -> list:
+        """bitmap 컬럼의 값 목록 (정렬, 결측 제외)"""
+        return sorted(self.bitmaps.get(col, {}).keys())
+
+    def at_least(self, col: str, minimum) -> np.ndarray:
+        """col >= minimum 행 마스크 (결측 제외)"""
+        sorted_values, order = self.thresholds[col]
+        mask = np.zeros(self.size, dtype=bool)
+        mask[order[np.searchsorted(sorted_values, minimum, side='left'):]] = True
+        return mask
+
+    def equals(self, col: str, value) -> np.ndarray:
+        """col == value 행 마스크"""
+        mask = self.bitmaps[col].get(value)
+        return mask if mask is not None else np.zeros(self.size, dtype=bool)
+
+    def name_matches(self, query: str) -> np.ndarray:
+        """이름 검색 마스크 (str.contains, 대소문자 무시)"""
+        mask = self._lookup(self._name_masks, query)
+        if mask is None:
+            mask = self.df[self.name_column].str.contains(query, case=False, na=False).to_numpy(dtype=bool)
+            self._remember(self._name_masks, query, mask)
+        return mask
+
+    def _lookup(self, cache: OrderedDict, key):
+        """LRU 조회 (있으면 최근 사용으로 이동, 없으면 None)"""
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _remember(self, cache: OrderedDict, key, value):
+        """LRU 추가 (크기를 넘으면 가장 오래된 항목 제거)"""
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+    def positions(self, sort_column: str, minimums: dict = None, equals: dict = None, name_query: str = "") -> np.ndarray:
+        """
+        필터를 만족하는 행 위치를 정렬 순서대로 반환 (필터 상태별 memoize)
+
+        Args:
+            sort_column: 내림차순 정렬 컬럼 (인덱스에 없으면 원래 행 순서)
+            minimums: {임계값 컬럼: 최소값} (인덱스에 없는 컬럼은 무시)
+            equals: {bitmap 컬럼: 값} (인덱스에 없는 컬럼은 무시)
+            name_query: 이름 검색어
+        """
+        minimums = {col: value for col, value in (minimums or {}).items() if col in self.thresholds}
+        equals = {col: value for col, value in (equals or {}).items() if col in self.bitmaps}
+        key = (sort_column, tuple(sorted(minimums.items())), tuple(sorted(equals.items())), name_query)
+
+        result = self._lookup(self._results, key)
+        if result is not None:
+            return result
+
+        mask = np.ones(self.size, dtype=bool)
+        for col, minimum in minimums.items():
+            mask &= self.at_least(col, minimum)
+        for col, value in equals.items():
+            mask &= self.equals(col, value)
+        if name_query:
+            mask &= self.name_matches(name_query)
+
+        order = self.orders.get(sort_column)
+        if order is None:
+            order = np.arange(self.size)
+        result = order[mask[order]]
+        result.flags.writeable = False
+
+        self._remember(self._results, key, result)
+        return result
+
+    def query(self, sort_column: str, minimums: dict = None, equals: dict = None, name_query: str = "") -> pd.DataFrame:
+        """필터/정렬 결과 DataFrame (순위 'rank' 포함)"""
+        positions = self.positions(sort_column, minimums, equals, name_query)
+        result = self.df.take(positions).reset_index(drop=True)
+        result['rank'] = np.arange(1, len(result) + 1)
+        return result
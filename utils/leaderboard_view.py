@@ -0,0 +1,125 @@
+"""
+페이지 단위 리더보드 표시 (Streamlit)
+
+필터/정렬된 전체 순위표 중 현재 페이지 구간만 표시 테이블로 만들고 스타일링해서
+브라우저로 보내는 데이터 크기를 선수 수와 무관하게 페이지 크기로 고정
+- 페이지 크기 선택, 페이지 이동
+- 순위로 이동, 선수 이름(초성 가능)으로 이동 후 해당 행 강조
+- 필터가 바뀌면 1페이지로, 페이지 크기가 바뀌면 보던 첫 행이 있는 페이지로 이동
+"""
+
+import streamlit as st
+
+from utils.leaderboard import (
+    DEFAULT_PAGE_SIZE, PAGE_SIZE_OPTIONS,
+    build_leaderboard_frame, find_player_position,
+    page_count, page_of_position, page_slice, style_leaderboard,
+)
+
+
+STATE_NAMES = ["page_size", "shown_size", "page", "rank", "player", "jump", "highlight", "filters"]
+
+
+def _keys(key: str) -> dict:
+    return {name: f"{key}_{name}" for name in STATE_NAMES}
+
+
+def _request_jump(keys: dict, kind: str):
+    """순위/선수 이동 입력 콜백 (실제 이동은 다음 실행에서 현재 순위표 기준으로 계산)"""
+    st.session_state[keys["jump"]] = (kind, st.session_state.get(keys[kind]))
+
+
+def render_paginated_leaderboard(ranked, columns, key: str, grade_columns, formats: dict = None,
+                                 color_columns: dict = None, filter_state=None, prepare=None):
+    """
+    페이지 단위 리더보드 렌더링
+
+    Args:
+        ranked: 정렬 후 순위('rank')가 매겨진 전체 순위표 (0..n-1 index)
+        columns: build_leaderboard_frame 컬럼 정의
+        key: 위젯 session_state 키 접두어
+        filter_state: 필터 상태 (바뀌면 1페이지로)
+        prepare: 페이지 구간에만 적용할 파생 컬럼 함수 (DataFrame → DataFrame)
+    """
+    keys = _keys(key)
+    total = len(ranked)
+
+    page_size = st.sidebar.selectbox(
+        "페이지당 선수 수",
+        PAGE_SIZE_OPTIONS,
+        index=PAGE_SIZE_OPTIONS.index(DEFAULT_PAGE_SIZE),
+        key=keys["page_size"]
+    )
+    pages = page_count(total, page_size)
+
+    # 페이지 크기가 바뀌면 보고 있던 첫 행이 포함된 페이지로
+    shown_size = st.session_state.get(keys["shown_size"])
+    if shown_size is not None and shown_size != page_size:
+        first_row = (st.session_state.get(keys["page"], 1) - 1) * shown_size
+        st.session_state[keys["page"]] = page_of_position(first_row, page_size)
+    st.session_state[keys["shown_size"]] = page_size
+
+    # 필터가 바뀌면 처음 페이지로
+    if st.session_state.get(keys["filters"]) != filter_state:
+        st.session_state[keys["filters"]] = filter_state
+        st.session_state[keys["page"]] = 1
+        st.session_state[keys["highlight"]] = None
+
+    # 순위/선수 이동 요청 처리 (페이지 위젯 생성 전에 페이지 번호 설정)
+    jump = st.session_state.pop(keys["jump"], None)
+    if jump is not None:
+        kind, value = jump
+        if kind == "rank" and value:
+            position = min(int(value), total) - 1
+        elif kind == "player" and value:
+            position = find_player_position(ranked['player_name'], value)
+            if position is None:
+                st.info(f"'{value}' 선수를 현재 순위표에서 찾을 수 없습니다.")
+        else:
+            position = None
+
+        if position is not None and position >= 0:
+            st.session_state[keys["page"]] = page_of_position(position, page_size)
+            st.session_state[keys["highlight"]] = position
+
+    current = st.session_state.get(keys["page"], 1)
+    st.session_state[keys["page"]] = min(max(current, 1), pages)
+
+    col_page, col_rank, col_player = st.columns([1, 1, 2])
+    with col_page:
+        page = st.number_input(f"페이지 (총 {pages})", min_value=1, max_value=pages, step=1, key=keys["page"])
+    with col_rank:
+        st.number_input(
+            "순위로 이동", min_value=1, max_value=max(total, 1), value=None, step=1,
+            key=keys["rank"], on_change=_request_jump, args=(keys, "rank")
+        )
+    with col_player:
+        st.text_input(
+            "선수로 이동", placeholder="이름 또는 초성 입력 후 Enter",
+            key=keys["player"], on_change=_request_jump, args=(keys, "player")
+        )
+
+    # 현재 페이지 구간만 표시 테이블 생성/스타일링
+    rows = page_slice(page, page_size, total)
+    page_data = ranked.iloc[rows]
+    if prepare is not None:
+        page_data = prepare(page_data)
+
+    highlight = st.session_state.get(keys["highlight"])
+    highlight_row = highlight - rows.start if highlight is not None and rows.start <= highlight < rows.stop else None
+
+    df_display = build_leaderboard_frame(page_data, columns)
+    styled_df = style_leaderboard(
+        df_display, grade_columns,
+        formats=formats,
+        color_columns=color_columns,
+        highlight_row=highlight_row
+    )
+
+    st.dataframe(
+        styled_df,
+        width="stretch",
+        height=min(600, 38 + 35 * len(df_display)),
+        hide_index=True
+    )
+    st.caption(f"전체 {total}명 중 {rows.start + 1}-{rows.stop}위 (페이지 {page}/{pages})")
@@ -0,0 +1,256 @@
+"""
+카테고리 상세 지표 카드 HTML
+
+카테고리 헤더와 세부 지표 행(이름, 가중치 배지, 값, 등급 배지, 상위 %)을
+하나의 HTML 문자열로 만들어 카드마다 st.markdown 한 번으로 렌더링
+- 지표마다 st.columns 4개 + st.markdown을 쓰던 방식보다 요소/델타 수가 카드당 1개로 줄어듦
+- 마크다운이 들여쓰기를 코드 블록으로 해석하지 않도록 줄바꿈/들여쓰기 없이 생성
+- 타자/투수 스카우팅 리포트가 같은 카드 빌더(build_category_cards)를 공유
+  (재등급 엔진은 페이지 전역이 아니라 빌더 안에서 데이터 버전별로 조회)
+"""
+
+from html import escape
+
+import pandas as pd
+import streamlit as st
+
+from utils.column_groups import DETAIL_GROUPS
+from utils.data_loader import get_batter_data, get_batter_regrade_engine, get_pitcher_data, get_pitcher_regrade_engine
+from utils.regrade import BATTER_METRIC_WEIGHTS, PITCHER_METRIC_WEIGHTS
+
+# 카드 헤더 배경/테두리
+BATTER_CARD_THEME = ("linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%)", "#e2e8f0")
+PITCHER_CARD_THEME = ("linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%)", "#fecaca")
+
+
+# (카테고리 표시 이름, 카테고리 키, 등급 컬럼 (앞에서부터 있는 컬럼 사용))
+BATTER_DETAIL_CATEGORIES = [
+    ("컨택", "contact", ("contact_grade_weighted", "contact_grade")),
+    ("홈런 파워", "game_power", ("game_power_grade_weighted", "game_power_grade")),
+    ("갭 파워", "gap_power", ("gap_power_grade_weighted", "gap_power_grade")),
+    ("선구안", "discipline", ("discipline_grade_weighted", "discipline_grade")),
+    ("일관성", "consistency", ("consistency_grade_weighted", "consistency_grade")),
+    ("클러치", "clutch", ("clutch_grade_weighted", "clutch_grade")),
+]
+PITCHER_DETAIL_CATEGORIES = [
+    ("제구력 (Control)", "control", ("control_grade",)),
+    ("공격성 (Aggression)", "aggression", ("aggression_grade",)),
+    ("효율성 (Efficiency)", "efficiency", ("efficiency_grade",)),
+    ("구위 (Stuff)", "stuff", ("stuff_grade",)),
+    ("클러치 (Clutch)", "clutch", ("clutch_grade",)),
+]
+
+
+def get_grade_color(grade):
+    """등급에 따른 색상"""
+    if pd.isna(grade):
+        return "#6B7280"
+    grade = float(grade)
+    if grade >= 80:
+        return "#9333EA"  # purple
+    elif grade >= 70:
+        return "#2563EB"  # blue
+    elif grade >= 60:
+        return "#16A34A"  # green
+    elif grade >= 50:
+        return "#CA8A04"  # yellow
+    elif grade >= 40:
+        return "#EA580C"  # orange
+    else:
+        return "#DC2626"  # red
+
+
+def get_grade_label(grade):
+    """등급에 따른 라벨"""
+    if pd.isna(grade):
+        return "N/A"
+    grade = float(grade)
+    if grade >= 80:
+        return "엘리트"
+    elif grade >= 70:
+        return "플러스"
+    elif grade >= 60:
+        return "평균 이상"
+    elif grade >= 50:
+        return "평균"
+    elif grade >= 40:
+        return "평균 이하"
+    else:
+        return "부족"
+
+
+def _safe_float(val, default=0):
+    try:
+        if pd.isna(val):
+            return default
+        return float(val)
+    except (TypeError, ValueError):
+        return default
+
+
+def format_batter_metric_value(key, unit, val):
+    """타자 세부 지표 값 포맷팅"""
+    if unit == '%':
+        # 이미 백분율 형태 (11.57 = 11.57%)
+        return f"{val:.1f}%"
+    elif unit == '%*100':
+        # 0-1 비율을 백분율로 변환 (0.174 → 17.4%)
+        return f"{val*100:.1f}%"
+    elif unit == '':
+        if 'ratio' in key:
+            return f"{val:.2f}"
+        return f"{val:.3f}"
+    return f"{val:.2f}"
+
+
+def format_pitcher_metric_value(key, unit, val):
+    """투수 세부 지표 값 포맷팅"""
+    if unit == '%':
+        return f"{val*100:.1f}%"
+    elif unit == 'km/h':
+        return f"{val:.1f} km/h" if val else "N/A"
+    elif unit == '':
+        if 'index' in key:
+            return f"{val:.2f}"
+        elif 'avg_pitches' in key:
+            return f"{val:.1f}"
+        return f"{val:.3f}"
+    return f"{val:.2f}"
+
+
+def get_weight_color(weight):
+    """가중치에 따른 색상"""
+    if weight >= 0.35:
+        return "#DC2626"  # 빨강 (매우 중요)
+    elif weight >= 0.25:
+        return "#EA580C"  # 주황 (중요)
+    elif weight >= 0.15:
+        return "#2563EB"  # 파랑 (보통)
+    elif weight >= 0.10:
+        return "#6B7280"  # 회색 (낮음)
+    else:
+        return "#9CA3AF"  # 연회색 (매우 낮음)
+
+
+def _metric_row(name, weight, formatted_val, metric_grade, percentile, grade_color) -> str:
+    """세부 지표 한 행 (그리드 셀 4개)"""
+    cells = [
+        '<div style="display: flex; align-items: center; gap: 6px;">'
+        f'<span style="font-size: 0.9rem;">{escape(name)}</span>'
+        f'<span style="color: {get_weight_color(weight)}; font-size: 0.75rem; font-weight: 600;">W-{weight*100:.0f}%</span>'
+        '</div>',
+        f'<div style="font-family: monospace; font-weight: 500;">{escape(formatted_val)}</div>',
+    ]
+    if metric_grade > 0:
+        cells.append(
+            f'<div><span style="background: {grade_color(metric_grade)}; color: white; '
+            f'padding: 2px 8px; border-radius: 4px; font-size: 0.75rem;">{metric_grade:.0f}</span></div>'
+        )
+    else:
+        cells.append('<div></div>')
+    if percentile > 0:
+        cells.append(f'<div style="font-size: 0.75rem; color: #6b7280;">상위 {100-percentile:.0f}%</div>')
+    else:
+        cells.append('<div></div>')
+    return "".join(cells)
+
+
+def category_card_html(category_name, grade, rows, theme, grade_color, grade_label) -> str:
+    """
+    카테고리 카드 HTML (헤더 + 세부 지표 그리드 + 구분선)
+
+    Args:
+        category_name: 카테고리 표시 이름
+        grade: 카테고리 등급
+        rows: 세부 지표 (이름, 카테고리 내 가중치 비중, 포맷된 값, 지표 등급, 백분위) 목록
+        theme: (헤더 배경, 테두리 색) - BATTER_CARD_THEME / PITCHER_CARD_THEME
+        grade_color: 등급 → 색상 함수
+        grade_label: 등급 → 라벨 함수
+    """
+    background, border = theme
+    header = (
+        f'<div style="background: {background}; border-radius: 12px; padding: 16px; '
+        f'margin-bottom: 8px; border: 1px solid {border};">'
+        '<div style="display: flex; justify-content: space-between; align-items: center;">'
+        f'<h4 style="margin: 0; font-size: 1.1rem; font-weight: 600;">{escape(category_name)}</h4>'
+        '<div style="display: flex; align-items: center; gap: 8px;">'
+        f'<span style="background: {grade_color(grade)}; color: white; padding: 4px 12px; '
+        f'border-radius: 20px; font-weight: bold; font-size: 0.9rem;">{grade:.0f}</span>'
+        f'<span style="color: {grade_color(grade)}; font-size: 0.8rem;">{grade_label(grade)}</span>'
+        '</div></div></div>'
+    )
+    body = "".join(_metric_row(*row, grade_color) for row in rows)
+    grid = (
+        '<div style="display: grid; grid-template-columns: 4fr 2fr 2fr 2fr; '
+        f'gap: 10px 16px; align-items: center; padding: 4px 8px;">{body}</div>'
+    )
+    return f'<div>{header}{grid}<hr style="margin: 16px 0;"></div>'
+
+
+# 선수 종류별 카드 설정
+CARD_KINDS = {
+    'batter': {
+        'fetch': get_batter_data,
+        'regrade_engine': get_batter_regrade_engine,
+        'metric_weights': BATTER_METRIC_WEIGHTS,
+        'categories': BATTER_DETAIL_CATEGORIES,
+        'format': format_batter_metric_value,
+        'theme': BATTER_CARD_THEME,
+    },
+    'pitcher': {
+        'fetch': get_pitcher_data,
+        'regrade_engine': get_pitcher_regrade_engine,
+        'metric_weights': PITCHER_METRIC_WEIGHTS,
+        'categories': PITCHER_DETAIL_CATEGORIES,
+        'format': format_pitcher_metric_value,
+        'theme': PITCHER_CARD_THEME,
+    },
+}
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def build_category_cards(kind: str, pcode, season, custom_weights=None, version=None):
+    """
+    카테고리별 상세 지표 카드 HTML 목록 ((종류, pcode, 시즌, 사용자 가중치, 데이터 버전)별 캐시)
+
+    Args:
+        kind: 'batter' / 'pitcher'
+        custom_weights: 사용자 가중치 (기본 가중치면 None)
+        version: 데이터 버전 (data_version()) - 재등급 엔진과 데이터는 이 버전의 스냅샷에서 조회
+    """
+    config = CARD_KINDS[kind]
+    # 상세 지표 컬럼 그룹은 상세 탭에서만 로드
+    detail = config['fetch'](pcode, season, groups=DETAIL_GROUPS)
+    if detail is None:
+        return []
+
+    engine = config['regrade_engine']()
+    if custom_weights is not None:
+        detail = detail.copy()
+        regraded = engine.player(pcode, season, *custom_weights)
+        detail[regraded.index] = regraded.to_numpy()
+
+    # 표시 가중치 (사용자 가중치가 있으면 카테고리 내 비중으로 환산)
+    active_weights = custom_weights[0] if custom_weights is not None else engine.default_metric_weights
+
+    cards = []
+    for category_name, category_key, grade_columns in config['categories']:
+        grade_column = next((col for col in grade_columns if col in detail.index), None)
+        grade = _safe_float(detail.get(grade_column, 50))
+        category_weights = active_weights.get(category_key, {})
+        weight_total = sum(category_weights.values())
+
+        rows = []
+        for key, info in config['metric_weights'].get(category_key, {}).items():
+            weight = category_weights.get(key, info[1]) / weight_total if weight_total else 0.0
+            unit = info[2] if len(info) > 2 else ''
+            rows.append((
+                info[0],
+                weight,
+                config['format'](key, unit, _safe_float(detail.get(key, 0))),
+                _safe_float(detail.get(f"{key}_grade", 0)),
+                _safe_float(detail.get(f"{key}_percentile", 0)),
+            ))
+
+        cards.append(category_card_html(category_name, grade, rows, config['theme'], get_grade_color, get_grade_label))
+    return cards
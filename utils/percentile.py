@@ -0,0 +1,175 @@
+"""
+집단(cohort) 기준 백분위 엔진
+
+저장된 *_percentile 컬럼은 한 가지 모집단 기준이라, "300타석 이상 타자 중" 또는
+"구원 투수 중" 같은 집단별 백분위를 구할 수 없음
+- (시즌, 집단)마다 지표별 정렬된 값 배열을 한 번 만들어 두고 searchsorted로 조회
+- 한 선수의 전체 지표 백분위는 정렬 행렬과의 한 번의 벡터 비교로 계산
+- 백분위 = (나보다 나쁜 값 수 + 같은 값 수 / 2) / 집단 크기 × 100
+  (낮을수록 좋은 지표는 방향을 뒤집어 계산, 결측은 집단에서 제외)
+- 기본 집단('all')은 저장된 *_percentile 값을 그대로 사용
+  (저장 백분위는 자격 조건을 채운 선수만 계산돼 있으므로, 값 조회도 저장 백분위가 있는 행 기준)
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.player_index import PlayerIndex
+
+# 낮을수록 좋은 지표 (저장된 백분위 방향 기준)
+BATTER_LOWER_IS_BETTER = {
+    'strikeout_rate', 'strikeouts', 'chase_rate', 'swing_miss_rate',
+    'monthly_variance', 'left_right_ops_diff',
+}
+PITCHER_LOWER_IS_BETTER = {
+    'avg_pitches_per_batter', 'pitches_per_inning', 'walks',
+}
+
+STARTER_ROLES = ['Starter', 'Ace Starter']
+RELIEVER_ROLES = ['Middle Reliever', 'Setup', 'Closer', 'Long Reliever']
+
+
+def pitcher_role_of(df: pd.DataFrame) -> pd.Series:
+    """투수 역할 (role_type 기준, 없으면 pitcher_role - pitcher_role은 대부분 결측)"""
+    return df['role_type'].astype(object).fillna(df['pitcher_role'].astype(object))
+
+
+# 저장된 *_percentile 컬럼을 그대로 쓰는 기본 집단
+STORED_COHORT = 'all'
+
+# 집단 정의: 이름 → (표시 이름, 전체 DataFrame → bool 마스크 함수 또는 None(전체))
+BATTER_COHORTS = {
+    'all': ('리그 기준 (저장 백분위)', None),
+    'qualified': ('300타석 이상', lambda df: df['plate_appearances'] >= 300),
+}
+PITCHER_COHORTS = {
+    'all': ('리그 기준 (저장 백분위)', None),
+    'starters': ('선발 투수', lambda df: pitcher_role_of(df).isin(STARTER_ROLES)),
+    'relievers': ('구원 투수', lambda df: pitcher_role_of(df).isin(RELIEVER_ROLES)),
+    'qualified': ('1000구 이상', lambda df: df['total_pitches'] >= 1000),
+}
+
+
+class CohortTable:
+    """(시즌, 집단)의 지표별 정렬 값 행렬"""
+
+    def __init__(self, values: np.ndarray, lower_is_better: np.ndarray):
+        # 열마다 오름차순 정렬 (np.sort는 NaN을 뒤로 보냄)
+        self.sorted = np.sort(values, axis=0)
+        self.counts = (~np.isnan(values)).sum(axis=0)
+        self.size = len(values)
+        self.lower_is_better = lower_is_better
+
+    def _percentiles(self, less, equal):
+        greater = self.counts - less - equal
+        better_than = np.where(self.lower_is_better, greater, less)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = (better_than + 0.5 * equal) / self.counts * 100
+        return np.where(self.counts > 0, pct, np.nan)
+
+    def rank(self, values: np.ndarray) -> np.ndarray:
+        """지표 값 벡터 전체의 백분위 (NaN 값은 NaN)"""
+        less = (self.sorted < values).sum(axis=0)
+        equal = (self.sorted == values).sum(axis=0)
+        return np.where(np.isnan(values), np.nan, self._percentiles(less, equal))
+
+    def percentile(self, j: int, value: float) -> float:
+        """j번째 지표 값 하나의 백분위 (searchsorted)"""
+        if pd.isna(value) or self.counts[j] == 0:
+            return np.nan
+        column = self.sorted[:self.counts[j], j]
+        left = np.searchsorted(column, value, side='left')
+        right = np.searchsorted(column, value, side='right')
+        less = np.zeros_like(self.counts)
+        equal = np.zeros_like(self.counts)
+        less[j], equal[j] = left, right - left
+        return float(self._percentiles(less, equal)[j])
+
+
+class PercentileEngine:
+    """시즌/집단별 백분위 엔진 ((시즌, 집단) 정렬 행렬은 처음 조회할 때 만들어 재사용)"""
+
+    def __init__(self, df: pd.DataFrame, pcode_col: str, metrics, cohorts: dict, lower_is_better=(), stored=None):
+        """
+        Args:
+            stored: 저장된 *_percentile 컬럼 DataFrame (df와 같은 행 순서, 있으면 기본 집단에 사용)
+        """
+        self.metrics = [col for col in metrics if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
+        self.metric_positions = {col: j for j, col in enumerate(self.metrics)}
+        self.cohorts = cohorts
+        self.index = PlayerIndex(df, pcode_col)
+
+        self.values = df[self.metrics].to_numpy(dtype='float64', na_value=np.nan)
+        self.seasons = df['season'].to_numpy()
+        self.lower_is_better = np.array([col in lower_is_better for col in self.metrics])
+
+        # 지표별 저장 백분위 (저장 컬럼이 없는 지표는 NaN, has_stored로 구분)
+        self.stored = None
+        if stored is not None:
+            self.has_stored = np.array([f'{col}_percentile' in stored.columns for col in self.metrics])
+            self.stored = np.column_stack([
+                pd.to_numeric(stored[f'{col}_percentile'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+                if has else np.full(len(df), np.nan)
+                for col, has in zip(self.metrics, self.has_stored)
+            ]) if self.metrics else np.empty((len(df), 0))
+            # 저장 백분위 모집단 밖의 값은 기본 집단 분포에서 제외
+            self.stored_missing = np.isnan(self.stored) & self.has_stored
+
+        # 집단 마스크는 전체 데이터 기준으로 한 번만 계산
+        self.cohort_masks = {}
+        for name, (_, mask_fn) in cohorts.items():
+            if name == STORED_COHORT and self.stored is not None:
+                # 저장 백분위가 하나라도 있는 행 (자격 조건을 채운 선수)
+                mask = (~self.stored_missing & self.has_stored).any(axis=1)
+            elif mask_fn is None:
+                mask = np.ones(len(df), dtype=bool)
+            else:
+                mask = mask_fn(df).fillna(False).to_numpy(dtype=bool)
+            self.cohort_masks[name] = mask
+
+        self._tables = {}
+
+    def cohort_label(self, cohort: str) -> str:
+        return self.cohorts[cohort][0]
+
+    def table(self, season: int, cohort: str = 'all') -> CohortTable:
+        """(시즌, 집단) 정렬 행렬"""
+        key = (int(season), cohort)
+        table = self._tables.get(key)
+        if table is None:
+            rows = (self.seasons == season) & self.cohort_masks[cohort]
+            values = self.values[rows]
+            if cohort == STORED_COHORT and self.stored is not None:
+                values = np.where(self.stored_missing[rows], np.nan, values)
+            table = CohortTable(values, self.lower_is_better)
+            self._tables[key] = table
+        return table
+
+    def cohort_size(self, season: int, cohort: str = 'all') -> int:
+        return self.table(season, cohort).size
+
+    def in_cohort(self, pcode: str, season: int, cohort: str) -> bool:
+        pos = self.index.position(pcode, season)
+        return pos is not None and bool(self.cohort_masks[cohort][pos])
+
+    def percentile(self, season: int, metric: str, value, cohort: str = 'all') -> float:
+        """지표 값 하나의 집단 내 백분위"""
+        return self.table(season, cohort).percentile(self.metric_positions[metric], value)
+
+    def rank_player(self, pcode: str, season: int, cohort: str = 'all', metrics=None) -> pd.Series:
+        """
+        선수의 전체 지표 백분위 (집단에 속하지 않는 선수도 해당 집단 기준으로 계산)
+
+        기본 집단은 저장된 백분위를 그대로 반환 (저장 컬럼이 없는 지표만 계산, 저장 값이 없으면 NaN)
+
+        Returns:
+            지표명 index의 백분위 Series (선수가 없으면 None)
+        """
+        pos = self.index.position(pcode, season)
+        if pos is None:
+            return None
+        ranks = self.table(season, cohort).rank(self.values[pos])
+        if cohort == STORED_COHORT and self.stored is not None:
+            ranks = np.where(self.has_stored, self.stored[pos], ranks)
+        ranks = pd.Series(ranks, index=self.metrics)
+        return ranks if metrics is None else ranks.reindex(metrics)
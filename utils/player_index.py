@@ -0,0 +1,64 @@
+"""
+선수 KPI 조회용 인덱스
+
+(pcode, season) → 행 위치 해시 인덱스와 pcode → 시즌순 행 위치 배열을
+한 번만 만들어 두고, 선수 조회와 커리어 이력 조회를 O(1)로 처리
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class PlayerIndex:
+    """(pcode, season) 해시 인덱스"""
+
+    def __init__(self, df: pd.DataFrame, pcode_col: str):
+        self.df = df
+        self.pcode_col = pcode_col
+
+        pcodes = df[pcode_col].to_numpy()
+        seasons = df['season'].to_numpy()
+
+        # (pcode, season) → 행 위치 (중복 시 첫 행 유지)
+        self._positions = {}
+        for pos, key in enumerate(zip(pcodes, seasons.tolist())):
+            self._positions.setdefault(key, pos)
+
+        # pcode → 시즌 오름차순 행 위치 배열
+        order = np.argsort(seasons, kind='stable')
+        groups = pd.Series(order).groupby(pcodes[order], sort=False).indices
+        self._history = {pcode: order[idx] for pcode, idx in groups.items()}
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def position(self, pcode: str, season: int):
+        """행 위치 반환 (없으면 None)"""
+        return self._positions.get((pcode, int(season)))
+
+    def positions(self, keys) -> np.ndarray:
+        """여러 (pcode, season)의 행 위치 배열 (없는 키는 제외, 요청 순서 유지)"""
+        found = (self._positions.get((pcode, int(season))) for pcode, season in keys)
+        return np.array([pos for pos in found if pos is not None], dtype=np.intp)
+
+    def get(self, pcode: str, season: int):
+        """특정 선수-시즌 행 (없으면 None)"""
+        pos = self.position(pcode, season)
+        if pos is None:
+            return None
+        return self.df.iloc[pos]
+
+    def history_positions(self, pcode: str) -> np.ndarray:
+        """선수의 시즌순 행 위치 배열"""
+        return self._history.get(pcode, np.empty(0, dtype=np.intp))
+
+    def history(self, pcode: str) -> pd.DataFrame:
+        """선수의 전체 시즌 데이터 (시즌 오름차순)"""
+        return self.df.iloc[self.history_positions(pcode)]
+
+    def seasons(self, pcode: str) -> list:
+        """선수의 출전 시즌 목록"""
+        return self.df['season'].to_numpy()[self.history_positions(pcode)].tolist()
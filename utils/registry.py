@@ -0,0 +1,92 @@
+"""
+공유 데이터셋 레지스트리
+
+모든 페이지(리포트, 리더보드, 비교)가 같은 테이블을 프로세스당 한 번만 읽고
+한 번만 정규화해 공유
+- KPI 테이블은 컬럼 그룹 단위로 로드 (필요한 그룹만, 그룹별 1회)
+- 캐시된 프레임은 모든 세션이 공유하므로 페이지에는 읽기 전용 뷰를 반환
+  (얕은 복사 + pandas 3 Copy-on-Write: 뷰를 수정해도 원본은 그대로, 수정 전까지 메모리 공유)
+- 같은 컬럼을 페이지별로 다시 읽지 않으므로 방문한 페이지 수와 무관하게 메모리 일정
+- 로드 결과는 데이터 스냅샷에 보관 (파일이 바뀌면 새 스냅샷으로 교체, utils/snapshot.py)
+"""
+
+import pandas as pd
+
+from utils.column_groups import GROUP_NAMES, read_column_groups
+from utils.schema import normalize_kpi
+from utils.snapshot import DATA_DIR, active_snapshot, snapshot_resource
+
+BATTER_KPI_PATH = DATA_DIR / "batter_kpi.parquet"
+PITCHER_KPI_PATH = DATA_DIR / "pitcher_kpi.parquet"
+PLAYERS_PATH = DATA_DIR / "players.parquet"
+TEAMS_PATH = DATA_DIR / "teams.parquet"
+
+# 테이블 이름 → (경로, 컬럼 그룹 종류) (종류가 None이면 그룹 없이 통째로 로드, 정규화 안 함)
+DATASETS = {
+    'batter_kpi': (BATTER_KPI_PATH, 'batter'),
+    'pitcher_kpi': (PITCHER_KPI_PATH, 'pitcher'),
+    'players': (PLAYERS_PATH, None),
+    'teams': (TEAMS_PATH, None),
+}
+
+def get_memory_report() -> pd.DataFrame:
+    """사용 중인 스냅샷에 로드된 테이블(그룹)별 메모리 절감 리포트"""
+    report = dict(active_snapshot().memory_report)
+    return pd.DataFrame.from_dict(report, orient='index').rename_axis('table').reset_index()
+
+
+@snapshot_resource
+def get_column_groups(table: str) -> dict:
+    """KPI 테이블 컬럼 그룹 (parquet 스키마 기반)"""
+    path, kind = DATASETS[table]
+    return read_column_groups(path, kind)
+
+
+@snapshot_resource
+def load_frame(table: str, group: str = None) -> pd.DataFrame:
+    """
+    테이블(컬럼 그룹) 로드 - 스냅샷 공유 캐시 원본
+
+    내부 인덱스/엔진 생성용. 반환값을 수정하지 말 것 (페이지에서는 view 사용)
+    """
+    path, kind = DATASETS[table]
+    if kind is None:
+        return pd.read_parquet(path)
+
+    columns = get_column_groups(table)[group]
+    name = f'{table}.{group}'
+    df, report = normalize_kpi(pd.read_parquet(path, columns=columns))
+    active_snapshot().memory_report[name] = report
+    return df
+
+
+def _groups_for(table: str, columns) -> list:
+    """컬럼들을 담고 있는 그룹 목록 (로드 순서)"""
+    groups = get_column_groups(table)
+    if columns is None:
+        return GROUP_NAMES
+    wanted = set(columns)
+    missing = wanted.difference(*groups.values())
+    if missing:
+        raise KeyError(f"{table}: 없는 컬럼 {sorted(missing)}")
+    return [group for group in GROUP_NAMES if wanted.intersection(groups[group])]
+
+
+def view(table: str, columns=None) -> pd.DataFrame:
+    """
+    테이블 읽기 전용 뷰 (columns 지정 시 해당 컬럼만, 지정 순서 유지)
+
+    필요한 컬럼 그룹만 로드하고 데이터는 캐시 원본과 공유
+    """
+    _, kind = DATASETS[table]
+    if kind is None:
+        df = load_frame(table)
+        return (df if columns is None else df[list(columns)]).copy(deep=False)
+
+    groups = _groups_for(table, columns)
+    parts = [load_frame(table, group) for group in groups]
+    df = parts[0] if len(parts) == 1 else pd.concat(parts, axis=1)
+    if columns is not None:
+        df = df[list(columns)]
+    return df.copy(deep=False)
+
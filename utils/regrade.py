@@ -0,0 +1,269 @@
+"""
+사용자 가중치 재등급 엔진
+
+카테고리/OVR 등급은 parquet에 계산된 값으로 들어 있어 가중치를 바꿔 볼 수 없고,
+리포트 페이지(METRIC_WEIGHTS)와 export(metric_definitions)의 가중치도 서로 다름
+- 세부 지표 등급 행렬(선수 × 지표)을 한 번 만들어 두고
+  카테고리 등급 = 지표 등급 행렬 × 가중치 행렬(지표 × 카테고리) / 유효 가중치 합
+- OVR = 카테고리 등급 × 카테고리 가중치 / 유효 가중치 합
+- 결측 지표 등급은 해당 선수의 가중치 합에서 빠짐 (남은 지표 가중 평균)
+- 가중치 조합별 결과를 LRU로 보관 (같은 가중치는 재계산 없이 재사용, 세션 스레드 간 공유라 lock 사용)
+
+리포트 페이지 상세 지표 카드가 표시하는 가중치(아래 *_METRIC_WEIGHTS)를 기본값으로 사용
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.player_index import PlayerIndex
+
+# 카테고리별 세부 지표: {지표: (표시 이름, 기본 가중치, 단위[, 역방향])}
+# unit: '' = 그대로, '%' = 이미 백분율(그대로 표시), '%*100' = 0-1 비율(×100 필요)
+BATTER_METRIC_WEIGHTS = {
+    'contact': {
+        'batting_average': ('타율', 0.45, ''),
+        'strikeout_rate': ('삼진율', 0.25, '%'),  # 이미 백분율
+        'overall_contact_rate': ('전체 컨택률', 0.08, '%'),
+        'two_strike_contact_rate': ('2스트라이크 컨택률', 0.10, '%'),
+        'in_zone_contact_rate': ('존내 컨택률', 0.07, '%'),
+        'foul_ball_rate': ('파울볼률', 0.05, '%'),
+    },
+    'game_power': {
+        'home_run_rate': ('홈런율', 0.35, '%'),  # 이미 백분율
+        'home_run_to_xbh_ratio': ('홈런/장타 비율', 0.25, '%*100'),  # 0-1 비율
+        'isolated_power_hr': ('ISO (홈런)', 0.25, ''),
+        'home_run_per_hit_rate': ('홈런/안타 비율', 0.15, '%'),  # 이미 백분율
+    },
+    'gap_power': {
+        'double_rate': ('2루타율', 0.30, '%'),  # 이미 백분율
+        'triple_rate': ('3루타율', 0.05, '%'),
+        'isolated_power_gap': ('ISO (갭)', 0.30, ''),
+        'gap_hit_rate': ('갭 히트율', 0.20, '%'),
+        'double_to_single_ratio': ('2루타/1루타 비율', 0.15, ''),
+    },
+    'discipline': {
+        'walk_rate': ('볼넷율', 0.35, '%'),  # 이미 백분율
+        'chase_rate': ('체이스율', 0.25, '%'),
+        'zone_swing_rate': ('존 스윙률', 0.30, '%'),
+        'first_pitch_swing_rate': ('초구 스윙률', 0.08, '%'),
+        'three_zero_discipline': ('3-0 규율', 0.02, '%'),
+    },
+    'consistency': {
+        'monthly_variance': ('월별 분산', 0.35, ''),
+        'left_right_ops_diff': ('좌우 OPS 차이', 0.30, ''),
+        'fastball_contact_rate': ('직구 컨택률', 0.15, '%'),
+        'breaking_contact_rate': ('변화구 컨택률', 0.10, '%'),
+        'offspeed_contact_rate': ('체인지업 컨택률', 0.10, '%'),
+    },
+    'clutch': {
+        'high_leverage_performance': ('고레버리지 성적', 0.30, ''),
+        'risp_average': ('득점권 타율', 0.25, ''),
+        'two_out_rbi_rate': ('2아웃 타점율', 0.20, '%'),
+        'late_close_performance': ('후반 접전 성적', 0.20, ''),
+        'bases_loaded_average': ('만루 타율', 0.05, ''),
+    }
+}
+
+PITCHER_METRIC_WEIGHTS = {
+    'control': {
+        'first_pitch_strike_rate': ('초구 스트라이크율', 0.25, '%'),
+        'walk_avoidance_rate': ('볼넷 회피율', 0.25, '%'),
+        'three_ball_recovery_rate': ('3볼 회복률', 0.20, '%'),
+        'favorable_count_entry_rate': ('유리한 카운트 진입률', 0.15, '%'),
+        'main_pitch_control_rate': ('주구종 제구율', 0.15, '%'),
+    },
+    'aggression': {
+        'two_strike_strikeout_rate': ('2스트라이크 삼진율', 0.35, '%'),
+        'early_strike_rate': ('초반 스트라이크율', 0.25, '%'),
+        'finishing_ability_rate': ('마무리 능력', 0.25, '%'),
+        'high_velocity_decision_rate': ('고속구 결정률', 0.15, '%'),
+    },
+    'efficiency': {
+        'avg_pitches_per_batter': ('타자당 평균 투구수', 0.40, '', True),  # 역방향
+        'count_efficiency_index': ('카운트 효율 지수', 0.30, ''),
+        'full_count_avoidance_rate': ('풀카운트 회피율', 0.30, '%'),
+    },
+    'stuff': {
+        'whiff_rate': ('헛스윙 유도율', 0.30, '%'),
+        'chase_rate': ('체이스율', 0.25, '%'),
+        'in_zone_whiff_rate': ('존내 헛스윙률', 0.20, '%'),
+        'unhittable_pitch_rate': ('언히터블 피치율', 0.15, '%'),
+        'avg_fastball_velocity': ('평균 패스트볼 구속', 0.10, 'km/h'),
+    },
+    'clutch': {
+        'risp_out_rate': ('득점권 아웃률', 0.25, '%'),
+        'bases_loaded_escape_rate': ('만루 탈출률', 0.20, '%'),
+        'two_out_inning_end_rate': ('2아웃 이닝 종료율', 0.20, '%'),
+        'first_batter_out_rate': ('첫 타자 아웃률', 0.20, '%'),
+        'close_game_prevention_rate': ('접전 실점 방지율', 0.10, '%'),
+        'momentum_protection_rate': ('모멘텀 보호율', 0.05, '%'),
+    }
+}
+
+# 카테고리 표시 이름 (OVR 가중치 기본값은 모두 1 = 단순 평균)
+BATTER_CATEGORY_NAMES = {
+    'contact': '컨택',
+    'game_power': '홈런 파워',
+    'gap_power': '갭 파워',
+    'discipline': '선구안',
+    'consistency': '일관성',
+    'clutch': '클러치',
+}
+PITCHER_CATEGORY_NAMES = {
+    'control': '제구력',
+    'aggression': '공격성',
+    'efficiency': '효율성',
+    'stuff': '구위',
+    'clutch': '클러치',
+}
+
+# 재등급 결과 컬럼 (parquet의 같은 이름 컬럼을 대신함)
+BATTER_GRADE_COLUMN = '{}_grade_weighted'
+PITCHER_GRADE_COLUMN = '{}_grade'
+
+
+def default_metric_weights(metric_weights: dict) -> dict:
+    """{카테고리: {지표: (이름, 가중치, ...)}} → {카테고리: {지표: 가중치}}"""
+    return {
+        category: {metric: info[1] for metric, info in metrics.items()}
+        for category, metrics in metric_weights.items()
+    }
+
+
+def weight_key(metric_weights: dict, category_weights: dict) -> tuple:
+    """가중치 조합의 hashable 키 (캐시 키로 사용)"""
+    return (
+        tuple((category, tuple(sorted(metrics.items()))) for category, metrics in sorted(metric_weights.items())),
+        tuple(sorted(category_weights.items())),
+    )
+
+
+def _weighted_mean(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """결측을 제외한 행별 가중 평균 (values: n × m, weights: m × k → n × k, 유효 가중치 0이면 NaN)"""
+    present = ~np.isnan(values)
+    total = np.where(present, values, 0.0) @ weights
+    weight_sum = present.astype('float64') @ weights
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(weight_sum > 0, total / weight_sum, np.nan)
+
+
+class RegradeEngine:
+    """지표 등급 행렬 기반 카테고리/OVR 재등급"""
+
+    def __init__(self, df: pd.DataFrame, pcode_col: str, metric_weights: dict, category_names: dict,
+                 column_format: str, cache_size: int = 32):
+        """
+        Args:
+            df: identity + 세부 지표 등급(*_grade) 컬럼을 포함한 전체 KPI
+            metric_weights: 기본 가중치 {카테고리: {지표: (이름, 가중치, ...)}}
+            category_names: {카테고리: 표시 이름} (OVR 계산 순서)
+            column_format: 결과 등급 컬럼 이름 형식 (예: '{}_grade_weighted')
+        """
+        self.pcode_col = pcode_col
+        self.categories = list(category_names)
+        self.category_names = category_names
+        self.column_format = column_format
+        self.columns = [column_format.format(category) for category in self.categories + ['overall']]
+        self.cache_size = cache_size
+
+        self.default_metric_weights = default_metric_weights(metric_weights)
+        self.metric_names = {
+            metric: info[0] for metrics in metric_weights.values() for metric, info in metrics.items()
+        }
+        self.default_category_weights = {category: 1.0 for category in self.categories}
+
+        # 지표 등급 행렬 (가중치에 등장하는 지표 중 등급 컬럼이 있는 것만)
+        self.metrics = []
+        for metrics in self.default_metric_weights.values():
+            for metric in metrics:
+                if f'{metric}_grade' in df.columns and metric not in self.metrics:
+                    self.metrics.append(metric)
+        self.metric_positions = {metric: j for j, metric in enumerate(self.metrics)}
+        self.grades = df[[f'{metric}_grade' for metric in self.metrics]].to_numpy(dtype='float64', na_value=np.nan)
+
+        self.index = PlayerIndex(df, pcode_col)
+        self.identity = df[[pcode_col, 'season']].reset_index(drop=True)
+        self.seasons = df['season'].to_numpy()
+
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def weight_matrix(self, metric_weights: dict) -> np.ndarray:
+        """지표 × 카테고리 가중치 행렬 (음수 가중치는 0)"""
+        matrix = np.zeros((len(self.metrics), len(self.categories)))
+        for k, category in enumerate(self.categories):
+            for metric, weight in metric_weights.get(category, {}).items():
+                j = self.metric_positions.get(metric)
+                if j is not None:
+                    matrix[j, k] = max(float(weight), 0.0)
+        return matrix
+
+    def is_default(self, metric_weights: dict = None, category_weights: dict = None) -> bool:
+        """기본 가중치인지 여부"""
+        return (metric_weights in (None, self.default_metric_weights)
+                and category_weights in (None, self.default_category_weights))
+
+    def grades_for(self, metric_weights: dict = None, category_weights: dict = None) -> np.ndarray:
+        """
+        전체 행의 재등급 행렬 (행 × [카테고리..., overall]), 가중치 조합별 memoize
+
+        반환 배열은 읽기 전용
+        """
+        metric_weights = metric_weights or self.default_metric_weights
+        category_weights = category_weights or self.default_category_weights
+        key = weight_key(metric_weights, category_weights)
+
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                return result
+
+        category_grades = _weighted_mean(self.grades, self.weight_matrix(metric_weights))
+        overall_weights = np.array([[max(float(category_weights.get(category, 0.0)), 0.0)] for category in self.categories])
+        overall = _weighted_mean(category_grades, overall_weights)
+
+        result = np.round(np.hstack([category_grades, overall]), 1)
+        result.flags.writeable = False
+
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        return result
+
+    def season(self, season: int, metric_weights: dict = None, category_weights: dict = None) -> pd.DataFrame:
+        """시즌 전체 선수의 재등급 결과 (pcode, season + 등급 컬럼)"""
+        rows = np.flatnonzero(self.seasons == season)
+        grades = self.grades_for(metric_weights, category_weights)[rows]
+        result = self.identity.iloc[rows].reset_index(drop=True)
+        for j, col in enumerate(self.columns):
+            result[col] = grades[:, j]
+        return result
+
+    def player(self, pcode: str, season: int, metric_weights: dict = None, category_weights: dict = None) -> pd.Series:
+        """선수-시즌 재등급 결과 Series (없으면 None)"""
+        pos = self.index.position(pcode, season)
+        if pos is None:
+            return None
+        return pd.Series(self.grades_for(metric_weights, category_weights)[pos], index=self.columns)
+
+    def history(self, pcode: str, metric_weights: dict = None, category_weights: dict = None) -> pd.DataFrame:
+        """선수의 시즌순 재등급 결과"""
+        positions = self.index.history_positions(pcode)
+        grades = self.grades_for(metric_weights, category_weights)[positions]
+        return pd.DataFrame(grades, columns=self.columns, index=self.seasons[positions])
+
+    def apply(self, df: pd.DataFrame, metric_weights: dict = None, category_weights: dict = None) -> pd.DataFrame:
+        """df의 등급 컬럼을 (pcode, season)이 같은 행의 재등급 값으로 교체한 복사본"""
+        positions = [self.index.position(pcode, season) for pcode, season in zip(df[self.pcode_col], df['season'])]
+        found = np.array([pos is not None for pos in positions], dtype=bool)
+        rows = np.array([pos if pos is not None else 0 for pos in positions], dtype=np.intp)
+
+        grades = self.grades_for(metric_weights, category_weights)[rows]
+        grades[~found] = np.nan
+        return df.assign(**{col: grades[:, j] for j, col in enumerate(self.columns)})
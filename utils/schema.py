@@ -0,0 +1,124 @@
+"""
+KPI 테이블 스키마 정규화
+
+parquet에서 문자열/object로 읽히는 숫자 컬럼을 로드 시점에 한 번만
+네이티브 타입으로 변환하고, 메모리를 줄이기 위해 작은 타입을 사용
+- 20-80 등급 → nullable 소형 정수 (Int8/Int16)
+- 비율/실수 지표 → float32
+- 팀/역할/유형 → category
+"""
+
+import numpy as np
+import pandas as pd
+
+# category로 변환할 컬럼
+CATEGORICAL_COLUMNS = [
+    'team_name', 'team_code', 'pitcher_role', 'role_type',
+    'batter_type', 'primary_position_name',
+]
+
+# 숫자처럼 보여도 문자열로 유지할 식별자 컬럼
+TEXT_COLUMNS = ['batter_pcode', 'pitcher_pcode', 'pcode']
+
+# 정수로 유지할 키 컬럼
+KEY_COLUMNS = ['season']
+
+
+def is_grade_column(col: str) -> bool:
+    """등급 컬럼 여부 (*_grade, *_grade_weighted)"""
+    return col.endswith('_grade') or col.endswith('_grade_weighted')
+
+
+def _is_text_dtype(series: pd.Series) -> bool:
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+
+def _coerce_numeric(col: str, series: pd.Series):
+    """
+    숫자 컬럼이면 숫자로 변환한 결과와 NaN으로 바뀐 값 수 반환 (텍스트 컬럼이면 (None, 0))
+
+    등급/백분위 컬럼과 값 대부분이 숫자인 컬럼은 숫자 컬럼으로 보고,
+    숫자로 바뀌지 않는 값(잘못 들어간 문자열 등)은 NaN으로 처리
+    """
+    numeric = pd.to_numeric(series, errors='coerce')
+    parsed = int(numeric.notna().sum())
+    present = int(series.notna().sum())
+    if parsed == present or is_grade_column(col) or col.endswith('_percentile') or parsed * 2 > present:
+        return numeric, present - parsed
+    return None, 0
+
+
+def _to_small_int(numeric: pd.Series, float_dtype: str) -> pd.Series:
+    """정수 값이면 nullable 소형 정수로, 소수점이 있으면 실수 타입으로"""
+    values = numeric.dropna()
+    if len(values) and not (values % 1 == 0).all():
+        return numeric.astype(float_dtype)
+    if len(values) == 0 or (values.min() >= -128 and values.max() <= 127):
+        return numeric.astype('Int8')
+    return numeric.astype('Int16')
+
+
+def normalize_kpi(df: pd.DataFrame, float_dtype: str = 'float32'):
+    """
+    KPI DataFrame 타입 정규화
+
+    float_dtype을 'float64'로 주면 실수 정밀도는 유지하고
+    문자열 숫자 변환과 정수/category 축소만 수행 (JSON 내보내기용)
+
+    Returns:
+        (정규화된 DataFrame, 메모리 리포트 dict)
+    """
+    before = int(df.memory_usage(deep=True).sum())
+
+    columns = {}
+    coerced = 0
+    for col in df.columns:
+        series = df[col]
+
+        if col in TEXT_COLUMNS or col in KEY_COLUMNS:
+            columns[col] = series
+            continue
+
+        if col in CATEGORICAL_COLUMNS:
+            columns[col] = series.astype('category')
+            continue
+
+        if _is_text_dtype(series):
+            numeric, invalid = _coerce_numeric(col, series)
+            if numeric is None:
+                columns[col] = series
+                continue
+            series = numeric
+            coerced += invalid
+
+        if is_grade_column(col) and pd.api.types.is_numeric_dtype(series):
+            columns[col] = _to_small_int(series, float_dtype)
+        elif pd.api.types.is_float_dtype(series):
+            columns[col] = series.astype(float_dtype)
+        elif pd.api.types.is_integer_dtype(series) and not pd.api.types.is_extension_array_dtype(series):
+            columns[col] = pd.to_numeric(series, downcast='integer')
+        else:
+            columns[col] = series
+
+    result = pd.DataFrame(columns, index=df.index)
+    after = int(result.memory_usage(deep=True).sum())
+
+    report = {
+        'rows': len(df),
+        'columns': len(df.columns),
+        'bytes_before': before,
+        'bytes_after': after,
+        'bytes_saved': before - after,
+        'ratio': round(before / after, 2) if after else np.nan,
+        'values_coerced': coerced,
+    }
+    return result, report
+
+
+def format_report(name: str, report: dict) -> str:
+    """메모리 리포트 한 줄 요약"""
+    return (
+        f"{name}: {report['bytes_before'] / 1024:,.0f} KB → "
+        f"{report['bytes_after'] / 1024:,.0f} KB "
+        f"({report['bytes_saved'] / 1024:,.0f} KB saved, x{report['ratio']})"
+    )
@@ -0,0 +1,118 @@
+"""
+선수 이름 검색 인덱스
+
+시즌별로 투타 정보 조인과 표시 이름 생성을 미리 끝내 두고,
+이름 bigram 포스팅 리스트와 초성 문자열로 검색어를 바로 매칭
+"""
+
+import pandas as pd
+
+# 한글 음절 초성 (유니코드 순서)
+CHOSEONG = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+CHOSEONG_SET = set(CHOSEONG)
+
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+JUNGSEONG_JONGSEONG_COUNT = 21 * 28
+
+
+def to_choseong(text: str) -> str:
+    """문자열의 한글 음절을 초성으로 변환 (그 외 문자는 그대로)"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_START <= code <= HANGUL_END:
+            chars.append(CHOSEONG[(code - HANGUL_START) // JUNGSEONG_JONGSEONG_COUNT])
+        else:
+            chars.append(ch)
+    return ''.join(chars)
+
+
+def is_choseong_query(query: str) -> bool:
+    """초성으로만 이루어진 검색어인지 확인"""
+    return len(query) > 0 and all(ch in CHOSEONG_SET for ch in query)
+
+
+def _bigrams(text: str):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def make_display_names(names: pd.Series, phand: pd.Series, stand: pd.Series) -> pd.Series:
+    """투타 정보로 표시 이름 생성 (동명이인 구분)"""
+    has_hand = phand.notna() & stand.notna()
+    with_hand = names + " (" + phand.fillna('') + "투" + stand.fillna('') + "타)"
+    return with_hand.where(has_hand, names)
+
+
+class SeasonSearchIndex:
+    """한 시즌의 선수 이름 검색 인덱스"""
+
+    def __init__(self, candidates: pd.DataFrame):
+        # 결과가 이미 정렬되어 있도록 이름순으로 보관
+        self.results = candidates.sort_values('player_name', kind='stable').reset_index(drop=True)
+
+        names = self.results['player_name'].fillna('').tolist()
+        self._names = names
+        self._choseong = [to_choseong(name) for name in names]
+
+        # bigram → 행 위치 집합 (이름, 초성 각각)
+        self._name_postings = {}
+        self._choseong_postings = {}
+        for pos, (name, cho) in enumerate(zip(names, self._choseong)):
+            for gram in _bigrams(name):
+                self._name_postings.setdefault(gram, []).append(pos)
+            for gram in _bigrams(cho):
+                self._choseong_postings.setdefault(gram, []).append(pos)
+
+    def _candidates(self, query: str, postings: dict):
+        grams = _bigrams(query)
+        if not grams:
+            return range(len(self._names))
+        lists = sorted((postings.get(gram, []) for gram in grams), key=len)
+        if not lists[0]:
+            return []
+        result = set(lists[0])
+        for other in lists[1:]:
+            result.intersection_update(other)
+            if not result:
+                break
+        return sorted(result)
+
+    def positions(self, query: str) -> list:
+        """검색어와 매칭되는 행 위치 (이름순)"""
+        if is_choseong_query(query):
+            targets, postings = self._choseong, self._choseong_postings
+        else:
+            targets, postings = self._names, self._name_postings
+        return [pos for pos in self._candidates(query, postings) if query in targets[pos]]
+
+    def search(self, query: str) -> pd.DataFrame:
+        """검색 결과 DataFrame (이름순 정렬)"""
+        return self.results.iloc[self.positions(query)]
+
+
+def build_search_indexes(kpi: pd.DataFrame, players: pd.DataFrame, pcode_col: str) -> dict:
+    """시즌별 검색 인덱스 생성"""
+    hands = players[['pcode', 'phand', 'stand']]
+
+    indexes = {}
+    for season, season_df in kpi.groupby('season', sort=False):
+        candidates = season_df[[pcode_col, 'player_name', 'team_name']].drop_duplicates()
+        candidates = candidates.merge(hands, left_on=pcode_col, right_on='pcode', how='left')
+        candidates['display_name'] = make_display_names(
+            candidates['player_name'], candidates['phand'], candidates['stand']
+        )
+        indexes[int(season)] = SeasonSearchIndex(candidates)
+
+    return indexes
+
+
+def search(indexes: dict, season: int, query: str) -> pd.DataFrame:
+    """시즌 인덱스에서 선수 검색"""
+    index = indexes.get(int(season))
+    if index is None:
+        return pd.DataFrame()
+    return index.search(query)
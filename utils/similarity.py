@@ -0,0 +1,87 @@
+"""
+유사 선수 (k-NN) 인덱스
+
+선수-시즌마다 등급 벡터(카테고리 등급 또는 세부 지표 등급)를 정규화한 행렬을
+한 번 만들어 두고, 조회는 행렬 전체와의 거리 한 번 계산 + argpartition으로 처리
+- 컬럼별 표준화 (평균 0, 표준편차 1), 결측은 평균(0)으로 대체, 전부 결측인 컬럼은 제외
+- 거리 = 유클리드 거리 / √(지표 수) (지표 수와 무관하게 비교 가능한 RMS 거리)
+- 유사도 = 100 × exp(-거리)
+- 행 제곱 norm을 미리 계산해 |a-b|² = |a|² + |b|² - 2a·b 로 계산
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.player_index import PlayerIndex
+
+# 유사도 계산 기준
+CATEGORY = 'category'
+METRIC = 'metric'
+
+SIMILARITY_FEATURES = {
+    CATEGORY: '카테고리 등급',
+    METRIC: '세부 지표 등급',
+}
+
+
+class SimilarityIndex:
+    """선수-시즌 등급 벡터 k-NN 인덱스"""
+
+    def __init__(self, identity: pd.DataFrame, features: pd.DataFrame, pcode_col: str):
+        """
+        Args:
+            identity: pcode, season 컬럼을 포함한 DataFrame (features와 같은 행 순서)
+            features: 유사도 계산에 쓸 숫자 컬럼들
+        """
+        self.pcode_col = pcode_col
+        self.index = PlayerIndex(identity, pcode_col)
+        self.pcodes = identity[pcode_col].to_numpy()
+
+        # 값이 하나도 없는 컬럼은 제외
+        values = features.to_numpy(dtype='float64', na_value=np.nan)
+        observed = ~np.isnan(values).all(axis=0)
+        values = values[:, observed]
+        self.feature_names = [col for col, keep in zip(features.columns, observed) if keep]
+
+        mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0)
+        std = np.where(np.isfinite(std) & (std > 0), std, 1.0)
+
+        matrix = (values - np.nan_to_num(mean)) / std
+        self.matrix = np.ascontiguousarray(np.nan_to_num(matrix, nan=0.0))
+        self.norms = np.einsum('ij,ij->i', self.matrix, self.matrix)
+        self.scale = np.sqrt(max(len(self.feature_names), 1))
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def distances(self, pos: int) -> np.ndarray:
+        """pos 행과 전체 행의 RMS 거리"""
+        squared = self.norms + self.norms[pos] - 2.0 * (self.matrix @ self.matrix[pos])
+        return np.sqrt(np.maximum(squared, 0.0)) / self.scale
+
+    def neighbor_positions(self, pcode: str, season: int, k: int = 10, exclude_same_player: bool = True):
+        """
+        가까운 선수-시즌 k개의 (행 위치, 거리) (가까운 순, 선수가 없으면 None)
+
+        exclude_same_player가 False면 같은 선수의 다른 시즌도 포함 (자기 자신은 항상 제외)
+        """
+        pos = self.index.position(pcode, season)
+        if pos is None:
+            return None
+
+        distances = self.distances(pos)
+        excluded = self.pcodes == pcode if exclude_same_player else np.arange(len(distances)) == pos
+        distances[excluded] = np.inf
+
+        k = min(k, int((~excluded).sum()))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest], kind='stable')]
+        return nearest, distances[nearest]
+
+
+def similarity_score(distances) -> np.ndarray:
+    """RMS 거리 → 0-100 유사도"""
+    return np.round(100 * np.exp(-np.asarray(distances, dtype='float64')), 1)
@@ -0,0 +1,229 @@
+"""
+데이터 스냅샷 (핫 리로드)
+
+data/*.parquet에서 만든 테이블과 인덱스를 스냅샷 단위로 묶어 관리
+- 스냅샷은 파일 시그니처(파일별 mtime, 크기)로 식별하고, 리소스는 스냅샷 안에 캐시
+- 감시 스레드가 주기적으로 시그니처를 확인하고, 바뀐 뒤 다음 확인까지 그대로면(쓰기 완료)
+  새 스냅샷의 테이블/인덱스를 백그라운드에서 모두 만든 뒤 현재 스냅샷 참조를 한 번에 교체
+- 스크립트 실행은 시작할 때 스냅샷 버전을 세션에 고정(pin_snapshot)하므로
+  실행 도중 교체돼도 끝까지 이전 스냅샷을 사용 (fragment 재실행도 마지막 전체 실행의 스냅샷)
+- 세션은 버전만 보관하고 스냅샷은 최근 KEEP_SNAPSHOTS개(최신 + 직전)만 유지
+  (더 오래된 스냅샷은 유휴 세션이 고정해 두었어도 해제되고, 그 세션은 최신 스냅샷을 사용)
+- 새 스냅샷 생성에 실패하면(쓰기 도중 읽기 등) 현재 스냅샷을 유지하고 다음 변경을 기다림
+"""
+
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# 감시 주기 (초)
+DATA_POLL_SECONDS = 10
+
+# 유지할 스냅샷 수 (최신 + 직전)
+KEEP_SNAPSHOTS = 2
+
+# 세션에 고정한 스냅샷 버전 session_state 키
+_PIN_KEY = '_data_snapshot'
+
+
+def file_signature(data_dir: Path = DATA_DIR) -> tuple:
+    """data/*.parquet 시그니처 ((파일 이름, mtime_ns, 크기), ...)"""
+    signature = []
+    for path in sorted(data_dir.glob('*.parquet')):
+        stat = path.stat()
+        signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class Snapshot:
+    """한 시점의 데이터 파일로 만든 테이블/인덱스 모음"""
+
+    def __init__(self, signature: tuple):
+        self.signature = signature
+        self.version = hashlib.sha1(repr(signature).encode()).hexdigest()[:8]
+        self.loaded_at = time.time()
+        self.build_seconds = None
+        # 테이블(그룹)별 정규화 메모리 리포트 {이름: 리포트}
+        self.memory_report = {}
+        self._resources = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """리소스 조회 (없으면 build()로 만들어 보관, 같은 키는 동시에 한 번만 생성)"""
+        try:
+            return self._resources[key]
+        except KeyError:
+            pass
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._resources:
+                self._resources[key] = build()
+            return self._resources[key]
+
+    @contextmanager
+    def activated(self):
+        """현재 스레드에서 이 스냅샷을 사용 (백그라운드 생성용)"""
+        previous = getattr(_local, 'snapshot', None)
+        _local.snapshot = self
+        try:
+            yield self
+        finally:
+            _local.snapshot = previous
+
+    def run(self, func, *args):
+        """이 스냅샷을 활성화한 채로 func 실행"""
+        with self.activated():
+            return func(*args)
+
+
+_local = threading.local()
+_current = None
+_current_lock = threading.Lock()
+# 유지 중인 스냅샷 {버전: 스냅샷} (오래된 순)
+_live = OrderedDict()
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def _set_current(snapshot: Snapshot):
+    """최신 스냅샷 교체 (_current_lock 안에서 호출, 오래된 스냅샷 해제)"""
+    global _current
+    _current = snapshot
+    _live[snapshot.version] = snapshot
+    _live.move_to_end(snapshot.version)
+    while len(_live) > KEEP_SNAPSHOTS:
+        _live.popitem(last=False)
+
+
+def current_snapshot() -> Snapshot:
+    """최신 스냅샷 (처음 호출 시 현재 파일로 생성)"""
+    if _current is None:
+        with _current_lock:
+            if _current is None:
+                _set_current(Snapshot(file_signature()))
+    return _current
+
+
+def _session_state():
+    """스크립트 실행 중이면 session_state (백그라운드 스레드면 None)"""
+    if get_script_run_ctx() is None:
+        return None
+    return st.session_state
+
+
+def active_snapshot() -> Snapshot:
+    """
+    사용할 스냅샷 (스레드에서 활성화한 스냅샷 → 세션 고정 스냅샷 → 최신 스냅샷)
+
+    세션이 고정한 스냅샷이 이미 해제됐으면 최신 스냅샷
+    """
+    snapshot = getattr(_local, 'snapshot', None)
+    if snapshot is not None:
+        return snapshot
+    session_state = _session_state()
+    if session_state is not None:
+        snapshot = _live.get(session_state.get(_PIN_KEY))
+        if snapshot is not None:
+            return snapshot
+    return current_snapshot()
+
+
+def pin_snapshot() -> Snapshot:
+    """이번 스크립트 실행에 최신 스냅샷 고정 (페이지 맨 위에서 호출, 세션에는 버전만 보관)"""
+    snapshot = current_snapshot()
+    session_state = _session_state()
+    if session_state is not None:
+        session_state[_PIN_KEY] = snapshot.version
+    return snapshot
+
+
+def data_version() -> str:
+    """사용 중인 스냅샷 버전 (데이터에서 파생된 캐시 키에 포함)"""
+    return active_snapshot().version
+
+
+def snapshot_resource(func):
+    """
+    스냅샷별 리소스 캐시 데코레이터 (st.cache_resource 대신 사용)
+
+    인자별 결과를 사용 중인 스냅샷에 보관하므로 스냅샷이 교체되면 함께 교체됨
+    반환값은 여러 세션이 공유하므로 수정하지 말 것
+    """
+    name = f'{func.__module__}.{func.__qualname__}'
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        return active_snapshot().get(key, lambda: func(*args, **kwargs))
+
+    return wrapper
+
+
+def reload_snapshot(signature: tuple, prepare) -> Snapshot:
+    """
+    새 스냅샷을 만들어 prepare(snapshot)로 테이블/인덱스를 모두 생성한 뒤 교체
+
+    prepare가 실패하면 예외를 그대로 올리고 현재 스냅샷은 유지
+    """
+    snapshot = Snapshot(signature)
+    start = time.perf_counter()
+    prepare(snapshot)
+    snapshot.build_seconds = time.perf_counter() - start
+    with _current_lock:
+        _set_current(snapshot)
+    return snapshot
+
+
+def _watch(prepare, interval: float):
+    """파일 시그니처 감시 루프"""
+    pending = None
+    failed = None
+    while True:
+        time.sleep(interval)
+        try:
+            signature = file_signature()
+        except OSError:
+            continue
+
+        if signature == current_snapshot().signature or signature == failed:
+            pending = None
+            continue
+        if signature != pending:
+            # 쓰는 중일 수 있으므로 다음 확인에서도 같으면 교체
+            pending = signature
+            continue
+
+        pending = None
+        try:
+            reload_snapshot(signature, prepare)
+        except Exception:
+            # 같은 파일로 재시도하지 않음 (파일이 다시 바뀌면 재시도)
+            failed = signature
+
+
+def start_watcher(prepare, interval: float = DATA_POLL_SECONDS) -> threading.Thread:
+    """
+    데이터 파일 감시 스레드 시작 (프로세스당 1개, 이미 시작했으면 기존 스레드 반환)
+
+    Args:
+        prepare: prepare(snapshot) - 새 스냅샷의 테이블/인덱스를 미리 생성 (완료 후 교체)
+        interval: 확인 주기 (초)
+    """
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = threading.Thread(target=_watch, args=(prepare, interval), name='data-watcher', daemon=True)
+            _watcher.start()
+        return _watcher
@@ -0,0 +1,121 @@
+"""
+앱 시작(콜드 스타트) 유틸리티
+
+배포/재시작 직후 첫 화면이 테이블 로드를 기다리지 않도록
+- 무거운 모듈은 처음 필요할 때 import (lazy_import)
+- parquet 메타데이터만으로 행 수/시즌 범위 조회 (데이터 페이지는 읽지 않음)
+- 테이블 로드는 프로세스당 한 번 백그라운드 스레드에서 동시에 실행해 캐시를 데움
+- 단계별 소요 시간은 처음 한 번만 기록해 get_startup_report()로 확인
+"""
+
+import importlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+# 단계별 소요 시간 {(단계, 항목): 초}
+_timings = {}
+_timings_lock = threading.Lock()
+
+# 단계 이름
+IMPORT = 'import'
+WARMUP = 'warmup'
+RELOAD = 'reload'
+RENDER = 'render'
+
+
+def record_timing(stage: str, name: str, seconds: float):
+    """소요 시간 기록 (같은 항목은 처음 값 유지)"""
+    with _timings_lock:
+        _timings.setdefault((stage, name), seconds)
+
+
+@contextmanager
+def timed(stage: str, name: str):
+    """with 블록 소요 시간 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(stage, name, time.perf_counter() - start)
+
+
+def lazy_import(module_name: str):
+    """모듈을 처음 필요할 때 import (처음 import한 시간 기록)"""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    with timed(IMPORT, module_name):
+        return importlib.import_module(module_name)
+
+
+def get_startup_report():
+    """단계별 소요 시간 [{'stage', 'name', 'ms'}] (기록 순서)"""
+    with _timings_lock:
+        items = list(_timings.items())
+    return [{'stage': stage, 'name': name, 'ms': round(seconds * 1000, 1)} for (stage, name), seconds in items]
+
+
+def read_parquet_summary(path, season_col: str = 'season') -> dict:
+    """
+    parquet 메타데이터(footer)만으로 행 수와 시즌 범위 조회
+
+    Returns:
+        {'rows': 행 수, 'season_min': 최소 시즌, 'season_max': 최대 시즌}
+        (시즌 컬럼 통계가 없으면 시즌 값은 None)
+    """
+    pq = lazy_import('pyarrow.parquet')
+    metadata = pq.ParquetFile(path).metadata
+    summary = {'rows': metadata.num_rows, 'season_min': None, 'season_max': None}
+
+    names = metadata.schema.names
+    if season_col not in names:
+        return summary
+    column = names.index(season_col)
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is None or not stats.has_min_max:
+            return {**summary, 'season_min': None, 'season_max': None}
+        low, high = int(stats.min), int(stats.max)
+        summary['season_min'] = low if summary['season_min'] is None else min(summary['season_min'], low)
+        summary['season_max'] = high if summary['season_max'] is None else max(summary['season_max'], high)
+    return summary
+
+
+def run_concurrently(tasks: dict, stage: str = WARMUP):
+    """작업들을 동시에 실행하고 각각의 소요 시간 기록 (실패한 작업이 있으면 첫 예외를 다시 발생)"""
+    def run(name, task):
+        with timed(stage, name):
+            task()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix=stage) as pool:
+        futures = [pool.submit(run, name, task) for name, task in tasks.items()]
+        errors = [future.exception() for future in futures]
+    record_timing(stage, 'total', time.perf_counter() - start)
+
+    for error in errors:
+        if error is not None:
+            raise error
+
+
+def _run_warmup(tasks: dict):
+    try:
+        run_concurrently(tasks)
+    except Exception:
+        # 예열 실패는 무시 (페이지에서 다시 로드하며 오류 표시)
+        pass
+
+
+def start_warmup(tasks: dict) -> threading.Thread:
+    """
+    백그라운드 캐시 예열 스레드 시작
+
+    Args:
+        tasks: {테이블 이름: 로드 함수} - 캐시된 로더를 호출해 캐시를 채움
+    """
+    thread = threading.Thread(target=_run_warmup, args=(tasks,), name='cache-warmup', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,73 @@
+"""
+사용자 가중치 편집 (Streamlit)
+
+사이드바에서 카테고리(OVR) 가중치와 카테고리별 세부 지표 가중치를 조정
+- 조정한 가중치는 session_state에 보관해 리포트 페이지와 리더보드가 같이 사용
+- 기본 가중치와 같으면 저장하지 않음 (parquet 등급 그대로 표시)
+"""
+
+import streamlit as st
+
+from utils.regrade import RegradeEngine
+
+
+def _widget_key(key: str, *parts) -> str:
+    return "_".join((key,) + parts)
+
+
+def get_custom_weights(key: str):
+    """저장된 사용자 가중치 (metric_weights, category_weights), 없으면 None"""
+    return st.session_state.get(_widget_key(key, "weights"))
+
+
+def _reset(engine: RegradeEngine, key: str):
+    """기본값 복원 콜백 (슬라이더 상태와 저장된 가중치 삭제)"""
+    st.session_state.pop(_widget_key(key, "weights"), None)
+    for category, metrics in engine.default_metric_weights.items():
+        st.session_state.pop(_widget_key(key, "category", category), None)
+        for metric in metrics:
+            st.session_state.pop(_widget_key(key, "metric", category, metric), None)
+
+
+def render_weight_editor(engine: RegradeEngine, key: str):
+    """
+    사이드바 가중치 편집기
+
+    Returns:
+        사용자 가중치 (metric_weights, category_weights), 기본 가중치면 None
+    """
+    stored = get_custom_weights(key)
+    metric_weights, category_weights = stored or (engine.default_metric_weights, engine.default_category_weights)
+    metric_weights = {category: dict(metrics) for category, metrics in metric_weights.items()}
+    category_weights = dict(category_weights)
+
+    with st.sidebar.expander("⚖️ 가중치 조정", expanded=stored is not None):
+        st.caption("OVR 카테고리 가중치")
+        for category, name in engine.category_names.items():
+            category_weights[category] = st.slider(
+                name, 0.0, 3.0, float(category_weights.get(category, 1.0)), 0.1,
+                key=_widget_key(key, "category", category)
+            )
+
+        category = st.selectbox(
+            "세부 지표 가중치",
+            list(engine.category_names),
+            format_func=engine.category_names.get,
+            key=_widget_key(key, "edit_category")
+        )
+        for metric, weight in engine.default_metric_weights[category].items():
+            metric_weights[category][metric] = st.slider(
+                engine.metric_names.get(metric, metric), 0.0, 1.0,
+                float(metric_weights[category].get(metric, weight)), 0.01,
+                key=_widget_key(key, "metric", category, metric)
+            )
+
+        st.button("기본값으로", on_click=_reset, args=(engine, key), key=_widget_key(key, "reset"))
+
+    if engine.is_default(metric_weights, category_weights):
+        st.session_state.pop(_widget_key(key, "weights"), None)
+        return None
+
+    custom = (metric_weights, category_weights)
+    st.session_state[_widget_key(key, "weights")] = custom
+    return custom